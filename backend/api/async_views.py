@@ -0,0 +1,195 @@
+import asyncio
+import json
+import time
+
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from asgiref.sync import sync_to_async
+from rest_framework import exceptions, status
+from rest_framework.parsers import JSONParser
+from rest_framework.request import Request
+
+from .authentication import CachedJWTAuthentication
+from .cache import todo_list_cache
+from .events import todo_events
+from .models import Todo
+from .pagination import TodoCursorPagination
+from .serializers import TodoSerializer, UserSerializer
+from .throttling import LoginIPThrottle, LoginUsernameThrottle
+
+# Native async counterparts of RegisterView and TodoViewSet for ASGI servers. They
+# speak the same JSON as the DRF views, except that the list is paged with an
+# ?after=<id> keyset cursor instead of DRF's opaque one.
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class AsyncAPIView(View):
+    authentication_required = True
+    throttle_classes = []
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            if self.authentication_required:
+                authenticator = CachedJWTAuthentication()
+                result = await authenticator.aauthenticate(request)
+                if result is None:
+                    raise exceptions.NotAuthenticated()
+                request.user, request.auth = result
+            # the throttle counters live in the cache, whose backends are sync-only
+            await sync_to_async(self.check_throttles)(request)
+            return await super().dispatch(request, *args, **kwargs)
+        except exceptions.APIException as exc:
+            response = JsonResponse(
+                exc.detail if isinstance(exc.detail, (dict, list)) else {'detail': exc.detail},
+                status=exc.status_code, safe=False,
+            )
+            if exc.status_code == status.HTTP_401_UNAUTHORIZED:
+                response.headers['WWW-Authenticate'] = CachedJWTAuthentication().authenticate_header(request)
+            if isinstance(exc, exceptions.Throttled) and exc.wait is not None:
+                response.headers['Retry-After'] = str(int(exc.wait))
+            return response
+
+    def check_throttles(self, request):
+        # the counters live in the cache, no database or hashing work happens before this
+        if not self.throttle_classes:
+            return
+        request.body  # keep the body readable after the DRF request below has parsed it
+        drf_request = Request(request, parsers=[JSONParser()])
+        for throttle in (throttle_class() for throttle_class in self.throttle_classes):
+            if not throttle.allow_request(drf_request, self):
+                raise exceptions.Throttled(throttle.wait())
+
+    def get_data(self, request):
+        try:
+            return json.loads(request.body or b'{}')
+        except ValueError as exc:
+            raise exceptions.ParseError(f'JSON parse error - {exc}')
+
+    async def get_todo(self, request, pk):
+        try:
+            return await Todo.objects.aget(pk=pk, user_id=request.user.id)
+        except Todo.DoesNotExist:
+            raise exceptions.NotFound()
+
+
+class AsyncRegisterView(AsyncAPIView):
+    authentication_required = False
+    throttle_classes = [LoginIPThrottle, LoginUsernameThrottle]
+
+    async def post(self, request):
+        serializer = UserSerializer(data=self.get_data(request))
+        # the username uniqueness validator runs a query, which is sync-only code
+        if not await sync_to_async(serializer.is_valid)():
+            raise exceptions.ValidationError(serializer.errors)
+
+        # acreate_user hashes the password on the event loop, stalling every other
+        # request and stream of the worker for the length of a full hash
+        user = await sync_to_async(serializer.save)()
+        return JsonResponse(UserSerializer(user).data, status=status.HTTP_201_CREATED)
+
+
+class AsyncTodoListView(AsyncAPIView):
+    async def get(self, request):
+        try:
+            after = int(request.GET.get('after', 0))
+            page_size = int(request.GET.get('page_size', TodoCursorPagination.page_size))
+        except ValueError:
+            raise exceptions.ValidationError({'detail': 'after and page_size must be integers'})
+        page_size = max(1, min(page_size, TodoCursorPagination.max_page_size))
+
+        queryset = Todo.objects.filter(user_id=request.user.id, id__gt=after).order_by('id')
+        todos = [todo async for todo in queryset[:page_size + 1]]
+
+        next_url = None
+        if len(todos) > page_size:
+            todos = todos[:page_size]
+            query = request.GET.copy()
+            query['after'] = todos[-1].id
+            next_url = request.build_absolute_uri(f'{request.path}?{query.urlencode()}')
+
+        return JsonResponse({'next': next_url, 'results': TodoSerializer(todos, many=True).data})
+
+    async def post(self, request):
+        serializer = TodoSerializer(data=self.get_data(request))
+        serializer.is_valid(raise_exception=True)
+
+        todo = await Todo.objects.acreate(user_id=request.user.id, **serializer.validated_data)
+        await todo_list_cache.ainvalidate(request.user.id)
+        data = TodoSerializer(todo).data
+        todo_events.publish(request.user.id, 'created', data)
+        return JsonResponse(data, status=status.HTTP_201_CREATED)
+
+
+class AsyncTodoDetailView(AsyncAPIView):
+    async def get(self, request, pk):
+        todo = await self.get_todo(request, pk)
+        return JsonResponse(TodoSerializer(todo).data)
+
+    async def put(self, request, pk, partial=False):
+        todo = await self.get_todo(request, pk)
+        serializer = TodoSerializer(todo, data=self.get_data(request), partial=partial)
+        serializer.is_valid(raise_exception=True)
+
+        for name, value in serializer.validated_data.items():
+            setattr(todo, name, value)
+        await todo.asave(update_fields=list(serializer.validated_data) or None)
+        await todo_list_cache.ainvalidate(request.user.id)
+        data = TodoSerializer(todo).data
+        todo_events.publish(request.user.id, 'updated', data)
+        return JsonResponse(data)
+
+    async def patch(self, request, pk):
+        return await self.put(request, pk, partial=True)
+
+    async def delete(self, request, pk):
+        todo = await self.get_todo(request, pk)
+        await todo.adelete()
+        await todo_list_cache.ainvalidate(request.user.id)
+        todo_events.publish(request.user.id, 'deleted', {'id': pk})
+        return HttpResponse(status=status.HTTP_204_NO_CONTENT)
+
+
+class AsyncTodoEventsView(AsyncAPIView):
+    # text/event-stream of the user's created/updated/deleted todos; a client that
+    # reconnects with Last-Event-ID gets what it missed, or a reset to refetch the list.
+    # The token is only checked on connect, so the stream ends with an `expired` event
+    # when it runs out and the client reconnects with a fresh one.
+    keepalive = 15
+    retry_ms = 3000
+
+    async def get(self, request):
+        # a WSGI server would hold a whole worker thread for every open stream
+        if not isinstance(request, ASGIRequest):
+            return JsonResponse({'detail': 'The event stream is only served over ASGI.'},
+                                status=status.HTTP_501_NOT_IMPLEMENTED)
+
+        last_event_id = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+        response = StreamingHttpResponse(
+            self.stream(request.user.id, last_event_id, request.auth['exp']),
+            content_type='text/event-stream',
+        )
+        response.headers['Cache-Control'] = 'no-cache'
+        response.headers['X-Accel-Buffering'] = 'no'
+        return response
+
+    async def stream(self, user_id, last_event_id, expires_at):
+        subscription = todo_events.subscribe(user_id, last_event_id)
+        try:
+            yield f'retry: {self.retry_ms}\n\n'.encode()
+            while True:
+                remaining = expires_at - time.time()
+                if remaining <= 0:
+                    yield b'event: expired\ndata: {}\n\n'
+                    return
+                try:
+                    event = await asyncio.wait_for(subscription.get(), min(self.keepalive, remaining))
+                except asyncio.TimeoutError:
+                    if time.time() < expires_at:
+                        yield b': keepalive\n\n'
+                else:
+                    yield event.payload
+        finally:
+            todo_events.unsubscribe(subscription)
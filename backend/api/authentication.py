@@ -0,0 +1,107 @@
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.models import TokenUser as BaseTokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+
+class TokenUser(BaseTokenUser):
+    """
+    User built from the claims of a validated access token, without touching the database.
+    """
+
+    @cached_property
+    def id(self):
+        # simplejwt stores the claim as a string, the todo queries want the integer key
+        return int(self.token[api_settings.USER_ID_CLAIM])
+
+    @cached_property
+    def pk(self):
+        return self.id
+
+
+class TTLCache:
+    """
+    Small thread-safe in-process mapping whose entries expire after ``ttl`` seconds.
+    """
+
+    def __init__(self, ttl, max_size=10_000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        entry = self._data.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return default
+        return entry[1]
+
+    def set(self, key, value):
+        with self._lock:
+            if len(self._data) >= self.max_size:
+                self._evict()
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def _evict(self):
+        now = time.monotonic()
+        for key in [key for key, (expires, _) in self._data.items() if expires < now]:
+            del self._data[key]
+        # still full of live entries: drop the oldest insertions
+        while len(self._data) >= self.max_size:
+            del self._data[next(iter(self._data))]
+
+
+active_users = TTLCache(ttl=getattr(settings, 'JWT_USER_ACTIVE_CACHE_TTL', 60))
+
+
+class CachedJWTAuthentication(JWTStatelessUserAuthentication):
+    """
+    Authenticates from the token claims alone instead of loading the ``User`` row on
+    every request. When ``JWT_USER_ACTIVE_CACHE_TTL`` is positive the user's
+    ``is_active`` flag is re-read at most once per TTL, so deactivating or deleting a
+    user locks them out within that bound; with ``0`` the check is skipped entirely.
+    """
+
+    def get_user(self, validated_token):
+        user = super().get_user(validated_token)
+
+        if active_users.ttl > 0 and not self.is_active(user.id):
+            raise AuthenticationFailed('User is inactive', code='user_inactive')
+        return user
+
+    def is_active(self, user_id):
+        active = active_users.get(user_id)
+        if active is None:
+            active = User.objects.filter(pk=user_id, is_active=True).exists()
+            active_users.set(user_id, active)
+        return active
+
+    async def aauthenticate(self, request):
+        # same as authenticate(), for views running on the event loop
+        header = self.get_header(request)
+        raw_token = self.get_raw_token(header) if header is not None else None
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        user = super().get_user(validated_token)
+        if active_users.ttl > 0 and not await self.ais_active(user.id):
+            raise AuthenticationFailed('User is inactive', code='user_inactive')
+        return user, validated_token
+
+    async def ais_active(self, user_id):
+        active = active_users.get(user_id)
+        if active is None:
+            active = await User.objects.filter(pk=user_id, is_active=True).aexists()
+            active_users.set(user_id, active)
+        return active
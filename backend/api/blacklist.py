@@ -0,0 +1,120 @@
+import hashlib
+import math
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import RevokedToken
+
+
+class BloomFilter:
+    """
+    Set membership with no false negatives and about ``error_rate`` false positives
+    while it holds at most ``capacity`` keys.
+    """
+
+    def __init__(self, capacity, error_rate=0.001):
+        self.capacity = max(capacity, 1)
+        self.size = max(64, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def positions(self, key):
+        # double hashing over one 128-bit digest
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1, h2 = int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, key):
+        # count distinct keys only, syncs add the same ones again
+        positions = self.positions(key)
+        if all(self.bits[position >> 3] & (1 << (position & 7)) for position in positions):
+            return
+        for position in positions:
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self.positions(key))
+
+
+class TokenBlacklist:
+    """
+    Revoked refresh tokens, stored as ``RevokedToken`` rows and fronted by an
+    in-process Bloom filter of their jtis, so checking a token that was never revoked
+    (nearly every check) runs no query.
+
+    The filter picks up rows revoked by other processes every ``sync_interval``
+    seconds, and is rebuilt from the unexpired rows every ``rebuild_interval``
+    seconds or once it outgrows its capacity. A token revoked elsewhere may therefore
+    pass ``is_revoked`` for up to ``sync_interval`` seconds; ``revoke`` itself is
+    exact, so a refresh token can never be rotated twice.
+    """
+
+    # rows committed late (a transaction still open at the last sync) are picked up
+    # by looking this far back
+    sync_overlap = timedelta(seconds=30)
+
+    def __init__(self, sync_interval=5, rebuild_interval=3600, error_rate=0.001):
+        self.sync_interval = sync_interval
+        self.rebuild_interval = rebuild_interval
+        self.error_rate = error_rate
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self.lock:
+            self.bloom = None
+            self.built_at = self.synced_at = -math.inf
+            self.synced_until = None
+
+    def revoke(self, jti, expires_at):
+        # False when the jti was revoked already
+        try:
+            with transaction.atomic():
+                RevokedToken.objects.create(jti=jti, expires_at=expires_at)
+        except IntegrityError:
+            return False
+        with self.lock:
+            if self.bloom is not None:
+                self.bloom.add(jti)
+        return True
+
+    def is_revoked(self, jti):
+        self.sync()
+        if jti not in self.bloom:
+            return False
+        return RevokedToken.objects.filter(jti=jti).exists()
+
+    def sync(self):
+        now = time.monotonic()
+        if now - self.synced_at < self.sync_interval:
+            return
+
+        with self.lock:
+            if self.bloom is None or now - self.built_at >= self.rebuild_interval \
+                    or self.bloom.count > self.bloom.capacity:
+                self.rebuild(now)
+            else:
+                since = self.synced_until - self.sync_overlap
+                self.synced_until = timezone.now()
+                for jti in RevokedToken.objects.filter(revoked_at__gte=since).values_list('jti', flat=True):
+                    self.bloom.add(jti)
+            self.synced_at = now
+
+    def rebuild(self, now):
+        self.synced_until = timezone.now()
+        jtis = list(RevokedToken.objects.filter(expires_at__gt=self.synced_until).values_list('jti', flat=True))
+        # room to grow until the next rebuild
+        bloom = BloomFilter(max(2 * len(jtis), 1024), self.error_rate)
+        for jti in jtis:
+            bloom.add(jti)
+        self.bloom, self.built_at = bloom, now
+
+
+token_blacklist = TokenBlacklist(sync_interval=getattr(settings, 'JWT_BLACKLIST_SYNC_INTERVAL', 5))
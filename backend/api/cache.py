@@ -0,0 +1,69 @@
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+class TodoListCache:
+    """
+    Rendered todo list pages, one cache entry per user holding its pages by ETag.
+
+    The ETag already encodes the user's ``TodoVersion``, so a page rendered before a
+    write can never be served after it; ``invalidate`` drops the user's entry eagerly
+    so stale pages do not occupy the cache. Eviction across users is left to the
+    backend configured under ``TODO_LIST_CACHE_ALIAS`` (LRU for the default
+    local-memory one), pages per user are capped at ``TODO_LIST_CACHE_PAGES_PER_USER``.
+
+    Hits and misses are counted with ``incr`` in the same cache, so with a shared
+    backend they add up across worker processes; api/metrics/ publishes them.
+    """
+
+    def __init__(self, alias, pages_per_user):
+        self.alias = alias
+        self.pages_per_user = pages_per_user
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def key(self, user_id):
+        return f'todo-list:{user_id}'
+
+    def get(self, user_id, etag):
+        pages = self.cache.get(self.key(user_id))
+        content = pages.get(etag) if pages else None
+        self.count('misses' if content is None else 'hits')
+        return content
+
+    def count(self, name):
+        key = f'todo-list-stats:{name}'
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            # first count, or the counter was evicted: start it, add() keeps a racing one
+            self.cache.add(key, 0, timeout=None)
+            self.cache.incr(key)
+
+    def set(self, user_id, etag, content):
+        pages = self.cache.get(self.key(user_id)) or OrderedDict()
+        pages[etag] = content
+        pages.move_to_end(etag)
+        while len(pages) > self.pages_per_user:
+            pages.popitem(last=False)
+        self.cache.set(self.key(user_id), pages)
+
+    def invalidate(self, user_id):
+        self.cache.delete(self.key(user_id))
+
+    async def ainvalidate(self, user_id):
+        await self.cache.adelete(self.key(user_id))
+
+    def stats(self):
+        counts = self.cache.get_many(['todo-list-stats:hits', 'todo-list-stats:misses'])
+        return {name: counts.get(f'todo-list-stats:{name}', 0) for name in ('hits', 'misses')}
+
+
+todo_list_cache = TodoListCache(
+    alias=getattr(settings, 'TODO_LIST_CACHE_ALIAS', 'todos'),
+    pages_per_user=getattr(settings, 'TODO_LIST_CACHE_PAGES_PER_USER', 16),
+)
@@ -0,0 +1,164 @@
+import asyncio
+import json
+import threading
+import uuid
+from collections import OrderedDict, deque, namedtuple
+
+from django.conf import settings
+
+# One event of a user's change feed. ``payload`` is the ready-to-send SSE frame, so
+# it is encoded once however many streams are subscribed.
+TodoEvent = namedtuple('TodoEvent', 'id seq type payload')
+
+
+def encode_event(event_id, event_type, data):
+    frame = f'id: {event_id}\nevent: {event_type}\ndata: {json.dumps(data, separators=(",", ":"))}\n\n'
+    return frame.encode()
+
+
+class Channel:
+    def __init__(self, history_size):
+        self.epoch = uuid.uuid4().hex[:8]
+        self.seq = 0
+        self.history = deque(maxlen=history_size)
+        self.subscribers = set()
+
+
+class Subscription:
+    """
+    One open event stream. Events are handed over from whichever thread published
+    them to the stream's event loop. A stream that falls ``queue_size`` events behind
+    stops receiving them and gets a single ``reset`` instead once it catches up.
+    """
+
+    def __init__(self, broker, user_id, loop, queue_size):
+        self.broker = broker
+        self.user_id = user_id
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = None
+
+    def put(self, event):
+        try:
+            self.loop.call_soon_threadsafe(self.put_nowait, event)
+        except RuntimeError:
+            # the stream's loop is gone, unsubscribe() is on its way
+            pass
+
+    def put_nowait(self, event):
+        if self.dropped is not None or self.queue.full():
+            self.dropped = event
+        else:
+            self.queue.put_nowait(event)
+
+    async def get(self):
+        if self.dropped is not None and self.queue.empty():
+            event, self.dropped = self.broker.reset_event(self.dropped), None
+            return event
+        return await self.queue.get()
+
+
+class TodoEventBroker:
+    """
+    In-process pub/sub of todo changes, one channel per user. Each channel numbers its
+    events and keeps the last ``history_size`` of them, so a reconnecting stream can
+    replay what it missed from its Last-Event-ID. Ids carry a random epoch per
+    channel: an id from before a restart or an eviction, or one older than the
+    history, gets a ``reset`` event telling the client to refetch the list.
+
+    Events only reach streams served by the same process. With several workers, put
+    a shared broker (Redis pub/sub, Postgres LISTEN/NOTIFY) behind the same interface.
+    """
+
+    def __init__(self, history_size=1000, queue_size=1000, max_users=10_000):
+        self.history_size = history_size
+        self.queue_size = queue_size
+        self.max_users = max_users
+        self.lock = threading.Lock()
+        self.channels = OrderedDict()
+
+    def channel(self, user_id):
+        channel = self.channels.get(user_id)
+        if channel is None:
+            channel = self.channels[user_id] = Channel(self.history_size)
+            self.evict()
+        self.channels.move_to_end(user_id)
+        return channel
+
+    def evict(self):
+        # least recently used first, never a channel somebody is listening to
+        for user_id in list(self.channels):
+            if len(self.channels) <= self.max_users:
+                break
+            if not self.channels[user_id].subscribers:
+                del self.channels[user_id]
+
+    def reset_event(self, last):
+        # carries the id of the newest event, the refetched list already includes it
+        return TodoEvent(last.id, last.seq, 'reset', encode_event(last.id, 'reset', {}))
+
+    def latest(self, channel):
+        event_id = f'{channel.epoch}-{channel.seq}'
+        return TodoEvent(event_id, channel.seq, None, None)
+
+    def publish(self, user_id, event_type, data):
+        with self.lock:
+            channel = self.channel(user_id)
+            channel.seq += 1
+            event_id = f'{channel.epoch}-{channel.seq}'
+            event = TodoEvent(event_id, channel.seq, event_type, encode_event(event_id, event_type, data))
+            channel.history.append(event)
+            subscribers = list(channel.subscribers)
+
+        for subscription in subscribers:
+            subscription.put(event)
+        return event
+
+    def publish_many(self, user_id, events):
+        for event_type, data in events:
+            self.publish(user_id, event_type, data)
+
+    def replay(self, channel, last_event_id):
+        if not last_event_id:
+            return []
+
+        epoch, _, seq = last_event_id.partition('-')
+        if epoch != channel.epoch or not seq.isdigit() or int(seq) > channel.seq:
+            return [self.reset_event(self.latest(channel))]
+
+        seq = int(seq)
+        if seq < channel.seq - len(channel.history):
+            return [self.reset_event(self.latest(channel))]
+        return [event for event in channel.history if event.seq > seq]
+
+    def subscribe(self, user_id, last_event_id=None):
+        """
+        Opens a stream for ``user_id`` on the running event loop, with the events
+        after ``last_event_id`` already queued.
+        """
+        subscription = Subscription(self, user_id, asyncio.get_running_loop(), self.queue_size)
+        with self.lock:
+            channel = self.channel(user_id)
+            backlog = self.replay(channel, last_event_id)
+            if len(backlog) > self.queue_size:
+                backlog = [self.reset_event(self.latest(channel))]
+            for event in backlog:
+                subscription.queue.put_nowait(event)
+            channel.subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            channel = self.channels.get(subscription.user_id)
+            if channel is not None:
+                channel.subscribers.discard(subscription)
+
+    def clear(self):
+        with self.lock:
+            self.channels.clear()
+
+
+todo_events = TodoEventBroker(
+    history_size=getattr(settings, 'TODO_EVENTS_HISTORY_SIZE', 1000),
+    queue_size=getattr(settings, 'TODO_EVENTS_QUEUE_SIZE', 1000),
+)
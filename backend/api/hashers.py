@@ -0,0 +1,17 @@
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, ScryptPasswordHasher
+
+# Same algorithm names as Django's hashers, so hashes made with other parameters still
+# verify and are re-encoded with these on the user's next login.
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+    work_factor = getattr(settings, 'SCRYPT_WORK_FACTOR', 2**14)
+    block_size = getattr(settings, 'SCRYPT_BLOCK_SIZE', 8)
+    parallelism = getattr(settings, 'SCRYPT_PARALLELISM', 1)
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    time_cost = getattr(settings, 'ARGON2_TIME_COST', 2)
+    memory_cost = getattr(settings, 'ARGON2_MEMORY_COST', 64 * 1024)
+    parallelism = getattr(settings, 'ARGON2_PARALLELISM', 1)
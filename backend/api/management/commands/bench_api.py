@@ -0,0 +1,291 @@
+import io
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connection
+from django.test.utils import override_settings
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from api.models import Todo
+
+OPERATIONS = ('list', 'retrieve', 'create', 'patch', 'delete', 'token', 'refresh', 'register')
+
+
+def parse_mix(value):
+    # "list=50,create=10,..." -> {'list': 50, 'create': 10, ...}
+    mix = {}
+    for part in value.split(','):
+        name, _, weight = part.partition('=')
+        if name not in OPERATIONS or not weight.isdigit():
+            raise ValueError(f'Expected operation=weight with operations {", ".join(OPERATIONS)}, got {part!r}')
+        mix[name] = int(weight)
+    return mix
+
+
+class Command(BaseCommand):
+    help = (
+        'Seeds users and todos and drives backend.wsgi.application in-process with a '
+        'weighted mix of register, token obtain/refresh, list, retrieve, create, patch '
+        'and delete requests at each concurrency level. Prints throughput and latency '
+        'percentiles per operation as JSON, tagged with the git commit, so runs can be '
+        'compared across commits. By default it runs against a fresh SQLite file.'
+    )
+
+    username_prefix = 'bench-api-'
+    password = 'bench-password'
+    default_mix = 'list=40,retrieve=15,create=15,patch=15,delete=8,token=3,refresh=3,register=1'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=20)
+        parser.add_argument('--todos-per-user', type=int, default=200)
+        parser.add_argument('--requests', type=int, default=2000, help='Requests per concurrency level.')
+        parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32])
+        parser.add_argument('--mix', default=self.default_mix, help='Weights, e.g. list=50,create=50.')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--throttle', action='store_true', help='Keep the login throttles on.')
+        parser.add_argument('--in-place', action='store_true',
+                            help='Use the configured database instead of a fresh SQLite file.')
+        parser.add_argument('--output', help='Also write the JSON report to this file.')
+
+    def handle(self, *args, **options):
+        try:
+            mix = parse_mix(options['mix'])
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        if options['in_place']:
+            report = self.run(mix, options)
+        else:
+            report = self.run_fresh(options)
+
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as file:
+                file.write(output + '\n')
+        self.stdout.write(output)
+
+    def run_fresh(self, options):
+        # the same command in a child process, against a migrated database of its own
+        argv = [
+            '--users', str(options['users']), '--todos-per-user', str(options['todos_per_user']),
+            '--requests', str(options['requests']), '--concurrency', *map(str, options['concurrency']),
+            '--mix', options['mix'], '--seed', str(options['seed']),
+            *(['--throttle'] if options['throttle'] else []),
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            env = {**os.environ, 'DJANGO_DB_PROFILE': 'sqlite', 'SQLITE_PATH': os.path.join(directory, 'bench.sqlite3')}
+            manage = [sys.executable, str(settings.BASE_DIR / 'manage.py')]
+            subprocess.run([*manage, 'migrate', '-v0'], env=env, check=True)
+            result = subprocess.run(
+                [*manage, 'bench_api', '--in-place', *argv], env=env, stdout=subprocess.PIPE, text=True,
+            )
+        if result.returncode:
+            # the child has already reported why on stderr
+            raise CommandError(f'The benchmark run exited with status {result.returncode}.')
+        return json.loads(result.stdout)
+
+    def run(self, mix, options):
+        users = self.seed(options['users'], options['todos_per_user'])
+        report = {
+            'environment': self.environment(),
+            'users': options['users'],
+            'todos_per_user': options['todos_per_user'],
+            'requests': options['requests'],
+            'mix': mix,
+            'seed': options['seed'],
+            'throttle': options['throttle'],
+            'runs': [],
+        }
+        # every request comes from one address, so the login throttles are off by default
+        rest_framework = settings.REST_FRAMEWORK
+        if not options['throttle']:
+            rest_framework = {**rest_framework, 'DEFAULT_THROTTLE_RATES': {'login_ip': None, 'login_username': None}}
+        try:
+            with override_settings(DEBUG=False, ALLOWED_HOSTS=['testserver'], REST_FRAMEWORK=rest_framework):
+                for concurrency in options['concurrency']:
+                    result = self.drive(users, mix, options['requests'], concurrency, options['seed'])
+                    # every request carries valid credentials: a 401 means the run measured
+                    # the wrong path
+                    refused = {name: stats['statuses']['401'] for name, stats in result['operations'].items()
+                               if '401' in stats['statuses']}
+                    if refused:
+                        raise CommandError(f'Unexpected 401 responses at c={concurrency}: {refused}')
+                    report['runs'].append({'concurrency': concurrency, **result})
+                    self.stderr.write(f"c={concurrency}: {result['requests_per_second']} req/s")
+        finally:
+            User.objects.filter(username__startswith=self.username_prefix).delete()
+        return report
+
+    def environment(self):
+        try:
+            commit = subprocess.run(
+                ['git', 'rev-parse', 'HEAD'], cwd=settings.BASE_DIR, capture_output=True, text=True, check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+        return {
+            'commit': commit,
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            'db_profile': settings.DB_PROFILE,
+            'hasher': get_hasher().algorithm,
+        }
+
+    def seed(self, count, todos_per_user):
+        User.objects.filter(username__startswith=self.username_prefix).delete()
+        # one hash shared by every user: seeding should not take users * hash time
+        password = make_password(self.password)
+        User.objects.bulk_create(
+            User(username=f'{self.username_prefix}{i}', password=password) for i in range(count)
+        )
+        users = list(User.objects.filter(username__startswith=self.username_prefix).order_by('id'))
+        Todo.objects.bulk_create(
+            (Todo(user=user, title=f'todo {i}', completed=i % 3 == 0) for user in users for i in range(todos_per_user)),
+            batch_size=10_000,
+        )
+
+        todo_ids = {}
+        for user_id, todo_id in Todo.objects.filter(user__in=users).values_list('user_id', 'id'):
+            todo_ids.setdefault(user_id, []).append(todo_id)
+        return [
+            {
+                'username': user.username,
+                'access': f'Bearer {RefreshToken.for_user(user).access_token}',
+                'refresh': str(RefreshToken.for_user(user)),
+                'todos': todo_ids.get(user.id, []),
+                'lock': threading.Lock(),
+            }
+            for user in users
+        ]
+
+    def drive(self, users, mix, total, concurrency, seed):
+        from backend.wsgi import application
+
+        operations, weights = zip(*mix.items())
+        samples = {name: [] for name in operations}
+        statuses = {name: {} for name in operations}
+        registered = itertools.count()
+        results_lock = threading.Lock()
+
+        def request(method, path, token=None, body=None):
+            data = json.dumps(body).encode() if body is not None else b''
+            environ = {
+                'REQUEST_METHOD': method, 'PATH_INFO': path, 'QUERY_STRING': '',
+                'SERVER_NAME': 'testserver', 'SERVER_PORT': '80', 'HTTP_HOST': 'testserver',
+                'wsgi.url_scheme': 'http', 'wsgi.input': io.BytesIO(data), 'wsgi.errors': io.StringIO(),
+                'CONTENT_TYPE': 'application/json', 'CONTENT_LENGTH': str(len(data)),
+            }
+            if token:
+                environ['HTTP_AUTHORIZATION'] = token
+            status = []
+            body = b''.join(application(environ, lambda code, headers, exc_info=None: status.append(code)))
+            return int(status[0].split()[0]), body
+
+        def pick_todo(user, rng, remove=False):
+            with user['lock']:
+                if not user['todos']:
+                    return None
+                index = rng.randrange(len(user['todos']))
+                return user['todos'].pop(index) if remove else user['todos'][index]
+
+        def operation(name, user, rng):
+            if name == 'list':
+                return request('GET', reverse('todo-list'), user['access'])
+            if name == 'retrieve':
+                pk = pick_todo(user, rng)
+                return request('GET', reverse('todo-detail', args=[pk or 0]), user['access'])
+            if name == 'create':
+                status, body = request('POST', reverse('todo-list'), user['access'], {'title': 'bench todo'})
+                if status == 201:
+                    with user['lock']:
+                        user['todos'].append(json.loads(body)['id'])
+                return status, body
+            if name == 'patch':
+                pk = pick_todo(user, rng)
+                return request('PATCH', reverse('todo-detail', args=[pk or 0]), user['access'],
+                               {'completed': rng.random() < 0.5})
+            if name == 'delete':
+                pk = pick_todo(user, rng, remove=True)
+                return request('DELETE', reverse('todo-detail', args=[pk or 0]), user['access'])
+            if name == 'token':
+                return request('POST', reverse('token_obtain_pair'), body={
+                    'username': user['username'], 'password': self.password,
+                })
+            if name == 'refresh':
+                # refresh tokens rotate and a used one is refused, so each user's refreshes
+                # take turns and carry the latest token forward
+                with user['lock']:
+                    status, body = request('POST', reverse('token_refresh'), body={'refresh': user['refresh']})
+                    if status == 200:
+                        tokens = json.loads(body)
+                        user['refresh'] = tokens['refresh']
+                        user['access'] = f"Bearer {tokens['access']}"
+                return status, body
+            return request('POST', reverse('register'), body={
+                'username': f'{self.username_prefix}new-{seed}-{next(registered)}', 'password': self.password,
+            })
+
+        def worker(index, count):
+            rng = random.Random(seed * 1000 + index)
+            for _ in range(count):
+                name = rng.choices(operations, weights)[0]
+                user = rng.choice(users)
+                close_old_connections()
+                started = time.perf_counter()
+                status, _ = operation(name, user, rng)
+                elapsed = time.perf_counter() - started
+                with results_lock:
+                    samples[name].append(elapsed)
+                    statuses[name][status] = statuses[name].get(status, 0) + 1
+            connection.close()
+
+        share, extra = divmod(total, concurrency)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(worker, range(concurrency), [share + (i < extra) for i in range(concurrency)]))
+        elapsed = time.perf_counter() - started
+
+        all_samples = [sample for values in samples.values() for sample in values]
+        return {
+            'requests_per_second': round(len(all_samples) / elapsed, 1),
+            'latency': self.percentiles(all_samples),
+            'operations': {
+                name: {
+                    'count': len(samples[name]),
+                    'statuses': {str(code): n for code, n in sorted(statuses[name].items())},
+                    'latency': self.percentiles(samples[name]),
+                }
+                for name in operations
+            },
+        }
+
+    def percentiles(self, samples):
+        if not samples:
+            return None
+        samples = sorted(samples)
+
+        def at(fraction):
+            return round(samples[min(int(len(samples) * fraction), len(samples) - 1)] * 1000, 3)
+        return {
+            'p50_ms': round(statistics.median(samples) * 1000, 3),
+            'p90_ms': at(0.90),
+            'p99_ms': at(0.99),
+            'max_ms': round(samples[-1] * 1000, 3),
+        }
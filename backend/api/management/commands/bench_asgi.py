@@ -0,0 +1,144 @@
+import asyncio
+import io
+import json
+import statistics
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from api.authentication import active_users
+from api.cache import todo_list_cache
+from api.models import Todo
+
+
+class Command(BaseCommand):
+    help = (
+        'Drives the todo list through backend.wsgi.application (sync DRF view, one '
+        'thread per connection) and backend.asgi.application (async view, one task per '
+        'connection) in-process and reports throughput, latency and memory per connection.'
+    )
+
+    username = 'bench-asgi'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--todos', type=int, default=1000, help='Todos owned by the benchmark user.')
+        parser.add_argument('--requests', type=int, default=2000, help='Requests per run.')
+        parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32, 128])
+        parser.add_argument('--page-size', type=int, default=100)
+
+    def handle(self, *args, **options):
+        from backend.asgi import application as asgi_app
+        from backend.wsgi import application as wsgi_app
+
+        User.objects.filter(username=self.username).delete()
+        user = User.objects.create_user(username=self.username, password=None)
+        Todo.objects.bulk_create(Todo(user=user, title=f'todo {i}') for i in range(options['todos']))
+        token = f'Bearer {AccessToken.for_user(user)}'
+        query = f"page_size={options['page_size']}"
+
+        report = {'todos': options['todos'], 'requests': options['requests'], 'runs': []}
+        pages_per_user = todo_list_cache.pages_per_user
+        try:
+            # no query log, and the list page cache off so both paths do the same work
+            todo_list_cache.pages_per_user = 0
+            with override_settings(DEBUG=False, ALLOWED_HOSTS=['testserver']):
+                for concurrency in options['concurrency']:
+                    for name, run in (('wsgi', self.run_wsgi), ('asgi', self.run_asgi)):
+                        active_users.clear()
+                        path = reverse('todo-list' if name == 'wsgi' else 'async_todo_list')
+                        app = wsgi_app if name == 'wsgi' else asgi_app
+                        result = self.measure(run, app, path, query, token, options['requests'], concurrency)
+                        report['runs'].append({'server': name, 'concurrency': concurrency, **result})
+                        self.stderr.write(f"{name} c={concurrency}: {result['requests_per_second']} req/s")
+        finally:
+            todo_list_cache.pages_per_user = pages_per_user
+            user.delete()
+
+        self.stdout.write(json.dumps(report, indent=2))
+
+    def measure(self, run, app, path, query, token, total, concurrency):
+        started = time.perf_counter()
+        latencies = run(app, path, query, token, total, concurrency)
+        elapsed = time.perf_counter() - started
+
+        # tracing allocations slows everything down, so memory gets a pass of its own
+        # with one request per connection in flight
+        tracemalloc.start()
+        run(app, path, query, token, concurrency, concurrency)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        latencies.sort()
+        return {
+            'requests_per_second': round(total / elapsed, 1),
+            'p50_ms': round(statistics.median(latencies) * 1000, 3),
+            'p99_ms': round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 3),
+            'peak_python_memory_kib': peak // 1024,
+            'python_memory_per_connection_kib': round(peak / concurrency / 1024, 1),
+        }
+
+    def run_wsgi(self, app, path, query, token, total, concurrency):
+        def request(_):
+            environ = {
+                'REQUEST_METHOD': 'GET', 'PATH_INFO': path, 'QUERY_STRING': query,
+                'SERVER_NAME': 'testserver', 'SERVER_PORT': '80', 'HTTP_HOST': 'testserver',
+                'HTTP_AUTHORIZATION': token, 'wsgi.url_scheme': 'http',
+                'wsgi.input': io.BytesIO(), 'wsgi.errors': io.StringIO(),
+            }
+            started = time.perf_counter()
+            status = []
+            body = b''.join(app(environ, lambda code, headers, exc_info=None: status.append(code)))
+            assert status[0].startswith('200') and body, status
+            return time.perf_counter() - started
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            return list(pool.map(request, range(total)))
+
+    def run_asgi(self, app, path, query, token, total, concurrency):
+        async def request():
+            scope = {
+                'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1',
+                'method': 'GET', 'scheme': 'http', 'path': path, 'raw_path': path.encode(),
+                'query_string': query.encode(), 'root_path': '', 'server': ('testserver', 80),
+                'headers': [(b'host', b'testserver'), (b'authorization', token.encode())],
+            }
+            messages = []
+            sent = asyncio.Event()
+            requests = iter([{'type': 'http.request', 'body': b'', 'more_body': False}])
+
+            async def receive():
+                request = next(requests, None)
+                if request is None:
+                    await sent.wait()
+                    return {'type': 'http.disconnect'}
+                return request
+
+            async def send(message):
+                messages.append(message)
+                if message['type'] == 'http.response.body' and not message.get('more_body'):
+                    sent.set()
+
+            started = time.perf_counter()
+            await app(scope, receive, send)
+            assert messages[0]['status'] == 200, messages[0]
+            return time.perf_counter() - started
+
+        async def connection(count, latencies):
+            for _ in range(count):
+                latencies.append(await request())
+
+        async def main():
+            latencies = []
+            share, extra = divmod(total, concurrency)
+            await asyncio.gather(*(
+                connection(share + (i < extra), latencies) for i in range(concurrency)
+            ))
+            return latencies
+
+        return asyncio.run(main())
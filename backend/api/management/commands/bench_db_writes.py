@@ -0,0 +1,103 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, close_old_connections, connection
+
+from api.models import Todo
+
+
+class Command(BaseCommand):
+    help = (
+        'Concurrent Todo writes (create, then toggle) from a pool of threads, each '
+        'operation treated as one request. Reports throughput, latency and failed '
+        'writes for the active DJANGO_DB_PROFILE, or with --profiles for each given '
+        'profile in a fresh process and, for SQLite, a fresh database file.'
+    )
+
+    username_prefix = 'bench-writes-'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=16)
+        parser.add_argument('--operations', type=int, default=200, help='Writes per thread.')
+        parser.add_argument('--profiles', nargs='+', choices=sorted(settings.DATABASE_PROFILES))
+
+    def handle(self, *args, **options):
+        if options['profiles']:
+            report = {profile: self.run_profile(profile, options) for profile in options['profiles']}
+        else:
+            report = self.run(options['threads'], options['operations'])
+        self.stdout.write(json.dumps(report, indent=2))
+
+    def run_profile(self, profile, options):
+        with tempfile.TemporaryDirectory() as directory:
+            env = {
+                **os.environ,
+                'DJANGO_DB_PROFILE': profile,
+                'SQLITE_PATH': os.path.join(directory, 'bench.sqlite3'),
+            }
+            manage = [sys.executable, str(settings.BASE_DIR / 'manage.py')]
+            subprocess.run([*manage, 'migrate', '-v0'], env=env, check=True)
+            result = subprocess.run(
+                [*manage, 'bench_db_writes',
+                 '--threads', str(options['threads']), '--operations', str(options['operations'])],
+                env=env, check=True, capture_output=True, text=True,
+            )
+        self.stderr.write(f'{profile}: done')
+        return json.loads(result.stdout)
+
+    def run(self, threads, operations):
+        User.objects.filter(username__startswith=self.username_prefix).delete()
+        User.objects.bulk_create(User(username=f'{self.username_prefix}{i}', password='!') for i in range(threads))
+        user_ids = list(User.objects.filter(username__startswith=self.username_prefix).values_list('id', flat=True))
+        if len(user_ids) != threads:
+            raise CommandError('Could not create the benchmark users.')
+
+        latencies, errors, lock = [], [], threading.Lock()
+
+        def worker(user_id):
+            for i in range(operations):
+                # request boundaries: this is where CONN_MAX_AGE keeps or drops the connection
+                close_old_connections()
+                started = time.perf_counter()
+                try:
+                    todo = Todo.objects.create(user_id=user_id, title=f'write {i}')
+                    todo.completed = True
+                    todo.save(update_fields=['completed'])
+                except DatabaseError as exc:
+                    with lock:
+                        errors.append(str(exc))
+                else:
+                    with lock:
+                        latencies.append(time.perf_counter() - started)
+            close_old_connections()
+            connection.close()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(worker, user_ids))
+        elapsed = time.perf_counter() - started
+
+        User.objects.filter(id__in=user_ids).delete()
+        latencies.sort()
+        return {
+            'profile': settings.DB_PROFILE,
+            'vendor': connection.vendor,
+            'threads': threads,
+            'requests': threads * operations,
+            'succeeded': len(latencies),
+            'failed': len(errors),
+            'errors': sorted(set(errors))[:5],
+            'requests_per_second': round(len(latencies) / elapsed, 1),
+            'p50_ms': round(statistics.median(latencies) * 1000, 3) if latencies else None,
+            'p99_ms': round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 3) if latencies else None,
+        }
@@ -0,0 +1,117 @@
+import json
+import secrets
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from api.cache import todo_list_cache
+from api.models import Todo
+
+
+class Command(BaseCommand):
+    help = (
+        'Floods token/ with wrong-password logins from a pool of threads while a probe '
+        'thread keeps reading the todo list, once with the login throttles off and once '
+        'with them on. Reports 429s, CPU time and the probe latency for the active '
+        'PASSWORD_HASHER.'
+    )
+
+    username = 'bench-login-storm'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8)
+        parser.add_argument('--attempts', type=int, default=400, help='Login attempts in total.')
+
+    def handle(self, *args, **options):
+        # a fresh username and address per run, so the throttled run starts from empty
+        # counters without clearing a throttle store live servers may share
+        User.objects.filter(username__startswith=self.username).delete()
+        self.address = f'10.{secrets.randbelow(256)}.{secrets.randbelow(256)}.{secrets.randbelow(256)}'
+        user = User.objects.create_user(username=f'{self.username}-{secrets.token_hex(4)}',
+                                        password='correct horse battery')
+        Todo.objects.bulk_create(Todo(user=user, title=f'todo {i}') for i in range(100))
+        token = f'Bearer {AccessToken.for_user(user)}'
+
+        report = {
+            'hasher': get_hasher().algorithm,
+            'threads': options['threads'],
+            'attempts': options['attempts'],
+            'rates': settings.REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'],
+            'runs': {},
+        }
+        pages_per_user = todo_list_cache.pages_per_user
+        try:
+            # the probe should measure a real list request, not a cache hit
+            todo_list_cache.pages_per_user = 0
+            with override_settings(DEBUG=False, ALLOWED_HOSTS=['testserver']):
+                unthrottled = {**settings.REST_FRAMEWORK,
+                               'DEFAULT_THROTTLE_RATES': {'login_ip': None, 'login_username': None}}
+                for name in ('unthrottled', 'throttled'):
+                    rest_framework = unthrottled if name == 'unthrottled' else settings.REST_FRAMEWORK
+                    with override_settings(REST_FRAMEWORK=rest_framework):
+                        result = self.run(user.username, token, options['threads'], options['attempts'])
+                    report['runs'][name] = result
+                    self.stderr.write(f"{name}: {result['cpu_seconds']}s CPU, {result['throttled']} throttled")
+        finally:
+            todo_list_cache.pages_per_user = pages_per_user
+            user.delete()
+
+        self.stdout.write(json.dumps(report, indent=2))
+
+    def run(self, username, token, threads, attempts):
+        login_url, list_url = reverse('token_obtain_pair'), reverse('todo-list')
+        statuses, lock, done = {}, threading.Lock(), threading.Event()
+        probe_latencies = []
+
+        def login(i):
+            response = Client().post(
+                login_url, {'username': username, 'password': f'wrong {i}'},
+                content_type='application/json', REMOTE_ADDR=self.address,
+            )
+            with lock:
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            connection.close()
+
+        def probe():
+            client = Client(headers={'Authorization': token})
+            while not done.is_set():
+                started = time.perf_counter()
+                response = client.get(list_url)
+                assert response.status_code == 200, response.status_code
+                probe_latencies.append(time.perf_counter() - started)
+            connection.close()
+
+        prober = threading.Thread(target=probe)
+        cpu_started, started = time.process_time(), time.perf_counter()
+        prober.start()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(login, range(attempts)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        prober.join()
+        cpu = time.process_time() - cpu_started
+
+        probe_latencies.sort()
+        return {
+            'statuses': {str(code): count for code, count in sorted(statuses.items())},
+            'throttled': statuses.get(429, 0),
+            'seconds': round(elapsed, 3),
+            'cpu_seconds': round(cpu, 3),
+            'probe_requests': len(probe_latencies),
+            'probe_p50_ms': round(statistics.median(probe_latencies) * 1000, 3) if probe_latencies else None,
+            'probe_p99_ms': (
+                round(probe_latencies[max(int(len(probe_latencies) * 0.99) - 1, 0)] * 1000, 3)
+                if probe_latencies else None
+            ),
+        }
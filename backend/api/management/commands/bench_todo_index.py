@@ -0,0 +1,119 @@
+import json
+import random
+import statistics
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from api.models import Todo
+
+
+class Command(BaseCommand):
+    help = (
+        'Seeds the configured SQLite database with benchmark users and todos and records '
+        'the query plans and timings of the per-user todo listing before and after the '
+        '(user, completed, id) index.'
+    )
+
+    username_prefix = 'bench-index-'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=2_000_000, help='Todos to seed in total.')
+        parser.add_argument('--users', type=int, default=1000, help='Users the todos are spread over.')
+        parser.add_argument('--repeat', type=int, default=50, help='Executions per timed query.')
+        parser.add_argument('--page-size', type=int, default=100)
+        parser.add_argument('--skip-seed', action='store_true', help='Reuse rows from a previous run.')
+        parser.add_argument('--cleanup', action='store_true', help='Delete the benchmark rows afterwards.')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError('This benchmark inspects SQLite query plans only.')
+
+        if not options['skip_seed']:
+            self.seed(options['users'], options['rows'])
+
+        users = User.objects.filter(username__startswith=self.username_prefix)
+        user_id = users.order_by('?').values_list('id', flat=True).first()
+        if user_id is None:
+            raise CommandError('No benchmark users found, run without --skip-seed first.')
+
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE api_todo')
+
+        baseline_index = self.user_fk_index()
+        report = {
+            'rows': Todo.objects.count(),
+            'user_id': user_id,
+            'baseline_index': baseline_index,
+            'queries': {},
+        }
+        page = options['page_size'] + 1
+        querysets = {
+            'list': Todo.objects.filter(user_id=user_id).order_by('id')[:page],
+            'list_completed': Todo.objects.filter(user_id=user_id).with_completed(True).order_by('id')[:page],
+            'list_open_ids': Todo.objects.filter(user_id=user_id).with_completed(False)
+                                         .order_by('id').values_list('id', 'completed')[:page],
+        }
+        for name, queryset in querysets.items():
+            sql, params = queryset.query.sql_with_params()
+            before = sql.replace('FROM "api_todo"', f'FROM "api_todo" INDEXED BY "{baseline_index}"', 1)
+            report['queries'][name] = {
+                'before': self.measure(before, params, options['repeat']),
+                'after': self.measure(sql, params, options['repeat']),
+            }
+
+        if options['cleanup']:
+            users.delete()
+
+        self.stdout.write(json.dumps(report, indent=2))
+
+    def seed(self, user_count, row_count):
+        User.objects.filter(username__startswith=self.username_prefix).delete()
+        User.objects.bulk_create(
+            User(username=f'{self.username_prefix}{i}', password='!') for i in range(user_count)
+        )
+        user_ids = list(User.objects.filter(username__startswith=self.username_prefix)
+                                    .values_list('id', flat=True))
+
+        batch_size = 50_000
+        rng = random.Random(0)
+        started = time.perf_counter()
+        with transaction.atomic(), connection.cursor() as cursor:
+            for offset in range(0, row_count, batch_size):
+                cursor.executemany(
+                    'INSERT INTO api_todo (title, user_id, completed) VALUES (%s, %s, %s)',
+                    [
+                        (f'todo {i}', rng.choice(user_ids), rng.random() < 0.3)
+                        for i in range(offset, min(offset + batch_size, row_count))
+                    ],
+                )
+        self.stderr.write(f'Seeded {row_count} todos in {time.perf_counter() - started:.1f}s')
+
+    def user_fk_index(self):
+        # the single-column index Django creates for the user foreign key, i.e. the
+        # only index the listing could use before the composite one was added
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, Todo._meta.db_table)
+        for name, info in constraints.items():
+            if info['index'] and info['columns'] == ['user_id']:
+                return name
+        raise CommandError('Foreign key index on api_todo.user_id not found.')
+
+    def measure(self, sql, params, repeat):
+        timings = []
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            plan = [row[-1] for row in cursor.fetchall()]
+            for _ in range(repeat):
+                started = time.perf_counter()
+                cursor.execute(sql, params)
+                cursor.fetchall()
+                timings.append((time.perf_counter() - started) * 1000)
+        return {
+            'sql': sql,
+            'plan': plan,
+            'median_ms': round(statistics.median(timings), 4),
+            'max_ms': round(max(timings), 4),
+        }
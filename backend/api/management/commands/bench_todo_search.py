@@ -0,0 +1,84 @@
+import json
+import random
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+
+from api.models import Todo
+from api.search import search_terms, search_todo_ids
+
+WORDS = (
+    'buy milk bread call mom dentist book flight pay rent water plants fix bike clean '
+    'kitchen email report review draft send invoice walk dog pick up parcel renew passport'
+).split()
+
+
+class Command(BaseCommand):
+    help = (
+        'Times one page of ranked ?q= results from the full-text index against a '
+        'LIKE \'%term%\' scan of the same user\'s todos, for growing todo counts. '
+        'Titles are three common words and a tag out of 10k, so "tag42" is a selective '
+        'query and "pay inv" one that matches a few percent of all todos. Other users\' '
+        'todos are seeded first, so the timings show whether they are searched too.'
+    )
+
+    username = 'bench-search'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+        parser.add_argument('--other-users', type=int, default=10)
+        parser.add_argument('--other-todos', type=int, default=100_000,
+                            help='Todos per other user, with titles from the same words.')
+        parser.add_argument('--queries', nargs='+', default=['tag42', 'pay inv'])
+        parser.add_argument('--repeat', type=int, default=20, help='Timed runs, the median is reported.')
+
+    def handle(self, *args, **options):
+        rng = random.Random(0)
+        User.objects.filter(username__startswith=self.username).delete()
+        user = User.objects.create_user(username=self.username, password=None)
+        others = [User.objects.create_user(username=f'{self.username}-{i}', password=None)
+                  for i in range(options['other_users'])]
+        report = {'other_users': len(others), 'other_todos': options['other_todos'], 'runs': []}
+        seeded = 0
+        try:
+            for other in others:
+                self.seed(other, options['other_todos'], rng)
+            for size in sorted(options['sizes']):
+                self.seed(user, size - seeded, rng)
+                seeded = size
+                for query in options['queries']:
+                    report['runs'].append({
+                        'todos': size,
+                        'query': query,
+                        'matches': len(search_todo_ids(user.id, query, limit=size)),
+                        'index_ms': self.measure(lambda: search_todo_ids(user.id, query), options['repeat']),
+                        'like_ms': self.measure(lambda: self.like(user.id, query), options['repeat']),
+                    })
+                self.stderr.write(f'{size}: done')
+        finally:
+            User.objects.filter(username__startswith=self.username).delete()
+
+        self.stdout.write(json.dumps(report, indent=2))
+
+    def seed(self, user, count, rng):
+        Todo.objects.bulk_create(
+            (Todo(user=user, title=' '.join([*rng.sample(WORDS, 3), f'tag{rng.randrange(10_000)}']))
+             for _ in range(count)),
+            batch_size=10_000,
+        )
+
+    def like(self, user_id, query):
+        queryset = Todo.objects.filter(user_id=user_id)
+        for term in search_terms(query):
+            queryset = queryset.filter(title__icontains=term)
+        return list(queryset.order_by('id').values_list('id', flat=True)[:100])
+
+    def measure(self, search, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            search()
+            timings.append(time.perf_counter() - started)
+        timings.sort()
+        return round(timings[len(timings) // 2] * 1000, 3)
@@ -0,0 +1,71 @@
+import json
+import time
+import tracemalloc
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from api.models import Todo
+from api.serializers import TodoRowSerializer, TodoSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        'Renders a user\'s todos with TodoSerializer + JSONRenderer and with the '
+        'TodoRowSerializer fast path, checks the bytes are identical and reports the '
+        'time and peak traced allocations of each.'
+    )
+
+    username = 'bench-serializer'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--todos', type=int, default=100_000)
+        parser.add_argument('--repeat', type=int, default=5, help='Timed runs, the best one is reported.')
+        parser.add_argument('--fields', help='Comma-separated projection, e.g. id,completed.')
+
+    def handle(self, *args, **options):
+        fields = options['fields'].split(',') if options['fields'] else None
+        User.objects.filter(username=self.username).delete()
+        user = User.objects.create_user(username=self.username, password=None)
+        Todo.objects.bulk_create(
+            (Todo(user=user, title=f'todo number {i} ✓', completed=i % 3 == 0) for i in range(options['todos'])),
+            batch_size=10_000,
+        )
+        queryset = Todo.objects.filter(user=user).order_by('id')
+        fast = TodoRowSerializer(fields)
+
+        def drf():
+            data = TodoSerializer(queryset.iterator(chunk_size=2000), many=True, fields=fields).data
+            return JSONRenderer().render(data)
+
+        def rows():
+            return fast.render_rows(queryset.values_list(*fast.row_columns).iterator(chunk_size=2000)).encode()
+
+        try:
+            if drf() != rows():
+                raise CommandError('Fast path output differs from TodoSerializer + JSONRenderer.')
+            report = {'todos': options['todos'], 'fields': fast.fields}
+            for name, render in (('model_serializer', drf), ('row_serializer', rows)):
+                report[name] = self.measure(render, options['repeat'])
+        finally:
+            user.delete()
+
+        report['speedup'] = round(report['model_serializer']['best_ms'] / report['row_serializer']['best_ms'], 2)
+        report['allocation_ratio'] = round(
+            report['model_serializer']['peak_alloc_kib'] / report['row_serializer']['peak_alloc_kib'], 2,
+        )
+        self.stdout.write(json.dumps(report, indent=2))
+
+    def measure(self, render, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            render()
+            timings.append(time.perf_counter() - started)
+
+        tracemalloc.start()
+        render()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return {'best_ms': round(min(timings) * 1000, 1), 'peak_alloc_kib': peak // 1024}
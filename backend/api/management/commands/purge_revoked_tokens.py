@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from api.models import RevokedToken
+
+
+class Command(BaseCommand):
+    help = (
+        'Deletes the RevokedToken rows of tokens that have expired anyway, in batches so '
+        'no single DELETE holds the table for long. Run it periodically (cron, a systemd '
+        'timer) to keep the blacklist the size of the live refresh tokens.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=10_000)
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        expired = RevokedToken.objects.filter(expires_at__lte=now)
+        deleted = 0
+        while True:
+            batch = list(expired.values_list('jti', flat=True)[:options['batch_size']])
+            if not batch:
+                break
+            deleted += RevokedToken.objects.filter(jti__in=batch).delete()[0]
+
+        self.stdout.write(f'Deleted {deleted} expired revoked tokens.')
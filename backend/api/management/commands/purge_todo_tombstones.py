@@ -0,0 +1,45 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F, Max
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from api.models import TodoTombstone, TodoVersion
+
+
+class Command(BaseCommand):
+    help = (
+        'Deletes the TodoTombstone rows older than TODO_TOMBSTONE_RETENTION, in batches, '
+        'and moves each user\'s tombstone horizon past them so clients that last synced '
+        'before it get a full resync. Run it periodically (cron, a systemd timer).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, help='Retention in days, instead of the setting.')
+        parser.add_argument('--batch-size', type=int, default=10_000)
+
+    def handle(self, *args, **options):
+        retention = settings.TODO_TOMBSTONE_RETENTION
+        if options['days'] is not None:
+            retention = timedelta(days=options['days'])
+        expired = TodoTombstone.objects.filter(deleted_at__lt=timezone.now() - retention)
+        deleted = 0
+        while True:
+            batch = list(expired.order_by('id').values_list('id', flat=True)[:options['batch_size']])
+            if not batch:
+                break
+            rows = TodoTombstone.objects.filter(id__in=batch)
+            with transaction.atomic():
+                # the horizon moves in the same transaction that deletes the tombstones
+                for user_id, revision in rows.values('user_id').annotate(revision=Max('revision')).values_list(
+                    'user_id', 'revision',
+                ):
+                    TodoVersion.objects.filter(user_id=user_id).update(
+                        tombstone_horizon=Greatest(F('tombstone_horizon'), revision),
+                    )
+                deleted += rows.delete()[0]
+
+        self.stdout.write(f'Deleted {deleted} expired todo tombstones.')
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from api.models import TodoVersion
+
+
+class Command(BaseCommand):
+    help = (
+        'Recomputes the per-user todo counts behind /api/todos/summary/ from the todos '
+        'themselves, in one bulk UPDATE. Every write keeps them current, so this is for '
+        'repairing drift: rows changed by hand in the database or a restored backup.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, action='append', dest='users', help='Only this user id, repeatable.')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            rebuilt = TodoVersion.rebuild_counts(options['users'])
+        self.stdout.write(f'Rebuilt the todo counters of {rebuilt} users.')
@@ -0,0 +1,163 @@
+import contextvars
+import hmac
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.views.decorators.http import require_GET
+
+from .cache import todo_list_cache
+
+# Stats of the request being handled. A context variable rather than a thread local:
+# it follows an async view into the threads its ORM calls run in.
+current_request = contextvars.ContextVar('current_request', default=None)
+
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (256, 1024, 4096, 16_384, 65_536, 262_144, 1_048_576, 4_194_304)
+
+# the method label comes from the client: anything else is counted as "other", so made-up
+# verbs cannot add series that are never evicted
+HTTP_METHODS = frozenset({'GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS', 'TRACE', 'CONNECT'})
+
+
+def method_label(method):
+    return method if method in HTTP_METHODS else 'other'
+
+
+class RequestStats:
+    max_logged_queries = 100
+
+    def __init__(self, log_queries=False):
+        self.started = time.perf_counter()
+        self.query_count = 0
+        self.query_seconds = 0.0
+        self.serialize_seconds = 0.0
+        self.queries = [] if log_queries else None
+        self.lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        # a connection.execute_wrapper
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self.lock:
+                self.query_count += 1
+                self.query_seconds += elapsed
+                if self.queries is not None and len(self.queries) < self.max_logged_queries:
+                    self.queries.append((sql, elapsed))
+
+
+@contextmanager
+def timed_serialization():
+    # adds the time spent in the block to the current request's serializer time
+    stats = current_request.get()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if stats is not None:
+            stats.serialize_seconds += time.perf_counter() - started
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+
+class RequestMetrics:
+    """
+    Per-view histograms of the requests served by this process, in Prometheus text
+    exposition format. Like any in-process registry, each worker reports its own.
+    """
+
+    histograms = (
+        ('api_request_duration_seconds', 'Wall time of the request.', DURATION_BUCKETS),
+        ('api_request_queries', 'SQL queries run by the request.', QUERY_BUCKETS),
+        ('api_request_query_duration_seconds', 'Time spent in SQL queries.', DURATION_BUCKETS),
+        ('api_request_serialize_duration_seconds', 'Time spent serializing and rendering.', DURATION_BUCKETS),
+        ('api_response_size_bytes', 'Size of non-streaming response bodies.', SIZE_BUCKETS),
+    )
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self.lock:
+            self.series = {}
+            self.responses = {}
+
+    def observe(self, view, method, status, values):
+        # values: metric name -> observed value, None for not applicable
+        labels = (view, method)
+        with self.lock:
+            series = self.series.get(labels)
+            if series is None:
+                series = self.series[labels] = {
+                    name: Histogram(buckets) for name, _, buckets in self.histograms
+                }
+            for name, value in values.items():
+                if value is not None:
+                    series[name].observe(value)
+            key = (view, method, str(status))
+            self.responses[key] = self.responses.get(key, 0) + 1
+
+    def render(self):
+        lines = []
+        with self.lock:
+            lines += [
+                '# HELP api_responses_total Responses by view, method and status code.',
+                '# TYPE api_responses_total counter',
+            ]
+            for (view, method, status), count in sorted(self.responses.items()):
+                lines.append(f'api_responses_total{{view="{view}",method="{method}",status="{status}"}} {count}')
+
+            for name, help_text, buckets in self.histograms:
+                lines += [f'# HELP {name} {help_text}', f'# TYPE {name} histogram']
+                for (view, method), series in sorted(self.series.items()):
+                    histogram = series[name]
+                    labels = f'view="{view}",method="{method}"'
+                    cumulative = 0
+                    for bound, count in zip((*buckets, '+Inf'), histogram.counts):
+                        cumulative += count
+                        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                    lines.append(f'{name}_sum{{{labels}}} {histogram.sum:.6g}')
+                    lines.append(f'{name}_count{{{labels}}} {cumulative}')
+
+        # read from the cache backend, outside the lock
+        stats = todo_list_cache.stats()
+        lines += [
+            '# HELP api_todo_list_cache_lookups_total Todo list page cache lookups by result.',
+            '# TYPE api_todo_list_cache_lookups_total counter',
+            f'api_todo_list_cache_lookups_total{{result="hit"}} {stats["hits"]}',
+            f'api_todo_list_cache_lookups_total{{result="miss"}} {stats["misses"]}',
+        ]
+        return '\n'.join(lines) + '\n'
+
+
+request_metrics = RequestMetrics()
+
+
+@require_GET
+def metrics_view(request):
+    # scrapers must send METRICS_TOKEN as a bearer token; without one configured the
+    # endpoint is only open under DEBUG
+    token = getattr(settings, 'METRICS_TOKEN', None)
+    if not token:
+        if not settings.DEBUG:
+            return HttpResponse(status=403)
+    elif not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return HttpResponse(status=401)
+    return HttpResponse(request_metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
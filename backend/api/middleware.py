@@ -0,0 +1,98 @@
+import logging
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+
+from .metrics import RequestStats, current_request, method_label, request_metrics, timed_serialization
+
+logger = logging.getLogger('api.metrics')
+
+
+class RequestMetricsMiddleware:
+    """
+    Records wall time, SQL query count and time, serializer time and response size of
+    every request into ``request_metrics``, labelled with the resolved view name.
+
+    Requests slower than ``SLOW_REQUEST_MS`` are logged to ``api.metrics`` with their
+    queries. Put it first in MIDDLEWARE so the wall time covers the whole stack.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        stats = self.start()
+        token = current_request.set(stats)
+        try:
+            with self.wrap_connections(stats):
+                response = self.get_response(request)
+        finally:
+            current_request.reset(token)
+        return self.finish(request, response, stats)
+
+    async def __acall__(self, request):
+        stats = self.start()
+        token = current_request.set(stats)
+        # an async view's queries run in the request's thread-sensitive executor, so the
+        # wrappers go on that thread's connections
+        wrappers = await sync_to_async(self.wrap_connections)(stats)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(wrappers.close)()
+            current_request.reset(token)
+        return self.finish(request, response, stats)
+
+    def start(self):
+        return RequestStats(log_queries=getattr(settings, 'SLOW_REQUEST_MS', None) is not None)
+
+    def wrap_connections(self, stats):
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(stats))
+        return stack
+
+    def process_template_response(self, request, response):
+        # DRF responses render after the view returns, so rendering counts as serializing
+        render = response.render
+
+        def timed_render():
+            with timed_serialization():
+                return render()
+        response.render = timed_render
+        return response
+
+    def finish(self, request, response, stats):
+        elapsed = time.perf_counter() - stats.started
+        match = getattr(request, 'resolver_match', None)
+        view = match.view_name if match else 'unmatched'
+        size = None if response.streaming else len(response.content)
+        request_metrics.observe(view, method_label(request.method), response.status_code, {
+            'api_request_duration_seconds': elapsed,
+            'api_request_queries': stats.query_count,
+            'api_request_query_duration_seconds': stats.query_seconds,
+            'api_request_serialize_duration_seconds': stats.serialize_seconds,
+            'api_response_size_bytes': size,
+        })
+
+        threshold = getattr(settings, 'SLOW_REQUEST_MS', None)
+        if threshold is not None and elapsed * 1000 >= threshold:
+            logger.warning(
+                'Slow request: %s %s (%s) %d in %.1f ms, %d queries in %.1f ms, serializing %.1f ms%s',
+                request.method, request.path, view, response.status_code, elapsed * 1000,
+                stats.query_count, stats.query_seconds * 1000, stats.serialize_seconds * 1000,
+                ''.join(f'\n  {seconds * 1000:.1f} ms  {sql}' for sql, seconds in stats.queries),
+            )
+        return response
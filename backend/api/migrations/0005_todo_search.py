@@ -0,0 +1,78 @@
+from django.db import migrations
+
+# Full-text index of todo titles, see api/search.py. The SQLite FTS5 table is
+# contentless and keyed by (user_id << 32) + id, so one user's entries form a rowid
+# range a search seeks to instead of matching and ranking every user's titles. The
+# prefix indexes let a "term"* query seek too: without them FTS5 expands the prefix by
+# reading every user's doclists. Contentless tables cannot read api_todo back, so the
+# delete and update triggers pass the old title. The insert and update triggers refuse
+# ids and user ids the rowid cannot hold rather than let two todos share an entry.
+# Migrations that rebuild api_todo on SQLite (most AlterField/RemoveField) drop the
+# triggers with the old table and must recreate them; TodoSearchTests checks they exist.
+
+SQLITE_FORWARDS = [
+    """
+    CREATE VIRTUAL TABLE api_todo_fts USING fts5(
+        title, content='', prefix='2 3 4 5 6', tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER api_todo_fts_insert AFTER INSERT ON api_todo BEGIN
+        SELECT RAISE(ABORT, 'api_todo_fts: todo id or user id out of range')
+        WHERE new.id >= 1 << 32 OR new.user_id >= 1 << 31;
+        INSERT INTO api_todo_fts(rowid, title) VALUES ((new.user_id << 32) + new.id, new.title);
+    END
+    """,
+    """
+    CREATE TRIGGER api_todo_fts_delete AFTER DELETE ON api_todo BEGIN
+        INSERT INTO api_todo_fts(api_todo_fts, rowid, title)
+        VALUES ('delete', (old.user_id << 32) + old.id, old.title);
+    END
+    """,
+    """
+    CREATE TRIGGER api_todo_fts_update AFTER UPDATE OF title, user_id ON api_todo BEGIN
+        SELECT RAISE(ABORT, 'api_todo_fts: todo id or user id out of range')
+        WHERE new.id >= 1 << 32 OR new.user_id >= 1 << 31;
+        INSERT INTO api_todo_fts(api_todo_fts, rowid, title)
+        VALUES ('delete', (old.user_id << 32) + old.id, old.title);
+        INSERT INTO api_todo_fts(rowid, title) VALUES ((new.user_id << 32) + new.id, new.title);
+    END
+    """,
+    'INSERT INTO api_todo_fts(rowid, title) SELECT (user_id << 32) + id, title FROM api_todo',
+]
+
+SQLITE_BACKWARDS = [
+    'DROP TRIGGER IF EXISTS api_todo_fts_update',
+    'DROP TRIGGER IF EXISTS api_todo_fts_delete',
+    'DROP TRIGGER IF EXISTS api_todo_fts_insert',
+    'DROP TABLE IF EXISTS api_todo_fts',
+]
+
+POSTGRES_FORWARDS = [
+    "CREATE INDEX api_todo_title_search ON api_todo USING GIN (to_tsvector('simple', title))",
+]
+
+POSTGRES_BACKWARDS = [
+    'DROP INDEX IF EXISTS api_todo_title_search',
+]
+
+
+def run(statements):
+    def operation(apps, schema_editor):
+        for sql in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(sql)
+    return operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_todo_revision_tombstone'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run({'sqlite': SQLITE_FORWARDS, 'postgresql': POSTGRES_FORWARDS}),
+            run({'sqlite': SQLITE_BACKWARDS, 'postgresql': POSTGRES_BACKWARDS}),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:38
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_todos(apps, schema_editor):
+    # the same as TodoVersion.rebuild_counts(), on the historical models
+    Todo, TodoVersion = apps.get_model('api', 'Todo'), apps.get_model('api', 'TodoVersion')
+    owners = set(Todo.objects.order_by().values_list('user_id', flat=True).distinct())
+    owners -= set(TodoVersion.objects.values_list('user_id', flat=True))
+    TodoVersion.objects.bulk_create([TodoVersion(user_id=user_id) for user_id in owners])
+
+    def count(queryset):
+        return Coalesce(Subquery(queryset.annotate(n=Count('id')).values('n')), 0)
+
+    owned = Todo.objects.filter(user_id=OuterRef('user_id')).order_by().values('user_id')
+    TodoVersion.objects.update(total=count(owned), completed=count(owned.filter(completed=True)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_revokedtoken'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='todoversion',
+            name='completed',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='todoversion',
+            name='total',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.RunPython(count_todos, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_todoversion_counts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='todoversion',
+            name='tombstone_horizon',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+    ]
@@ -1,10 +1,186 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.contrib.auth.models import User
+from django.utils import timezone
+
+class TodoQuerySet(models.QuerySet):
+    def with_completed(self, completed):
+        # On SQLite completed=True is rendered as a bare `WHERE "completed"`, which the
+        # planner cannot match to an index column; IN (...) is an equality it can use.
+        return self.filter(completed__in=[completed])
+
 
 class Todo(models.Model):
     title = models.CharField(max_length=200)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     completed = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
+    # the user's TodoVersion.version of the write that last touched this row
+    revision = models.PositiveBigIntegerField(default=0)
+
+    objects = TodoQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # per-user listing, optionally filtered on completed, keyset-paginated on id
+            models.Index(fields=['user', 'completed', 'id'], name='api_todo_user_completed_id'),
+            # delta sync: the user's rows changed after a revision
+            models.Index(fields=['user', 'revision'], name='api_todo_user_revision'),
+        ]
+
+    def stored_completed(self):
+        # completed as committed, read under the lock bump() took: None if the row is gone
+        return Todo.objects.filter(pk=self.pk).values_list('completed', flat=True).first()
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'updated_at', 'revision'}
+        with transaction.atomic():
+            # the counts move by what this write changes in the stored row, so they are
+            # worked out only once bump() has queued concurrent writers of the user
+            self.revision = TodoVersion.bump(self.user_id)
+            current = int(self.__dict__.get('completed'))
+            if self._state.adding:
+                total, completed = 1, current
+            elif update_fields is None or 'completed' in update_fields:
+                stored = self.stored_completed()
+                # saving a row deleted meanwhile inserts it again
+                total, completed = (1, current) if stored is None else (0, current - stored)
+            else:
+                total, completed = 0, 0
+            super().save(*args, **kwargs)
+            if total or completed:
+                TodoVersion.count(self.user_id, total=total, completed=completed)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            revision = TodoVersion.bump(self.user_id)
+            pk, stored = self.pk, self.stored_completed()
+            deleted, per_model = super().delete(*args, **kwargs)
+            # a todo deleted meanwhile was counted and tombstoned by that delete
+            if per_model.get(self._meta.label):
+                TodoVersion.count(self.user_id, total=-1, completed=-int(stored))
+                TodoTombstone.objects.create(user_id=self.user_id, todo_id=pk, revision=revision)
+            return deleted, per_model
 
     def __str__(self):
-        return self.title
\ No newline at end of file
+        return self.title
+
+
+class TodoVersion(models.Model):
+    """
+    Per-user counter bumped on every change to the user's todos, used as a cheap
+    validator for conditional requests and as the revision of delta sync. Bulk writes
+    that bypass ``Todo.save`` and ``Todo.delete`` must call ``bump`` themselves, with
+    the change in the user's todo counts, and stamp the rows (and tombstones) they
+    write with its result.
+
+    ``bump`` updates the row before anything else in the transaction, so concurrent
+    writers of the same user queue on its lock and revisions commit in order.
+
+    ``total`` and ``completed`` are the user's todo counts, moved in the same UPDATE as
+    the version, so the summary endpoint reads one row. ``rebuild_todo_counters``
+    recomputes them from the todos should they ever drift.
+
+    ``tombstone_horizon`` is the highest revision whose tombstones
+    ``purge_todo_tombstones`` may have deleted: a client that last synced before it
+    can no longer be told what was deleted and gets a full resync instead.
+    """
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True)
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(default=timezone.now)
+    total = models.BigIntegerField(default=0)
+    completed = models.BigIntegerField(default=0)
+    tombstone_horizon = models.PositiveBigIntegerField(default=0)
+
+    @classmethod
+    def bump(cls, user_id, total=0, completed=0):
+        # returns the new version; call it inside the transaction of the write
+        changes = {
+            'version': F('version') + 1, 'updated_at': timezone.now(),
+            'total': F('total') + total, 'completed': F('completed') + completed,
+        }
+        changed = cls.objects.filter(user_id=user_id).update(**changes)
+        if not changed:
+            _, created = cls.objects.get_or_create(
+                user_id=user_id, defaults={'version': 1, 'total': total, 'completed': completed},
+            )
+            if created:
+                return 1
+            # lost the race to create the row, count this change on the winner's row
+            cls.objects.filter(user_id=user_id).update(**changes)
+        return cls.objects.filter(user_id=user_id).values_list('version', flat=True).get()
+
+    @classmethod
+    def count(cls, user_id, total=0, completed=0):
+        # moves the counts of a user whose version this transaction has bumped already
+        cls.objects.filter(user_id=user_id).update(total=F('total') + total, completed=F('completed') + completed)
+
+    @classmethod
+    def current(cls, user_id):
+        # (version, updated_at), or (0, None) for a user who never had a todo
+        return cls.objects.filter(user_id=user_id).values_list('version', 'updated_at').first() or (0, None)
+
+    @classmethod
+    def sync_bounds(cls, user_id):
+        # (version, tombstone_horizon), or (0, 0) for a user who never had a todo
+        return cls.objects.filter(user_id=user_id).values_list('version', 'tombstone_horizon').first() or (0, 0)
+
+    @classmethod
+    def summary(cls, user_id):
+        total, completed, version = cls.objects.filter(user_id=user_id).values_list(
+            'total', 'completed', 'version',
+        ).first() or (0, 0, 0)
+        return {'total': total, 'completed': completed, 'open': total - completed, 'revision': version}
+
+    @classmethod
+    def rebuild_counts(cls, user_ids=None):
+        """
+        Recomputes ``total`` and ``completed`` from the todos, for every user or the
+        given ones: one INSERT of the missing rows and one UPDATE whose correlated
+        counts are answered from the (user, completed, id) index.
+
+        :return: number of counter rows rewritten
+        """
+        todos = Todo.objects.all() if user_ids is None else Todo.objects.filter(user_id__in=user_ids)
+        owners = set(todos.order_by().values_list('user_id', flat=True).distinct())
+        owners -= set(cls.objects.filter(user_id__in=owners).values_list('user_id', flat=True))
+        cls.objects.bulk_create([cls(user_id=user_id) for user_id in owners], ignore_conflicts=True)
+
+        def count(queryset):
+            return Coalesce(Subquery(queryset.annotate(n=Count('id')).values('n')), 0)
+
+        owned = Todo.objects.filter(user_id=OuterRef('user_id')).order_by().values('user_id')
+        rows = cls.objects.all() if user_ids is None else cls.objects.filter(user_id__in=user_ids)
+        return rows.update(total=count(owned), completed=count(owned.with_completed(True)))
+
+
+class TodoTombstone(models.Model):
+    """
+    Marks a deleted todo for delta sync: clients that last synced before ``revision``
+    still have the row and must drop it. Kept for ``TODO_TOMBSTONE_RETENTION``, after
+    which ``purge_todo_tombstones`` deletes it and moves the user's
+    ``TodoVersion.tombstone_horizon`` past it.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    todo_id = models.BigIntegerField()
+    revision = models.PositiveBigIntegerField()
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'revision'], name='api_tombstone_user_revision'),
+        ]
+
+
+class RevokedToken(models.Model):
+    """
+    A refresh token that must not be used again, by its jti. Only kept until the token
+    would have expired anyway: ``purge_revoked_tokens`` deletes the rest.
+    """
+    jti = models.CharField(max_length=64, primary_key=True)
+    expires_at = models.DateTimeField(db_index=True)
+    # api.blacklist syncs its Bloom filter from the rows revoked since its last look
+    revoked_at = models.DateTimeField(default=timezone.now, db_index=True)
@@ -0,0 +1,57 @@
+from rest_framework.pagination import BasePagination, CursorPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class TodoCursorPagination(CursorPagination):
+    # keyset pagination on the primary key: every page is a bounded
+    # "WHERE id > cursor ORDER BY id LIMIT n" query, whatever the offset
+    ordering = 'id'
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+
+
+class TodoSearchPagination(BasePagination):
+    # ranked search results have no column to key a cursor on, so ?q= pages by offset;
+    # one extra id is fetched to know whether there is a next page, nothing is counted
+    page_size = TodoCursorPagination.page_size
+    page_size_query_param = 'page_size'
+    max_page_size = TodoCursorPagination.max_page_size
+    offset_query_param = 'offset'
+
+    def paginate_ids(self, request, search):
+        # search(limit, offset) -> ids in rank order
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.offset = self.get_offset(request)
+        ids = search(self.page_size + 1, self.offset)
+        self.has_next = len(ids) > self.page_size
+        return ids[:self.page_size]
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(page_size, self.max_page_size) if page_size > 0 else self.page_size
+
+    def get_offset(self, request):
+        try:
+            return max(int(request.query_params[self.offset_query_param]), 0)
+        except (KeyError, ValueError):
+            return 0
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.offset_query_param, self.offset + self.page_size)
+
+    def get_previous_link(self):
+        if self.offset <= 0:
+            return None
+        url = self.request.build_absolute_uri()
+        offset = self.offset - self.page_size
+        if offset <= 0:
+            return remove_query_param(url, self.offset_query_param)
+        return replace_query_param(url, self.offset_query_param, offset)
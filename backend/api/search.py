@@ -0,0 +1,80 @@
+import re
+
+from django.db import connection
+
+from .models import Todo
+
+# Full-text search over todo titles. The index lives in the database and is kept in
+# step with api_todo by the database itself (see migration 0005_todo_search):
+#
+# - SQLite: the api_todo_fts FTS5 table, fed by triggers on api_todo. Its rowid is
+#   (user_id << 32) + id, so one user's entries are a contiguous rowid range that FTS5
+#   seeks to, and prefix indexes up to 6 characters spare it expanding a prefix over
+#   every user's doclists. Matching and bm25 ranking then stay close to flat however
+#   many todos other users have. Indexing user_id as a column and matching on it
+#   instead made ranking several times slower.
+# - PostgreSQL: a GIN index on to_tsvector('simple', title).
+#
+# Each search term matches as a prefix and all of them must match; results come best
+# match first. Other backends fall back to a LIKE scan in id order.
+
+max_terms = 16
+
+# todo ids below 2**32 and user ids below 2**31 fit the SQLite rowid; the triggers
+# refuse writes outside that range instead of letting two todos share an entry
+user_rowid_shift = 32
+
+
+def search_terms(query):
+    return re.findall(r'\w+', query.lower())[:max_terms]
+
+
+def search_todo_ids(user_id, query, completed=None, limit=100, offset=0):
+    """
+    Ids of the user's todos matching ``query``, best match first.
+
+    :param completed: if not None, only todos with this completed flag
+    """
+    terms = search_terms(query)
+    if not terms:
+        return []
+
+    vendor = connection.vendor
+    if vendor == 'sqlite':
+        match = ' AND '.join(f'"{term}"*' for term in terms)
+        first = user_id << user_rowid_shift
+        sql = (
+            'SELECT t.id FROM api_todo_fts f JOIN api_todo t ON t.id = f.rowid - %s '
+            'WHERE api_todo_fts MATCH %s AND f.rowid BETWEEN %s AND %s AND t.user_id = %s'
+        )
+        params = [first, match, first, first + (1 << user_rowid_shift) - 1, user_id]
+        if completed is not None:
+            sql += ' AND t.completed = %s'
+            params.append(completed)
+        sql += ' ORDER BY f.rank, f.rowid LIMIT %s OFFSET %s'
+    elif vendor == 'postgresql':
+        tsquery = ' & '.join(f'{term}:*' for term in terms)
+        sql = (
+            "SELECT id FROM api_todo WHERE user_id = %s "
+            "AND to_tsvector('simple', title) @@ to_tsquery('simple', %s)"
+        )
+        params = [user_id, tsquery]
+        if completed is not None:
+            sql += ' AND completed = %s'
+            params.append(completed)
+        sql += (
+            " ORDER BY ts_rank(to_tsvector('simple', title), to_tsquery('simple', %s)) DESC, id"
+            " LIMIT %s OFFSET %s"
+        )
+        params.append(tsquery)
+    else:
+        queryset = Todo.objects.filter(user_id=user_id)
+        for term in terms:
+            queryset = queryset.filter(title__icontains=term)
+        if completed is not None:
+            queryset = queryset.with_completed(completed)
+        return list(queryset.order_by('id').values_list('id', flat=True)[offset:offset + limit])
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [*params, limit, offset])
+        return [row[0] for row in cursor.fetchall()]
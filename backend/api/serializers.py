@@ -1,8 +1,13 @@
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from itertools import islice
+from json.encoder import encode_basestring
+
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
 
 from django.contrib.auth.models import User
 from rest_framework import serializers
+from .metrics import timed_serialization
 from .models import Todo
+from .tokens import RevocableRefreshToken
 
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
@@ -15,6 +20,11 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         return token
     
 
+class RevocableTokenRefreshSerializer(TokenRefreshSerializer):
+    # BLACKLIST_AFTER_ROTATION revokes the presented token through api.blacklist
+    token_class = RevocableRefreshToken
+
+
 class UserSerializer(serializers.ModelSerializer):
     password = serializers.CharField(write_only=True)
 
@@ -30,10 +40,119 @@ class UserSerializer(serializers.ModelSerializer):
         return user
     
     
-class TodoSerializer(serializers.ModelSerializer):
+class DynamicFieldsMixin:
+    """
+    Lets the caller restrict the serialized fields, e.g. ``fields=['id', 'completed']``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class TimedDataMixin:
+    """
+    Counts building ``.data`` towards the request's serializer time in the metrics.
+    """
+
+    @property
+    def data(self):
+        with timed_serialization():
+            return super().data
+
+
+class TimedListSerializer(TimedDataMixin, serializers.ListSerializer):
+    pass
+
+
+class TodoSerializer(TimedDataMixin, DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Todo
         fields = ['id', 'user', 'title', 'completed']
         read_only_fields = ['id', 'user']
+        list_serializer_class = TimedListSerializer
+
+
+class TodoSyncSerializer(TodoSerializer):
+    class Meta(TodoSerializer.Meta):
+        fields = TodoSerializer.Meta.fields + ['updated_at', 'revision']
+        read_only_fields = fields
+
+
+class TodoRowSerializer:
+    """
+    Read-only fast path of ``TodoSerializer(many=True)`` for list responses.
+
+    Renders rows of ``values_list(*row_columns)`` straight to the bytes ``JSONRenderer``
+    (compact, unicode) produces for the equivalent ``TodoSerializer`` data, with no
+    model instances, field introspection or intermediate dicts.
+    """
+
+    columns = {'id': 'id', 'user': 'user_id', 'title': 'title', 'completed': 'completed'}
+    formats = {'id': '%d', 'user': '%d', 'title': '%s', 'completed': '%s'}
+    booleans = ('false', 'true')
+
+    def __init__(self, fields=None):
+        # same order as TodoSerializer, whatever order ?fields= listed them in
+        self.fields = [name for name in TodoSerializer.Meta.fields if fields is None or name in fields]
+        self.row_columns = [self.columns[name] for name in self.fields]
+        self.template = '{' + ','.join(f'"{name}":{self.formats[name]}' for name in self.fields) + '}'
+
+    def render_items(self, rows):
+        # one JSON object string per row
+        template, booleans = self.template, self.booleans
+        if self.fields == TodoSerializer.Meta.fields:
+            # the default, unprojected list: one formatting operation per row
+            return [
+                template % (pk, user_id, encode_basestring(title), booleans[completed])
+                for pk, user_id, title, completed in rows
+            ]
+
+        columns = list(zip(*rows)) or [()] * len(self.fields)
+        for index, name in enumerate(self.fields):
+            if name == 'title':
+                columns[index] = map(encode_basestring, columns[index])
+            elif name == 'completed':
+                columns[index] = map(booleans.__getitem__, columns[index])
+        return [template % row for row in zip(*columns)]
+
+    def render_rows(self, rows):
+        return '[' + ','.join(self.render_items(rows)) + ']'
+
+    def render_ndjson(self, rows, chunk_size=2000):
+        # newline-delimited JSON, yielded in encoded chunks of chunk_size rows
+        rows = iter(rows)
+        while chunk := list(islice(rows, chunk_size)):
+            yield ('\n'.join(self.render_items(chunk)) + '\n').encode()
+
+    def render_page(self, rows, next_link, previous_link):
+        link = lambda url: 'null' if url is None else encode_basestring(url)
+        content = f'{{"next":{link(next_link)},"previous":{link(previous_link)},"results":{self.render_rows(rows)}}}'
+        # JSONRenderer escapes these two, they are valid JSON but not valid JavaScript
+        return content.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029').encode()
+
+
+class TodoBulkSerializer(serializers.Serializer):
+    create = serializers.ListField(child=serializers.DictField(), required=False, default=list)
+    update = serializers.ListField(child=serializers.DictField(), required=False, default=list)
+    delete = serializers.ListField(child=serializers.IntegerField(), required=False, default=list)
+
+    max_items = 1000
 
+    def validate(self, attrs):
+        total = len(attrs['create']) + len(attrs['update']) + len(attrs['delete'])
+        if total > self.max_items:
+            raise serializers.ValidationError(f'At most {self.max_items} operations per request')
 
+        ids = [item.get('id') for item in attrs['update']]
+        # bool is an int subclass, but true is not a todo id
+        if not all(isinstance(pk, int) and not isinstance(pk, bool) for pk in ids):
+            raise serializers.ValidationError({'update': 'Every update needs an integer id'})
+        delete = attrs['delete']
+        if len(set(ids)) != len(ids) or len(set(delete)) != len(delete) or set(ids) & set(delete):
+            raise serializers.ValidationError('A todo can be changed only once per request')
+        return attrs
@@ -1,3 +1,1003 @@
-from django.test import TestCase
+import asyncio
+import io
+import json
+import threading
+from datetime import timedelta
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .authentication import active_users
+from .blacklist import BloomFilter, token_blacklist
+from .cache import todo_list_cache
+from .events import TodoEventBroker, todo_events
+from .metrics import request_metrics
+from .models import RevokedToken, Todo, TodoTombstone, TodoVersion
+from .pagination import TodoCursorPagination
+from .search import search_todo_ids
+from .serializers import TodoRowSerializer, TodoSerializer
+from .throttling import LoginIPThrottle, LoginUsernameThrottle
+from .tokens import RevocableRefreshToken
+from .views import TodoViewSet
+
+
+class TodoAPITestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='alice', password='secret-pass')
+        self.other = User.objects.create_user(username='bob', password='secret-pass')
+        self.client.force_authenticate(self.user)
+        self.list_url = reverse('todo-list')
+        todo_list_cache.cache.clear()
+        caches['throttle'].clear()
+
+    def make_todos(self, count, user=None, **kwargs):
+        return Todo.objects.bulk_create(
+            Todo(user=user or self.user, title=f'todo {i}', **kwargs) for i in range(count)
+        )
+
+
+class TodoPaginationTests(TodoAPITestCase):
+    def test_list_is_paginated_by_cursor(self):
+        self.make_todos(5)
+        self.make_todos(3, user=self.other)
+
+        response = self.client.get(self.list_url, {'page_size': 2})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['results']), 2)
+
+        seen = []
+        url = self.list_url + '?page_size=2'
+        while url:
+            page = self.client.get(url).json()
+            seen += [todo['id'] for todo in page['results']]
+            url = page['next']
+
+        expected = list(Todo.objects.filter(user=self.user).order_by('id').values_list('id', flat=True))
+        self.assertEqual(seen, expected)
+
+    def test_page_size_is_capped(self):
+        self.make_todos(5)
+        with mock.patch.object(TodoCursorPagination, 'max_page_size', 3):
+            response = self.client.get(self.list_url, {'page_size': 10**6})
+        self.assertEqual(len(response.json()['results']), 3)
+        self.assertIsNotNone(response.json()['next'])
+
+    def test_fields_projection(self):
+        self.make_todos(2)
+        response = self.client.get(self.list_url, {'fields': 'id,completed'})
+        self.assertEqual(response.status_code, 200)
+        for todo in response.json()['results']:
+            self.assertEqual(set(todo), {'id', 'completed'})
+
+    def test_unknown_field_is_rejected(self):
+        response = self.client.get(self.list_url, {'fields': 'id,password'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_create_ignores_fields(self):
+        response = self.client.post(self.list_url + '?fields=id', {'title': 'new'}, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['title'], 'new')
+
+
+class TodoCompletedFilterTests(TodoAPITestCase):
+    def test_filter_on_completed(self):
+        done = self.make_todos(2, completed=True)
+        self.make_todos(3)
+
+        response = self.client.get(self.list_url, {'completed': 'true'})
+        self.assertEqual([todo['id'] for todo in response.json()['results']], [todo.id for todo in done])
+
+        response = self.client.get(self.list_url, {'completed': 'false'})
+        self.assertEqual(len(response.json()['results']), 3)
+
+    def test_invalid_completed_value(self):
+        response = self.client.get(self.list_url, {'completed': 'maybe'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_filtered_listing_uses_composite_index(self):
+        queryset = Todo.objects.filter(user=self.user).with_completed(True).order_by('id')
+        self.assertIn('api_todo_user_completed_id', queryset.explain())
+
+
+class TodoBulkTests(TodoAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.bulk_url = reverse('todo-bulk')
+
+    def test_bulk_create_update_delete(self):
+        first, second, third = self.make_todos(3)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.bulk_url, {
+                'create': [{'title': 'a'}, {'title': 'b', 'completed': True}],
+                'update': [{'id': first.id, 'completed': True}, {'id': second.id, 'title': 'renamed'}],
+                'delete': [third.id],
+            }, format='json')
+        self.assertEqual(response.status_code, 200, response.data)
+
+        todo_writes = ('INSERT INTO "api_todo" ', 'UPDATE "api_todo" ', 'DELETE FROM "api_todo" ')
+        writes = [q['sql'].split()[0] for q in queries if q['sql'].startswith(todo_writes)]
+        self.assertEqual(writes, ['INSERT', 'UPDATE', 'DELETE'])
+
+        self.assertEqual([todo['title'] for todo in response.data['created']], ['a', 'b'])
+        self.assertEqual(response.data['deleted'], [third.id])
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertTrue(first.completed)
+        self.assertEqual(second.title, 'renamed')
+        self.assertFalse(Todo.objects.filter(id=third.id).exists())
+        self.assertEqual(Todo.objects.filter(user=self.user).count(), 4)
+
+    def test_bulk_is_all_or_nothing(self):
+        todo, = self.make_todos(1)
+        foreign, = self.make_todos(1, user=self.other)
+
+        response = self.client.post(self.bulk_url, {
+            'create': [{'title': 'ok'}, {'title': ''}],
+            'update': [{'id': todo.id, 'completed': True}],
+            'delete': [foreign.id],
+        }, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('create', response.data)
+        self.assertIn('delete', response.data)
+
+        self.assertEqual(Todo.objects.filter(user=self.user).count(), 1)
+        self.assertTrue(Todo.objects.filter(id=foreign.id).exists())
+        todo.refresh_from_db()
+        self.assertFalse(todo.completed)
+
+    def test_bulk_rejects_conflicting_operations(self):
+        todo, = self.make_todos(1)
+        response = self.client.post(self.bulk_url, {
+            'update': [{'id': todo.id, 'completed': True}],
+            'delete': [todo.id],
+        }, format='json')
+        self.assertEqual(response.status_code, 400)
+
+        for bad in ({'delete': [todo.id, todo.id]}, {'update': [{'id': True, 'completed': True}]}):
+            self.assertEqual(self.client.post(self.bulk_url, bad, format='json').status_code, 400)
+        self.assertEqual(TodoVersion.summary(self.user.id)['total'], 0)
+        self.assertFalse(TodoTombstone.objects.exists())
+
+
+class StatelessJWTAuthenticationTests(TodoAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(None)
+        active_users.clear()
+        response = self.client.post(reverse('token_obtain_pair'),
+                                    {'username': 'alice', 'password': 'secret-pass'}, format='json')
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+
+    def test_list_skips_user_query(self):
+        self.make_todos(2)
+        self.client.get(self.list_url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.list_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['results']), 2)
+        self.assertFalse([q for q in queries if '"auth_user"' in q['sql']])
+
+    def test_created_todo_belongs_to_token_user(self):
+        response = self.client.post(self.list_url, {'title': 'from token'}, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['user'], self.user.id)
+
+    def test_deactivation_takes_effect_after_ttl(self):
+        self.assertEqual(self.client.get(self.list_url).status_code, 200)
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        # still trusted from the cache until the entry expires
+        self.assertEqual(self.client.get(self.list_url).status_code, 200)
+        active_users.clear()
+        self.assertEqual(self.client.get(self.list_url).status_code, 401)
+
+
+class ConditionalGetTests(TodoAPITestCase):
+    def test_list_not_modified_without_reading_todos(self):
+        self.make_todos(2)
+        response = self.client.get(self.list_url)
+        etag = response.headers['ETag']
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers['ETag'], etag)
+
+    def test_etag_changes_on_write(self):
+        todo = Todo.objects.create(user=self.user, title='first')
+        etag = self.client.get(self.list_url).headers['ETag']
+        item_etag = self.client.get(reverse('todo-detail', args=[todo.id])).headers['ETag']
+
+        self.client.patch(reverse('todo-detail', args=[todo.id]), {'completed': True}, format='json')
+
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+        response = self.client.get(reverse('todo-detail', args=[todo.id]), HTTP_IF_NONE_MATCH=item_etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['completed'])
+
+    def test_etag_depends_on_query(self):
+        self.make_todos(1)
+        etag = self.client.get(self.list_url).headers['ETag']
+        response = self.client.get(self.list_url, {'fields': 'id'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_last_modified(self):
+        Todo.objects.create(user=self.user, title='first')
+        response = self.client.get(self.list_url)
+        response = self.client.get(self.list_url, HTTP_IF_MODIFIED_SINCE=response.headers['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_bulk_and_delete_bump_version(self):
+        todo = Todo.objects.create(user=self.user, title='first')
+        version = TodoVersion.current(self.user.id)[0]
+
+        self.client.post(reverse('todo-bulk'), {'create': [{'title': 'a'}, {'title': 'b'}]}, format='json')
+        self.assertEqual(TodoVersion.current(self.user.id)[0], version + 1)
+        self.client.delete(reverse('todo-detail', args=[todo.id]))
+        self.assertEqual(TodoVersion.current(self.user.id)[0], version + 2)
+
+
+class TodoListCacheTests(TodoAPITestCase):
+    def test_repeated_list_is_served_from_cache(self):
+        self.make_todos(3)
+        first = self.client.get(self.list_url, {'page_size': 2})
+        hits = todo_list_cache.stats()['hits']
+
+        with self.assertNumQueries(1):
+            second = self.client.get(self.list_url, {'page_size': 2})
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second['Content-Type'], 'application/json')
+        self.assertEqual(todo_list_cache.stats()['hits'], hits + 1)
+
+    def test_writes_invalidate_cache(self):
+        todo, = self.make_todos(1)
+        self.client.get(self.list_url)
+
+        self.client.post(self.list_url, {'title': 'new'}, format='json')
+        self.assertIsNone(todo_list_cache.cache.get(todo_list_cache.key(self.user.id)))
+        self.assertEqual(len(self.client.get(self.list_url).json()['results']), 2)
+
+        self.client.patch(reverse('todo-detail', args=[todo.id]), {'completed': True}, format='json')
+        results = self.client.get(self.list_url).json()['results']
+        self.assertTrue(results[0]['completed'])
+
+        self.client.delete(reverse('todo-detail', args=[todo.id]))
+        self.assertEqual(len(self.client.get(self.list_url).json()['results']), 1)
+
+    def test_pages_per_user_are_capped(self):
+        for size in range(1, todo_list_cache.pages_per_user + 5):
+            self.client.get(self.list_url, {'page_size': size})
+        pages = todo_list_cache.cache.get(todo_list_cache.key(self.user.id))
+        self.assertEqual(len(pages), todo_list_cache.pages_per_user)
+
+    def test_users_do_not_share_entries(self):
+        self.make_todos(1)
+        self.client.get(self.list_url)
+        self.client.force_authenticate(self.other)
+        self.assertEqual(self.client.get(self.list_url).json()['results'], [])
+
+
+class AsyncTodoAPITests(TodoAPITestCase):
+    def setUp(self):
+        super().setUp()
+        active_users.clear()
+        self.auth = {'headers': {'Authorization': f'Bearer {AccessToken.for_user(self.user)}'}}
+
+    async def test_crud(self):
+        url = reverse('async_todo_list')
+        response = await self.async_client.post(url, {'title': 'async'}, content_type='application/json', **self.auth)
+        self.assertEqual(response.status_code, 201)
+        todo = response.json()
+        self.assertEqual(todo['user'], self.user.id)
+
+        detail = reverse('async_todo_detail', args=[todo['id']])
+        response = await self.async_client.patch(detail, {'completed': True}, content_type='application/json', **self.auth)
+        self.assertTrue(response.json()['completed'])
+        self.assertTrue((await Todo.objects.aget(pk=todo['id'])).completed)
+        self.assertEqual((await TodoVersion.objects.aget(user=self.user)).completed, 1)
+
+        response = await self.async_client.delete(detail, **self.auth)
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(await Todo.objects.filter(pk=todo['id']).aexists())
+        self.assertEqual(await sync_to_async(TodoVersion.summary)(self.user.id), {
+            'total': 0, 'completed': 0, 'open': 0, 'revision': 3,
+        })
+
+    async def test_list_pages_with_after(self):
+        await Todo.objects.abulk_create(Todo(user=self.user, title=f'todo {i}') for i in range(5))
+        url, seen = reverse('async_todo_list') + '?page_size=2', []
+        while url:
+            page = (await self.async_client.get(url, **self.auth)).json()
+            seen += [todo['id'] for todo in page['results']]
+            url = page['next']
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(seen, sorted(seen))
+
+    async def test_requires_token_and_ownership(self):
+        self.assertEqual((await self.async_client.get(reverse('async_todo_list'))).status_code, 401)
+
+        foreign = await Todo.objects.acreate(user=self.other, title='not yours')
+        response = await self.async_client.get(reverse('async_todo_detail', args=[foreign.id]), **self.auth)
+        self.assertEqual(response.status_code, 404)
+
+    async def test_register(self):
+        url = reverse('async_register')
+        hasher, threads = type(get_hasher()), []
+        encode = hasher.encode
+
+        def recording_encode(self, *args, **kwargs):
+            threads.append(threading.get_ident())
+            return encode(self, *args, **kwargs)
+
+        with mock.patch.object(hasher, 'encode', recording_encode):
+            response = await self.async_client.post(url, {'username': 'carol', 'password': 'secret-pass'},
+                                                    content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        # the password is hashed off the event loop
+        self.assertTrue(threads)
+        self.assertNotIn(threading.get_ident(), threads)
+        self.assertEqual(response.json(), {'username': 'carol'})
+
+        response = await self.async_client.post(url, {'username': 'carol', 'password': 'secret-pass'},
+                                                content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('username', response.json())
+
+
+class TodoRowSerializerTests(TodoAPITestCase):
+    titles = ['plain', 'quote " and \\ backslash', 'ünïcødé ✓ 🚀', 'line\nbreak\ttab\x01', 'js \u2028 \u2029 seps', '']
+
+    def drf_page(self, todos, fields=None, next_link=None, previous_link=None):
+        return JSONRenderer().render({
+            'next': next_link,
+            'previous': previous_link,
+            'results': TodoSerializer(todos, many=True, fields=fields).data,
+        })
+
+    def test_byte_identical_to_drf(self):
+        todos = [Todo.objects.create(user=self.user, title=title, completed=i % 2 == 0)
+                 for i, title in enumerate(self.titles)]
+
+        for fields in (None, ['id', 'completed'], ['title', 'user']):
+            fast = TodoRowSerializer(fields)
+            rows = Todo.objects.filter(user=self.user).order_by('id').values_list(*fast.row_columns)
+            self.assertEqual(
+                fast.render_page(rows, 'http://testserver/api/todos/?cursor=cD0x', None),
+                self.drf_page(todos, fields, 'http://testserver/api/todos/?cursor=cD0x', None),
+            )
+
+    def test_list_endpoint_matches_drf(self):
+        todos = [Todo.objects.create(user=self.user, title=title) for title in self.titles]
+
+        response = self.client.get(self.list_url)
+        self.assertEqual(response.content, self.drf_page(todos))
+
+        response = self.client.get(self.list_url, {'fields': 'completed,id'}, HTTP_ACCEPT='application/json; indent=2')
+        self.assertEqual(response.json()['results'], TodoSerializer(todos, many=True, fields=['id', 'completed']).data)
+
+
+class TodoExportImportTests(TodoAPITestCase):
+    def test_export_streams_ndjson(self):
+        todos = self.make_todos(5)
+        self.make_todos(2, user=self.other)
+
+        response = self.client.get(reverse('todo-export'), HTTP_ACCEPT='application/x-ndjson')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], TodoSerializer(todos, many=True).data)
+
+    def test_export_projection(self):
+        self.make_todos(2)
+        response = self.client.get(reverse('todo-export'), {'fields': 'title'})
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], [{'title': 'todo 0'}, {'title': 'todo 1'}])
+
+    def test_import_round_trip(self):
+        self.make_todos(3, completed=True)
+        exported = b''.join(self.client.get(reverse('todo-export')).streaming_content)
+
+        self.client.force_authenticate(self.other)
+        response = self.client.post(reverse('todo-import'), exported, content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json(), {'imported': 3})
+        self.assertEqual(Todo.objects.filter(user=self.other, completed=True).count(), 3)
+
+    def test_import_in_batches(self):
+        body = '\n'.join(json.dumps({'title': f'imported {i}'}) for i in range(25)).encode()
+        with mock.patch.object(TodoViewSet, 'import_batch_size', 10), CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse('todo-import'), body, content_type='application/x-ndjson')
+        self.assertEqual(response.json(), {'imported': 25})
+        inserts = [q for q in queries if q['sql'].startswith('INSERT INTO "api_todo" ')]
+        self.assertEqual(len(inserts), 3)
+
+    def test_bad_line_rejects_import(self):
+        body = b'{"title": "ok"}\n{"title": ""}\n'
+        response = self.client.post(reverse('todo-import'), body, content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['line'], '2')
+        self.assertFalse(Todo.objects.filter(user=self.user).exists())
+
+
+class LoginThrottleTests(TodoAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(None)
+
+    def login(self, username, password='wrong'):
+        return self.client.post(reverse('token_obtain_pair'), {'username': username, 'password': password},
+                                format='json')
+
+    def test_username_throttle_rejects_before_hashing(self):
+        with mock.patch.object(LoginUsernameThrottle, 'rate', '2/min', create=True), \
+                mock.patch('rest_framework_simplejwt.serializers.authenticate', return_value=None) as authenticate:
+            self.assertEqual(self.login('alice').status_code, 401)
+            self.assertEqual(self.login('ALICE').status_code, 401)
+            response = self.login('alice', 'secret-pass')
+            self.assertEqual(response.status_code, 429)
+            self.assertIn('Retry-After', response.headers)
+            self.assertEqual(authenticate.call_count, 2)
+
+            # other usernames are not affected
+            self.assertEqual(self.login('bob').status_code, 401)
+
+    def test_ip_throttle_covers_register(self):
+        with mock.patch.object(LoginIPThrottle, 'rate', '2/min', create=True):
+            for i in range(2):
+                response = self.client.post(reverse('register'), {'username': f'user{i}', 'password': 'secret-pass'},
+                                            format='json')
+                self.assertEqual(response.status_code, 201)
+            response = self.client.post(reverse('register'), {'username': 'user3', 'password': 'secret-pass'},
+                                        format='json')
+            self.assertEqual(response.status_code, 429)
+            self.assertFalse(User.objects.filter(username='user3').exists())
+
+    def test_rates_follow_settings(self):
+        rates = {'login_ip': '1/min', 'login_username': None}
+        with override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': rates}):
+            self.assertEqual(self.login('carol').status_code, 401)
+            self.assertEqual(self.login('dave').status_code, 429)
+        rates = {'login_ip': None, 'login_username': None}
+        with override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': rates}):
+            self.assertEqual(self.login('erin').status_code, 401)
+
+    async def test_async_register_is_throttled(self):
+        with mock.patch.object(LoginIPThrottle, 'rate', '1/min', create=True):
+            url = reverse('async_register')
+            first = await self.async_client.post(url, {'username': 'dave', 'password': 'secret-pass'},
+                                                 content_type='application/json')
+            second = await self.async_client.post(url, {'username': 'erin', 'password': 'secret-pass'},
+                                                  content_type='application/json')
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(second.status_code, 429)
+        self.assertIn('Retry-After', second.headers)
+
+    def test_configured_hasher_is_preferred(self):
+        self.assertEqual(get_hasher().algorithm, {
+            'pbkdf2': 'pbkdf2_sha256', 'scrypt': 'scrypt', 'argon2': 'argon2',
+        }[settings.PASSWORD_HASHER])
+
+
+class TodoEventTests(TodoAPITestCase):
+    def setUp(self):
+        super().setUp()
+        active_users.clear()
+        todo_events.clear()
+        self.auth = {'headers': {'Authorization': f'Bearer {AccessToken.for_user(self.user)}'}}
+
+    def history(self, user=None):
+        channel = todo_events.channels.get((user or self.user).id)
+        return [(event.type, json.loads(event.payload.decode().split('data: ')[1])) for event in
+                (channel.history if channel else [])]
+
+    def test_writes_are_published_on_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            todo = self.client.post(self.list_url, {'title': 'a'}, format='json').json()
+        self.assertEqual(self.history(), [])
+
+        callbacks[0]()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(reverse('todo-detail', args=[todo['id']]), {'completed': True}, format='json')
+            self.client.delete(reverse('todo-detail', args=[todo['id']]))
+
+        self.assertEqual(self.history(), [
+            ('created', todo),
+            ('updated', {**todo, 'completed': True}),
+            ('deleted', {'id': todo['id']}),
+        ])
+        self.assertEqual(self.history(self.other), [])
+
+    def test_bulk_publishes_each_change(self):
+        existing = self.make_todos(2)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('todo-bulk'), {
+                'create': [{'title': 'new'}],
+                'update': [{'id': existing[0].id, 'completed': True}],
+                'delete': [existing[1].id],
+            }, format='json')
+        self.assertEqual([event_type for event_type, _ in self.history()], ['created', 'updated', 'deleted'])
+
+    def test_stream_needs_asgi(self):
+        response = self.client.get(reverse('async_todo_events'), **self.auth)
+        self.assertEqual(response.status_code, 501)
+
+    async def test_stream_replays_after_last_event_id_and_follows(self):
+        first = todo_events.publish(self.user.id, 'created', {'id': 1})
+        todo_events.publish(self.user.id, 'updated', {'id': 1})
+        todo_events.publish(self.other.id, 'created', {'id': 2})
+
+        response = await self.async_client.get(
+            reverse('async_todo_events'), headers={**self.auth['headers'], 'Last-Event-ID': first.id},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Type'], 'text/event-stream')
+
+        stream = response.streaming_content
+        self.assertEqual(await anext(stream), b'retry: 3000\n\n')
+        self.assertIn(b'event: updated', await anext(stream))
+
+        self.assertEqual(len(todo_events.channels[self.user.id].subscribers), 1)
+        live = todo_events.publish(self.user.id, 'deleted', {'id': 1})
+        self.assertEqual(await asyncio.wait_for(anext(stream), 1), live.payload)
+        await stream.aclose()
+
+    async def test_unknown_last_event_id_gets_reset(self):
+        todo_events.publish(self.user.id, 'created', {'id': 1})
+        response = await self.async_client.get(
+            reverse('async_todo_events'), headers={**self.auth['headers'], 'Last-Event-ID': 'restarted-7'},
+        )
+        stream = response.streaming_content
+        await anext(stream)
+        latest = todo_events.channels[self.user.id].history[-1]
+        self.assertEqual(await anext(stream), f'id: {latest.id}\nevent: reset\ndata: {{}}\n\n'.encode())
+        await stream.aclose()
+
+    async def test_stream_ends_when_the_token_expires(self):
+        token = AccessToken.for_user(self.user)
+        token.set_exp(lifetime=timedelta(seconds=1))
+        response = await self.async_client.get(
+            reverse('async_todo_events'), headers={'Authorization': f'Bearer {token}'},
+        )
+        stream = response.streaming_content
+        await anext(stream)
+        self.assertEqual(await asyncio.wait_for(anext(stream), 2), b'event: expired\ndata: {}\n\n')
+        with self.assertRaises(StopAsyncIteration):
+            await anext(stream)
+
+    async def test_slow_subscriber_gets_reset(self):
+        broker = TodoEventBroker(history_size=10, queue_size=2)
+        subscription = broker.subscribe(self.user.id)
+        events = [broker.publish(self.user.id, 'created', {'id': i}) for i in range(5)]
+        await asyncio.sleep(0)
+
+        received = [await subscription.get() for _ in range(3)]
+        self.assertEqual([event.type for event in received], ['created', 'created', 'reset'])
+        self.assertEqual(received[-1].id, events[-1].id)
+
+
+class TodoSyncTests(TodoAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.sync_url = reverse('todo-sync')
+
+    def sync(self, since):
+        response = self.client.get(self.sync_url, {'since': since})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_delta_since_revision(self):
+        self.make_todos(2)
+        first = self.client.post(self.list_url, {'title': 'first'}, format='json').json()
+        second = self.client.post(self.list_url, {'title': 'second'}, format='json').json()
+        self.make_todos(1, user=self.other)
+
+        snapshot = self.sync(0)
+        self.assertTrue(snapshot['full'])
+        self.assertEqual(len(snapshot['changed']), 4)
+        self.assertEqual(snapshot['revision'], 2)
+
+        self.client.patch(reverse('todo-detail', args=[first['id']]), {'completed': True}, format='json')
+        self.client.delete(reverse('todo-detail', args=[second['id']]))
+        third = self.client.post(self.list_url, {'title': 'third'}, format='json').json()
+
+        delta = self.sync(snapshot['revision'])
+        self.assertFalse(delta['full'])
+        self.assertEqual(delta['revision'], 5)
+        self.assertEqual([(todo['id'], todo['revision']) for todo in delta['changed']], [(first['id'], 3), (third['id'], 5)])
+        self.assertTrue(delta['changed'][0]['completed'])
+        self.assertIn('updated_at', delta['changed'][0])
+        self.assertEqual(delta['deleted'], [second['id']])
+
+        self.assertEqual(self.sync(delta['revision']), {
+            'revision': 5, 'full': False, 'changed': [], 'deleted': [], 'next': None,
+        })
+
+    def test_bulk_and_import_share_one_revision(self):
+        existing = self.make_todos(3)
+        self.client.post(reverse('todo-bulk'), {
+            'create': [{'title': 'new'}],
+            'update': [{'id': existing[0].id, 'title': 'renamed'}],
+            'delete': [existing[1].id],
+        }, format='json')
+        self.assertEqual(self.sync(0)['revision'], 1)
+        self.assertEqual(TodoTombstone.objects.get(user=self.user).revision, 1)
+        self.assertEqual(Todo.objects.get(pk=existing[0].id).revision, 1)
+
+        self.client.post(reverse('todo-import'), b'{"title": "a"}\n{"title": "b"}\n',
+                         content_type='application/x-ndjson')
+        delta = self.sync(1)
+        self.assertEqual([(todo['title'], todo['revision']) for todo in delta['changed']], [('a', 2), ('b', 2)])
+
+    def test_unknown_revision_gets_everything(self):
+        self.make_todos(2)
+        self.client.post(self.list_url, {'title': 'x'}, format='json')
+        delta = self.sync(99)
+        self.assertTrue(delta['full'])
+        self.assertEqual(len(delta['changed']), 3)
+
+        self.assertEqual(self.client.get(self.sync_url, {'since': 'x'}).status_code, 400)
+
+
+    def sync_pages(self, since, page_size):
+        pages = [self.client.get(self.sync_url, {'since': since, 'page_size': page_size}).json()]
+        while pages[-1]['next']:
+            pages.append(self.client.get(pages[-1]['next']).json())
+        return pages
+
+    def test_sync_is_paged(self):
+        # one bulk write stamps three rows with the same revision, the pages split it
+        self.client.post(reverse('todo-bulk'), {'create': [{'title': t} for t in 'abc']}, format='json')
+        todos = [self.client.post(self.list_url, {'title': t}, format='json').json() for t in 'de']
+
+        pages = self.sync_pages(0, 2)
+        self.assertEqual([len(page['changed']) for page in pages], [2, 2, 1])
+        self.assertTrue(all(page['full'] and page['revision'] == 3 for page in pages))
+        self.assertEqual([todo['title'] for page in pages for todo in page['changed']], list('abcde'))
+
+        # changes made while paging are left for the next sync
+        self.client.delete(reverse('todo-detail', args=[todos[0]['id']]))
+        self.client.delete(reverse('todo-detail', args=[todos[1]['id']]))
+        pages = [self.client.get(self.sync_url, {'since': 1, 'page_size': 1}).json()]
+        self.client.post(self.list_url, {'title': 'late'}, format='json')
+        while pages[-1]['next']:
+            pages.append(self.client.get(pages[-1]['next']).json())
+        self.assertEqual([page['revision'] for page in pages], [5] * len(pages))
+        self.assertEqual([todo['title'] for page in pages for todo in page['changed']], [])
+        self.assertEqual([pk for page in pages for pk in page['deleted']], [todos[0]['id'], todos[1]['id']])
+        self.assertEqual([todo['title'] for todo in self.sync(5)['changed']], ['late'])
+
+        self.assertEqual(self.client.get(self.sync_url, {'since': 1, 'cursor': 'x'}).status_code, 400)
+        self.assertEqual(self.client.get(self.sync_url, {'since': 1, 'cursor': '99.c.1.'}).status_code, 400)
+
+    def test_purged_tombstones_force_a_full_resync(self):
+        todos = [self.client.post(self.list_url, {'title': t}, format='json').json() for t in 'abc']
+        self.client.delete(reverse('todo-detail', args=[todos[0]['id']]))
+        self.client.delete(reverse('todo-detail', args=[todos[1]['id']]))
+        TodoTombstone.objects.filter(todo_id=todos[0]['id']).update(deleted_at=timezone.now() - timedelta(days=31))
+
+        out = io.StringIO()
+        call_command('purge_todo_tombstones', stdout=out)
+        self.assertIn('Deleted 1 expired', out.getvalue())
+        self.assertEqual(list(TodoTombstone.objects.values_list('todo_id', flat=True)), [todos[1]['id']])
+        self.assertEqual(TodoVersion.sync_bounds(self.user.id), (5, 4))
+
+        # a client from before the purged deletion starts over, later ones still get deltas
+        stale = self.sync(3)
+        self.assertTrue(stale['full'])
+        self.assertEqual([todo['title'] for todo in stale['changed']], ['c'])
+        self.assertEqual(self.sync(4), {'revision': 5, 'full': False, 'changed': [], 'deleted': [todos[1]['id']], 'next': None})
+
+
+class TodoSummaryTests(TodoAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.summary_url = reverse('todo-summary')
+
+    def summary(self):
+        response = self.client.get(self.summary_url)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def counts(self):
+        return {key: value for key, value in self.summary().items() if key != 'revision'}
+
+    def test_every_write_path_moves_the_counts(self):
+        self.assertEqual(self.summary(), {'total': 0, 'completed': 0, 'open': 0, 'revision': 0})
+
+        first = self.client.post(self.list_url, {'title': 'a'}, format='json').json()
+        second = self.client.post(self.list_url, {'title': 'b', 'completed': True}, format='json').json()
+        self.assertEqual(self.counts(), {'total': 2, 'completed': 1, 'open': 1})
+
+        self.client.patch(reverse('todo-detail', args=[first['id']]), {'completed': True}, format='json')
+        self.client.patch(reverse('todo-detail', args=[first['id']]), {'title': 'a2'}, format='json')
+        self.assertEqual(self.counts(), {'total': 2, 'completed': 2, 'open': 0})
+
+        self.client.delete(reverse('todo-detail', args=[second['id']]))
+        self.assertEqual(self.counts(), {'total': 1, 'completed': 1, 'open': 0})
+
+        self.client.post(reverse('todo-bulk'), {
+            'create': [{'title': 'c', 'completed': True}, {'title': 'd'}],
+            'update': [{'id': first['id'], 'completed': False}],
+        }, format='json')
+        self.assertEqual(self.counts(), {'total': 3, 'completed': 1, 'open': 2})
+        done = Todo.objects.get(user=self.user, title='c')
+        self.client.post(reverse('todo-bulk'), {'delete': [done.id]}, format='json')
+        self.assertEqual(self.counts(), {'total': 2, 'completed': 0, 'open': 2})
+
+        self.client.post(reverse('todo-import'), b'{"title": "e", "completed": true}\n{"title": "f"}\n',
+                         content_type='application/x-ndjson')
+        self.assertEqual(self.summary(), {'total': 4, 'completed': 1, 'open': 3, 'revision': 8})
+
+    def test_stale_instances_move_the_counts_once(self):
+        Todo.objects.create(user=self.user, title='a')
+        first, second = Todo.objects.get(title='a'), Todo.objects.get(title='a')
+        for todo in (first, second):
+            todo.completed = True
+            todo.save()
+        self.assertEqual(self.counts(), {'total': 1, 'completed': 1, 'open': 0})
+
+        Todo.objects.create(user=self.user, title='b')
+        self.assertEqual(first.delete()[0], 1)
+        self.assertEqual(second.delete()[0], 0)
+        self.assertEqual(self.counts(), {'total': 1, 'completed': 0, 'open': 1})
+        self.assertEqual(TodoTombstone.objects.filter(user=self.user).count(), 1)
+
+    def test_summary_is_one_query(self):
+        self.client.post(self.list_url, {'title': 'a'}, format='json')
+        with CaptureQueriesContext(connection) as queries:
+            self.summary()
+        self.assertEqual(len([q for q in queries if 'api_todoversion' in q['sql']]), 1)
+        self.assertFalse([q for q in queries if '"api_todo"' in q['sql']])
+
+    def test_rebuild_repairs_drift(self):
+        # bulk_create here bypasses the counters, as a hand-written INSERT would
+        self.make_todos(3)
+        self.make_todos(2, completed=True)
+        self.make_todos(4, user=self.other, completed=True)
+        TodoVersion.bump(self.other.id, total=10)
+        self.assertEqual(self.counts(), {'total': 0, 'completed': 0, 'open': 0})
+
+        out = io.StringIO()
+        call_command('rebuild_todo_counters', stdout=out)
+        self.assertIn('2 users', out.getvalue())
+        self.assertEqual(self.counts(), {'total': 5, 'completed': 2, 'open': 3})
+        self.assertEqual(TodoVersion.summary(self.other.id)['total'], 4)
+
+        Todo.objects.filter(user=self.other).delete()
+        call_command('rebuild_todo_counters', '--user', str(self.other.id), stdout=io.StringIO())
+        self.assertEqual(TodoVersion.summary(self.other.id)['total'], 0)
+
+
+class RequestMetricsTests(TodoAPITestCase):
+    def setUp(self):
+        super().setUp()
+        request_metrics.clear()
+        self.metrics_url = reverse('metrics')
+
+    def sample(self, text, name, view, method='GET'):
+        prefix = f'{name}{{view="{view}",method="{method}"}} '
+        values = [line[len(prefix):] for line in text.splitlines() if line.startswith(prefix)]
+        self.assertEqual(len(values), 1, f'{prefix} not in metrics')
+        return float(values[0])
+
+    def test_requests_are_recorded_per_view(self):
+        todo = self.make_todos(3)[0]
+        self.client.get(self.list_url)
+        self.client.get(reverse('todo-detail', args=[todo.id]))
+        self.client.get(reverse('todo-detail', args=[todo.id]))
+
+        with override_settings(METRICS_TOKEN='scrape-me'):
+            response = self.client.get(self.metrics_url, headers={'Authorization': 'Bearer scrape-me'})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        text = response.content.decode()
+
+        self.assertEqual(self.sample(text, 'api_request_duration_seconds_count', 'todo-list'), 1)
+        self.assertEqual(self.sample(text, 'api_request_duration_seconds_count', 'todo-detail'), 2)
+        self.assertIn('api_responses_total{view="todo-detail",method="GET",status="200"} 2', text)
+        self.assertIn('api_request_duration_seconds_bucket{view="todo-list",method="GET",le="+Inf"} 1', text)
+        self.assertGreaterEqual(self.sample(text, 'api_request_queries_sum', 'todo-list'), 2)
+        self.assertGreater(self.sample(text, 'api_request_query_duration_seconds_sum', 'todo-list'), 0)
+        self.assertGreater(self.sample(text, 'api_request_serialize_duration_seconds_sum', 'todo-detail'), 0)
+        self.assertGreater(self.sample(text, 'api_response_size_bytes_sum', 'todo-list'), 0)
+
+    async def test_async_view_queries_are_counted(self):
+        await sync_to_async(self.make_todos)(2)
+        await self.async_client.get(
+            reverse('async_todo_list'), headers={'Authorization': f'Bearer {AccessToken.for_user(self.user)}'},
+        )
+        text = request_metrics.render()
+        self.assertGreaterEqual(self.sample(text, 'api_request_queries_sum', 'async_todo_list'), 1)
+
+    def test_slow_requests_are_logged_with_queries(self):
+        with override_settings(SLOW_REQUEST_MS=0), self.assertLogs('api.metrics', 'WARNING') as logs:
+            self.client.get(self.list_url)
+        self.assertIn('(todo-list) 200', logs.output[0])
+        self.assertIn('SELECT', logs.output[0])
+
+    def test_metrics_token(self):
+        with override_settings(METRICS_TOKEN='scrape-me'):
+            self.assertEqual(self.client.get(self.metrics_url).status_code, 401)
+            response = self.client.get(self.metrics_url, headers={'Authorization': 'Bearer scrape-me'})
+            self.assertEqual(response.status_code, 200)
+
+        # no token configured: closed, except for local development
+        with override_settings(METRICS_TOKEN=None):
+            self.assertEqual(self.client.get(self.metrics_url).status_code, 403)
+        with override_settings(METRICS_TOKEN=None, DEBUG=True):
+            self.assertEqual(self.client.get(self.metrics_url).status_code, 200)
+
+    def test_list_cache_lookups_are_published(self):
+        self.make_todos(2)
+        self.client.get(self.list_url)
+        self.client.get(self.list_url)
+        stats = todo_list_cache.stats()
+        text = request_metrics.render()
+        self.assertIn(f'api_todo_list_cache_lookups_total{{result="hit"}} {stats["hits"]}\n', text)
+        self.assertIn(f'api_todo_list_cache_lookups_total{{result="miss"}} {stats["misses"]}\n', text)
+        self.assertGreaterEqual(stats['hits'], 1)
+
+    def test_unknown_methods_share_one_label(self):
+        self.client.generic('BREW', self.list_url)
+        self.client.generic('PROPFIND', self.list_url)
+        text = request_metrics.render()
+        self.assertEqual(self.sample(text, 'api_request_duration_seconds_count', 'todo-list', 'other'), 2)
+        self.assertNotIn('BREW', text)
+
+
+class TodoSearchTests(TodoAPITestCase):
+    def search(self, query, **params):
+        response = self.client.get(self.list_url, {'q': query, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def titles(self, page):
+        return [todo['title'] for todo in page['results']]
+
+    def test_ranked_prefix_search_of_own_todos(self):
+        for title in ['buy oat milk and some other groceries', 'Milk', 'bread', 'Café crème']:
+            Todo.objects.create(user=self.user, title=title)
+        Todo.objects.create(user=self.other, title='milk')
+
+        self.assertEqual(self.titles(self.search('mil')), ['Milk', 'buy oat milk and some other groceries'])
+        self.assertEqual(self.titles(self.search('buy MI')), ['buy oat milk and some other groceries'])
+        self.assertEqual(self.titles(self.search('cafe')), ['Café crème'])
+        self.assertEqual(self.titles(self.search('butter')), [])
+        self.assertEqual(self.titles(self.search('"*')), [])
+
+    def test_index_follows_writes(self):
+        todo = Todo.objects.create(user=self.user, title='call mom')
+        self.make_todos(3)
+        self.assertEqual(len(self.search('todo')['results']), 3)
+
+        self.client.patch(reverse('todo-detail', args=[todo.id]), {'title': 'call dad'}, format='json')
+        self.assertEqual(self.titles(self.search('dad')), ['call dad'])
+        self.assertEqual(self.titles(self.search('mom')), [])
+
+        self.client.delete(reverse('todo-detail', args=[todo.id]))
+        self.assertEqual(self.titles(self.search('call')), [])
+
+        # bulk writes bypass signals and save(), only the database triggers see them
+        Todo.objects.filter(user=self.user).update(title='water plants')
+        self.assertEqual(len(self.search('plants')['results']), 3)
+        Todo.objects.filter(user=self.user).update(user=self.other)
+        self.assertEqual(search_todo_ids(self.user.id, 'plants'), [])
+        self.assertEqual(len(search_todo_ids(self.other.id, 'plants')), 3)
+
+    @skipUnless(connection.vendor == 'sqlite', 'SQLite keeps the index with triggers')
+    def test_index_triggers_exist(self):
+        # a migration that rebuilds api_todo on SQLite silently drops them
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'api_todo'")
+            triggers = {row[0] for row in cursor.fetchall()}
+        self.assertLessEqual({'api_todo_fts_insert', 'api_todo_fts_update', 'api_todo_fts_delete'}, triggers)
+
+    @skipUnless(connection.vendor == 'sqlite', 'SQLite keys the index on (user_id << 32) + id')
+    def test_ids_past_the_rowid_range_are_refused(self):
+        # its rowid would be the one of the next user's todo 1
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Todo.objects.create(id=2 ** 32 + 1, user=self.user, title='overflow')
+        self.assertFalse(Todo.objects.filter(title='overflow').exists())
+
+    def test_search_is_scoped_to_the_user(self):
+        Todo.objects.bulk_create(Todo(user=self.other, title=f'milk {i}') for i in range(50))
+        mine = Todo.objects.create(user=self.user, title='milk')
+        self.assertEqual([todo['id'] for todo in self.search('milk')['results']], [mine.id])
+        self.assertEqual(len(search_todo_ids(self.other.id, 'milk')), 50)
+        self.assertNotIn(mine.id, search_todo_ids(self.other.id, 'milk'))
+
+    def test_pages_filters_and_fields(self):
+        self.make_todos(5, completed=True)
+        self.make_todos(2)
+
+        page = self.search('todo', page_size=2, completed='true')
+        ids = [todo['id'] for todo in page['results']]
+        self.assertIsNone(page['previous'])
+        while page['next']:
+            page = self.client.get(page['next']).json()
+            ids += [todo['id'] for todo in page['results']]
+        self.assertIsNotNone(page['previous'])
+        self.assertEqual(sorted(ids), list(
+            Todo.objects.filter(user=self.user, completed=True).order_by('id').values_list('id', flat=True)
+        ))
+
+        page = self.search('todo', fields='title', page_size=1)
+        self.assertEqual(page['results'], [{'title': 'todo 0'}])
+        indented = self.client.get(self.list_url, {'q': 'todo', 'page_size': 1},
+                                   HTTP_ACCEPT='application/json; indent=2').json()
+        self.assertEqual(indented['results'][0]['title'], 'todo 0')
+
+
+class TokenBlacklistTests(TodoAPITestCase):
+    def setUp(self):
+        super().setUp()
+        token_blacklist.clear()
+        self.client.force_authenticate(None)
+
+    def refresh(self, token):
+        return self.client.post(reverse('token_refresh'), {'refresh': token}, format='json')
+
+    def test_rotated_refresh_token_is_refused(self):
+        first = self.client.post(reverse('token_obtain_pair'), {'username': 'alice', 'password': 'secret-pass'},
+                                 format='json').json()['refresh']
+        response = self.refresh(first)
+        self.assertEqual(response.status_code, 200)
+        second = response.json()['refresh']
+
+        self.assertEqual(self.refresh(first).status_code, 401)
+        self.assertEqual(self.refresh(second).status_code, 200)
+        self.assertEqual(RevokedToken.objects.count(), 2)
+
+    def test_token_can_only_be_revoked_once(self):
+        token = str(RevocableRefreshToken.for_user(self.user))
+        RevocableRefreshToken(token).blacklist()
+        # a concurrent refresh that verified the token before it was revoked
+        with self.assertRaises(TokenError):
+            RevocableRefreshToken(token, verify=False).blacklist()
+
+    def test_checks_of_unrevoked_tokens_skip_the_database(self):
+        token_blacklist.sync()
+        with self.assertNumQueries(0):
+            self.assertFalse(token_blacklist.is_revoked('never-revoked'))
+
+        # revoked by another process: seen once the filter syncs
+        RevokedToken.objects.create(jti='elsewhere', expires_at=timezone.now() + timedelta(days=1))
+        token_blacklist.synced_at -= token_blacklist.sync_interval
+        self.assertTrue(token_blacklist.is_revoked('elsewhere'))
+
+    def test_bloom_filter(self):
+        bloom = BloomFilter(1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f'jti-{i}')
+        self.assertTrue(all(f'jti-{i}' in bloom for i in range(1000)))
+        self.assertLess(sum(f'other-{i}' in bloom for i in range(10_000)), 300)
+
+    def test_purge_deletes_expired_rows(self):
+        now = timezone.now()
+        for i in range(3):
+            RevokedToken.objects.create(jti=f'old-{i}', expires_at=now - timedelta(minutes=1))
+        RevokedToken.objects.create(jti='live', expires_at=now + timedelta(days=1))
+
+        out = io.StringIO()
+        call_command('purge_revoked_tokens', batch_size=2, stdout=out)
+        self.assertIn('Deleted 3', out.getvalue())
+        self.assertEqual(list(RevokedToken.objects.values_list('jti', flat=True)), ['live'])
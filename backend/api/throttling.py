@@ -0,0 +1,65 @@
+from django.core.cache import caches
+from django.utils.connection import ConnectionProxy
+from rest_framework.settings import api_settings
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class CounterRateThrottle(SimpleRateThrottle):
+    """
+    Fixed-window variant of ``SimpleRateThrottle``: one atomic counter per key and
+    window (``cache.add`` + ``cache.incr``) instead of a list of request timestamps
+    that is read, trimmed and written back on every call. The store is the
+    ``throttle`` cache alias, so all workers share it once that alias points at a
+    shared backend.
+    """
+
+    # a proxy, like DRF's default_cache: each thread resolves its own backend instance
+    cache = ConnectionProxy(caches, 'throttle')
+
+    @property
+    def THROTTLE_RATES(self):
+        # DRF binds the rates when the class is defined; read them when the throttle is
+        # created so override_settings(REST_FRAMEWORK=...) applies, a None rate lets all in
+        return api_settings.DEFAULT_THROTTLE_RATES
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        window = int(self.now // self.duration)
+        key = f'{self.key}:{window}'
+        self.cache.add(key, 0, self.duration)
+        try:
+            count = self.cache.incr(key)
+        except ValueError:
+            # expired between add() and incr(), the window is over anyway
+            self.cache.set(key, 1, self.duration)
+            count = 1
+
+        self.window_end = (window + 1) * self.duration
+        return count <= self.num_requests
+
+    def wait(self):
+        return max(self.window_end - self.now, 0)
+
+
+class LoginIPThrottle(CounterRateThrottle):
+    scope = 'login_ip'
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {'scope': self.scope, 'ident': self.get_ident(request)}
+
+
+class LoginUsernameThrottle(CounterRateThrottle):
+    scope = 'login_username'
+
+    def get_cache_key(self, request, view):
+        username = request.data.get('username') if hasattr(request.data, 'get') else None
+        if not isinstance(username, str) or not username:
+            return None
+        return self.cache_format % {'scope': self.scope, 'ident': username.strip().lower()[:150]}
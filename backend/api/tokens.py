@@ -0,0 +1,27 @@
+from datetime import datetime, timezone
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .blacklist import token_blacklist
+
+
+class RevocableRefreshToken(RefreshToken):
+    """
+    Refresh token checked against ``api.blacklist`` instead of simplejwt's
+    token_blacklist app, which records every token ever issued.
+    """
+
+    def verify(self):
+        super().verify()
+        if token_blacklist.is_revoked(self[api_settings.JTI_CLAIM]):
+            raise TokenError(_('Token is blacklisted'))
+
+    def blacklist(self):
+        # called by TokenRefreshSerializer on rotation; of two concurrent refreshes
+        # with the same token only one gets to revoke it, the other is refused
+        expires_at = datetime.fromtimestamp(self['exp'], tz=timezone.utc)
+        if not token_blacklist.revoke(self[api_settings.JTI_CLAIM], expires_at):
+            raise TokenError(_('Token is blacklisted'))
@@ -2,6 +2,8 @@ from django.urls import path, include
 from rest_framework_simplejwt.views import TokenRefreshView
 from rest_framework.routers import DefaultRouter
 
+from .async_views import AsyncRegisterView, AsyncTodoDetailView, AsyncTodoEventsView, AsyncTodoListView
+from .metrics import metrics_view
 from .views import CustomTokenObtainPairView, RegisterView, TodoViewSet
 
 router = DefaultRouter()
@@ -12,5 +14,10 @@ urlpatterns = [
     path('register/', RegisterView.as_view(), name='register'),
     path('token/', CustomTokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+    path('async/register/', AsyncRegisterView.as_view(), name='async_register'),
+    path('async/todos/', AsyncTodoListView.as_view(), name='async_todo_list'),
+    path('async/todos/events/', AsyncTodoEventsView.as_view(), name='async_todo_events'),
+    path('async/todos/<int:pk>/', AsyncTodoDetailView.as_view(), name='async_todo_detail'),
+    path('metrics/', metrics_view, name='metrics'),
     path('', include(router.urls)),
 ]
\ No newline at end of file
@@ -1,31 +1,423 @@
+import hashlib
+import json
+
 from rest_framework_simplejwt.views import TokenObtainPairView
-from .serializers import CustomTokenObtainPairSerializer, UserSerializer, TodoSerializer
+from .serializers import (
+    CustomTokenObtainPairSerializer, UserSerializer, TodoSerializer, TodoBulkSerializer, TodoRowSerializer,
+    TodoSyncSerializer,
+)
 
 from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Q
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 from rest_framework import generics,viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.urls import replace_query_param
 
-from .models import Todo
+from .cache import todo_list_cache
+from .events import todo_events
+from .metrics import timed_serialization
+from .models import Todo, TodoTombstone, TodoVersion
+from .pagination import TodoCursorPagination, TodoSearchPagination
+from .renderers import NDJSONRenderer
+from .search import search_todo_ids
+from .throttling import LoginIPThrottle, LoginUsernameThrottle
 
 # token
 class CustomTokenObtainPairView(TokenObtainPairView):
     serializer_class = CustomTokenObtainPairSerializer
+    throttle_classes = [LoginIPThrottle, LoginUsernameThrottle]
 
 # user 
 class RegisterView(generics.CreateAPIView):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [AllowAny]
+    throttle_classes = [LoginIPThrottle, LoginUsernameThrottle]
 
 # todo
 class TodoViewSet(viewsets.ModelViewSet):
     queryset = Todo.objects.all()
     serializer_class = TodoSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = TodoCursorPagination
+    search_pagination_class = TodoSearchPagination
+    export_chunk_size = 2000
+    import_batch_size = 1000
+
+    def get_requested_fields(self):
+        # ?fields=id,completed -> only these columns are selected and serialized
+        fields = self.request.query_params.get('fields')
+        if not fields or self.request.method != 'GET':
+            return None
+
+        fields = [name.strip() for name in fields.split(',') if name.strip()]
+        unknown = set(fields) - set(TodoSerializer.Meta.fields)
+        if unknown:
+            raise ValidationError({'fields': f"Unknown fields: {', '.join(sorted(unknown))}"})
+        return fields
+
+    def get_completed_filter(self):
+        # ?completed=true|false is answered from the (user, completed, id) index
+        completed = self.request.query_params.get('completed')
+        if completed is None:
+            return None
+
+        try:
+            return {'true': True, '1': True, 'false': False, '0': False}[completed.lower()]
+        except KeyError:
+            raise ValidationError({'completed': 'Expected true or false'})
+
+    def get_search_query(self):
+        # ?q=milk bre -> ranked full-text search, see api.search
+        query = self.request.query_params.get('q', '').strip()
+        return query or None
 
     def get_queryset(self):
-        return Todo.objects.filter(user=self.request.user)
+        queryset = Todo.objects.filter(user_id=self.request.user.id)
+
+        completed = self.get_completed_filter()
+        if completed is not None:
+            queryset = queryset.with_completed(completed)
+
+        fields = self.get_requested_fields()
+        if fields is not None:
+            # the cursor is built from id, so it is always loaded
+            queryset = queryset.only('id', *fields)
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault('fields', self.get_requested_fields())
+        return super().get_serializer(*args, **kwargs)
+
+    def get_validators(self):
+        # The user's todo version changes with every write, so it validates any list
+        # page or item: ETag/Last-Modified are known before a single todo is read.
+        version, updated_at = TodoVersion.current(self.request.user.id)
+        variant = hashlib.sha1('|'.join([
+            self.request.get_full_path(), self.request.accepted_media_type or '',
+        ]).encode()).hexdigest()[:16]
+        etag = quote_etag(f'{self.request.user.id}-{version}-{variant}')
+        last_modified = int(updated_at.timestamp()) if updated_at else None
+        return etag, last_modified
+
+    def conditional(self, handler, request, *args, **kwargs):
+        etag, last_modified = self.get_validators()
+        self.etag = etag
+        response = get_conditional_response(request._request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = handler(request, *args, **kwargs)
+
+        if response.status_code in (200, 304):
+            response.headers['ETag'] = etag
+            if last_modified is not None:
+                response.headers['Last-Modified'] = http_date(last_modified)
+            response.headers['Cache-Control'] = 'private, no-cache'
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional(self.cached_list, request, *args, **kwargs)
+
+    def cached_list(self, request, *args, **kwargs):
+        # the ETag names this exact page at the current version, so it is the cache key
+        if request.accepted_renderer.format != 'json':
+            return self.search_list(request) if self.get_search_query() else super().list(request, *args, **kwargs)
+
+        content = todo_list_cache.get(request.user.id, self.etag)
+        if content is None:
+            content = self.render_list(request)
+            todo_list_cache.set(request.user.id, self.etag, content)
+        return HttpResponse(content, content_type=request.accepted_media_type)
+
+    def render_list(self, request):
+        if 'indent' in request.accepted_media_type:
+            response = self.search_list(request) if self.get_search_query() else super().list(request)
+            return request.accepted_renderer.render(
+                response.data, request.accepted_media_type, self.get_renderer_context(),
+            )
+
+        # rows go from the cursor to JSON as tuples; the paginator only needs row.id
+        fast = TodoRowSerializer(self.get_requested_fields())
+        columns = fast.row_columns + ([] if 'id' in fast.row_columns else ['id'])
+        queryset = self.filter_queryset(self.get_queryset()).values_list(*columns, named=True)
+        if self.get_search_query():
+            ids, paginator = self.search(request)
+            found = {row.id: row for row in queryset.filter(id__in=ids)}
+            rows = [found[pk] for pk in ids if pk in found]
+        else:
+            paginator = self.paginator
+            rows = self.paginate_queryset(queryset)
+        if len(columns) > len(fast.row_columns):
+            rows = [row[:-1] for row in rows]
+        with timed_serialization():
+            return fast.render_page(rows, paginator.get_next_link(), paginator.get_previous_link())
+
+    def search(self, request):
+        # one page of ?q= result ids, best match first, and the paginator for its links
+        paginator = self.search_pagination_class()
+        query, completed = self.get_search_query(), self.get_completed_filter()
+        ids = paginator.paginate_ids(request, lambda limit, offset: search_todo_ids(
+            request.user.id, query, completed, limit=limit, offset=offset,
+        ))
+        return ids, paginator
+
+    def search_list(self, request):
+        ids, paginator = self.search(request)
+        todos = self.get_queryset().in_bulk(ids)
+        serializer = self.get_serializer([todos[pk] for pk in ids if pk in todos], many=True)
+        return Response({
+            'next': paginator.get_next_link(),
+            'previous': paginator.get_previous_link(),
+            'results': serializer.data,
+        })
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional(super().retrieve, request, *args, **kwargs)
+
+    def publish(self, *events):
+        # the change feed hears about a write once it is committed
+        user_id = self.request.user.id
+        transaction.on_commit(lambda: todo_events.publish_many(user_id, events))
 
     def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+        serializer.save(user_id=self.request.user.id)
+        todo_list_cache.invalidate(self.request.user.id)
+        self.publish(('created', TodoSerializer(serializer.instance).data))
+
+    def perform_update(self, serializer):
+        serializer.save()
+        todo_list_cache.invalidate(self.request.user.id)
+        self.publish(('updated', TodoSerializer(serializer.instance).data))
+
+    def perform_destroy(self, instance):
+        pk = instance.pk
+        instance.delete()
+        todo_list_cache.invalidate(self.request.user.id)
+        self.publish(('deleted', {'id': pk}))
+
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        # {"create": [...], "update": [{"id": ..}, ..], "delete": [ids]} in one
+        # transaction: one INSERT, one UPDATE statement per batch and one DELETE
+        bulk = TodoBulkSerializer(data=request.data)
+        bulk.is_valid(raise_exception=True)
+        create, update, delete = (bulk.validated_data[key] for key in ('create', 'update', 'delete'))
+
+        if not (create or update or delete):
+            return Response({'created': [], 'updated': [], 'deleted': []})
+
+        errors = {}
+        creators = [TodoSerializer(data=item) for item in create]
+        for index, serializer in enumerate(creators):
+            if not serializer.is_valid():
+                errors.setdefault('create', {})[index] = serializer.errors
+
+        owned = Todo.objects.filter(user_id=request.user.id)
+        with transaction.atomic():
+            # one revision for the whole batch, taken first so it orders with other writers:
+            # the rows checked and counted below are the ones this batch changes
+            revision = TodoVersion.bump(request.user.id)
+            instances = owned.in_bulk([item['id'] for item in update])
+
+            updaters = []
+            for index, item in enumerate(update):
+                instance = instances.get(item['id'])
+                if instance is None:
+                    errors.setdefault('update', {})[index] = {'id': ['Not found.']}
+                    continue
+                serializer = TodoSerializer(instance, data=item, partial=True)
+                if not serializer.is_valid():
+                    errors.setdefault('update', {})[index] = serializer.errors
+                updaters.append(serializer)
+
+            doomed = dict(owned.filter(id__in=delete).values_list('id', 'completed'))
+            missing = set(delete) - set(doomed)
+            if missing:
+                errors['delete'] = {pk: ['Not found.'] for pk in sorted(missing)}
+
+            if errors:
+                raise ValidationError(errors)
+
+            created = Todo.objects.bulk_create(
+                Todo(user_id=request.user.id, revision=revision, **serializer.validated_data)
+                for serializer in creators
+            )
+            completed = sum(todo.completed for todo in created)
+
+            changed_fields, now = {'revision', 'updated_at'}, timezone.now()
+            for serializer in updaters:
+                if 'completed' in serializer.validated_data:
+                    completed += serializer.validated_data['completed'] - serializer.instance.completed
+                for name, value in serializer.validated_data.items():
+                    setattr(serializer.instance, name, value)
+                    changed_fields.add(name)
+                serializer.instance.revision, serializer.instance.updated_at = revision, now
+            if updaters:
+                Todo.objects.bulk_update([s.instance for s in updaters], sorted(changed_fields))
+
+            deleted = 0
+            if doomed:
+                TodoTombstone.objects.bulk_create(
+                    TodoTombstone(user_id=request.user.id, todo_id=pk, revision=revision) for pk in doomed
+                )
+                deleted, _ = owned.filter(id__in=doomed).delete()
+                completed -= sum(doomed.values())
+
+            # the batch's change to the user's counts, from the rows it wrote
+            TodoVersion.count(request.user.id, total=len(created) - deleted, completed=completed)
+        todo_list_cache.invalidate(request.user.id)
+
+        result = {
+            'created': TodoSerializer(created, many=True).data,
+            'updated': TodoSerializer([s.instance for s in updaters], many=True).data,
+            'deleted': delete,
+        }
+        self.publish(
+            *(('created', todo) for todo in result['created']),
+            *(('updated', todo) for todo in result['updated']),
+            *(('deleted', {'id': pk}) for pk in delete),
+        )
+        return Response(result)
+
+    @action(detail=False, methods=['get'], renderer_classes=[NDJSONRenderer, JSONRenderer])
+    def export(self, request):
+        # one JSON object per line, read with a chunked cursor: memory stays flat
+        fast = TodoRowSerializer(self.get_requested_fields())
+        rows = self.get_queryset().order_by('id').values_list(*fast.row_columns).iterator(
+            chunk_size=self.export_chunk_size,
+        )
+        response = StreamingHttpResponse(
+            fast.render_ndjson(rows, self.export_chunk_size), content_type=NDJSONRenderer.media_type,
+        )
+        response.headers['Content-Disposition'] = 'attachment; filename="todos.ndjson"'
+        return response
+
+    @action(detail=False, methods=['post'], url_path='import', url_name='import', parser_classes=[])
+    def import_todos(self, request):
+        # NDJSON body of {"title": .., "completed": ..} lines, inserted in batches; the
+        # whole import is one transaction and a bad line rejects all of it
+        imported, completed, batch, revision = 0, 0, [], None
+        lines = iter(request.stream.readline, b'') if request.stream else ()
+
+        with transaction.atomic():
+            for number, line in enumerate(lines, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    data = json.loads(line)
+                except ValueError as exc:
+                    raise ValidationError({'line': number, 'errors': [f'Invalid JSON: {exc}']})
+
+                serializer = TodoSerializer(data=data)
+                if not serializer.is_valid():
+                    raise ValidationError({'line': number, 'errors': serializer.errors})
+                if revision is None:
+                    revision = TodoVersion.bump(request.user.id)
+                batch.append(Todo(user_id=request.user.id, revision=revision, **serializer.validated_data))
+                completed += batch[-1].completed
+
+                if len(batch) >= self.import_batch_size:
+                    Todo.objects.bulk_create(batch)
+                    imported, batch = imported + len(batch), []
+
+            if batch:
+                Todo.objects.bulk_create(batch)
+                imported += len(batch)
+            if imported:
+                TodoVersion.count(request.user.id, total=imported, completed=completed)
+        todo_list_cache.invalidate(request.user.id)
+        if imported:
+            # too many rows to push one by one, listeners refetch the list instead
+            self.publish(('reset', {}))
+
+        return Response({'imported': imported})
+
+    @action(detail=False, methods=['get'])
+    def summary(self, request):
+        # total / completed / open counts, kept on the user's TodoVersion row by every
+        # write: one primary-key read however many todos the user has
+        return Response(TodoVersion.summary(request.user.id))
+
+    @staticmethod
+    def sync_position(revision, pk):
+        after = Q(revision__gt=revision)
+        return after if pk is None else after | Q(revision=revision, id__gt=pk)
+
+    @action(detail=False, methods=['get'])
+    def sync(self, request):
+        # ?since=<revision>: the todos created or changed and the ids deleted after it,
+        # read from the (user, revision) indexes; `revision` is the next since once `next`
+        # is null. since=0, a revision this server never handed out, or one older than the
+        # purged tombstones gets every todo instead (`full`: the client starts over).
+        # Pages follow `next`: the snapshot revision is pinned in its cursor, changed rows
+        # come in (revision, id) order, then the deleted ids, so no page is unbounded.
+        try:
+            since = int(request.query_params.get('since', 0))
+        except ValueError:
+            raise ValidationError({'since': 'Expected an integer revision'})
+        if since < 0:
+            raise ValidationError({'since': 'Expected an integer revision'})
+
+        revision, horizon = TodoVersion.sync_bounds(request.user.id)
+        full = since == 0 or since > revision or since < horizon
+        # cursor: <pinned revision>.<f: full rows | c: changed rows | d: deleted ids>.<revision>.<id or empty>
+        # the position is after (revision, id); an id of None is after the whole revision
+        # (rows written before revisions existed have revision 0, a full resync includes them)
+        kind, after_revision, after_id = ('f', -1, None) if full else ('c', since, None)
+        cursor = request.query_params.get('cursor')
+        if cursor:
+            try:
+                pinned, cursor_kind, cursor_revision, cursor_id = cursor.split('.')
+                pinned, cursor_revision = int(pinned), int(cursor_revision)
+                cursor_id = int(cursor_id) if cursor_id else None
+            except ValueError:
+                raise ValidationError({'cursor': 'Invalid cursor'})
+            if cursor_kind not in ('f', 'c', 'd') or pinned > revision:
+                raise ValidationError({'cursor': 'Invalid cursor'})
+            # a delta whose tombstones were purged mid-way starts over as a full resync
+            if cursor_kind == 'f' or not full:
+                revision, full = pinned, cursor_kind == 'f'
+                kind, after_revision, after_id = cursor_kind, cursor_revision, cursor_id
+
+        page_size = TodoCursorPagination().get_page_size(request)
+        changed, deleted, next_position = [], [], None
+        if kind in ('f', 'c'):
+            # changes committed after the pinned revision are left for the next sync
+            after = self.sync_position(after_revision, after_id)
+            rows = list(Todo.objects.filter(after, user_id=request.user.id, revision__lte=revision)
+                        .order_by('revision', 'id')[:page_size + 1])
+            changed = rows[:page_size]
+            if len(rows) > page_size:
+                next_position = (kind, changed[-1].revision, changed[-1].id)
+            elif kind == 'c':
+                kind, after_revision, after_id = 'd', since, None
+        if kind == 'd' and next_position is None:
+            room = page_size - len(changed)
+            after = self.sync_position(after_revision, after_id)
+            rows = list(TodoTombstone.objects.filter(after, user_id=request.user.id, revision__lte=revision)
+                        .order_by('revision', 'id').values_list('revision', 'id', 'todo_id')[:room + 1])
+            deleted = [todo_id for _, _, todo_id in rows[:room]]
+            if len(rows) > room:
+                last_revision, last_id, _ = rows[room - 1] if room else (after_revision, after_id, None)
+                next_position = ('d', last_revision, last_id)
 
+        next_url = None
+        if next_position:
+            kind, after_revision, after_id = next_position
+            cursor = f'{revision}.{kind}.{after_revision}.{"" if after_id is None else after_id}'
+            next_url = replace_query_param(request.build_absolute_uri(), 'cursor', cursor)
+        return Response({
+            'revision': revision,
+            'full': full,
+            'changed': TodoSyncSerializer(changed, many=True).data,
+            'deleted': deleted,
+            'next': next_url,
+        })
@@ -3,6 +3,10 @@ ASGI config for backend project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Serve the project through this entry point (uvicorn, daphne) for the async views,
+in particular the async/todos/events/ change feed, which keeps one open response per
+client and is refused under WSGI.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
 """
@@ -1,6 +1,9 @@
+import os
 from pathlib import Path
 from datetime import timedelta
 
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -40,6 +43,8 @@ CORS_ALLOW_ALL_ORIGINS = True
 
 
 MIDDLEWARE = [
+    # first, so its timings cover every other middleware
+    'api.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -51,13 +56,24 @@ MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
 ]
 
+# api.middleware / api.metrics: requests slower than SLOW_REQUEST_MS are logged to
+# api.metrics with their queries (unset: off); api/metrics/ requires METRICS_TOKEN as a
+# bearer token, and without one is only served under DEBUG
+SLOW_REQUEST_MS = float(os.environ['SLOW_REQUEST_MS']) if os.environ.get('SLOW_REQUEST_MS') else None
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # api.throttling, applied to register/ and token/ before any password is hashed
+    'DEFAULT_THROTTLE_RATES': {
+        'login_ip': os.environ.get('LOGIN_IP_RATE', '30/min'),
+        'login_username': os.environ.get('LOGIN_USERNAME_RATE', '10/min'),
+    },
 }
 
 SIMPLE_JWT = {
@@ -83,7 +99,7 @@ SIMPLE_JWT = {
 
     "AUTH_TOKEN_CLASSES": ("rest_framework_simplejwt.tokens.AccessToken",),
     "TOKEN_TYPE_CLAIM": "token_type",
-    "TOKEN_USER_CLASS": "rest_framework_simplejwt.models.TokenUser",
+    "TOKEN_USER_CLASS": "api.authentication.TokenUser",
 
     "JTI_CLAIM": "jti",
 
@@ -92,7 +108,9 @@ SIMPLE_JWT = {
     "SLIDING_TOKEN_REFRESH_LIFETIME": timedelta(days=1),
 
     "TOKEN_OBTAIN_SERIALIZER": "rest_framework_simplejwt.serializers.TokenObtainPairSerializer",
-    "TOKEN_REFRESH_SERIALIZER": "rest_framework_simplejwt.serializers.TokenRefreshSerializer",
+    # rotation revokes the old refresh token in api.blacklist (the token_blacklist app
+    # is not installed: it keeps a row for every token ever issued)
+    "TOKEN_REFRESH_SERIALIZER": "api.serializers.RevocableTokenRefreshSerializer",
     "TOKEN_VERIFY_SERIALIZER": "rest_framework_simplejwt.serializers.TokenVerifySerializer",
     "TOKEN_BLACKLIST_SERIALIZER": "rest_framework_simplejwt.serializers.TokenBlacklistSerializer",
     "SLIDING_TOKEN_OBTAIN_SERIALIZER": "rest_framework_simplejwt.serializers.TokenObtainSlidingSerializer",
@@ -100,6 +118,13 @@ SIMPLE_JWT = {
 }
 
 
+# Seconds a user's is_active flag is trusted by api.authentication.CachedJWTAuthentication
+# before it is re-read; 0 authenticates from the token claims alone.
+JWT_USER_ACTIVE_CACHE_TTL = 60
+
+# api.blacklist: seconds before a token revoked by another process is seen by this
+# one's Bloom filter (a rotated refresh token is refused at once regardless)
+JWT_BLACKLIST_SYNC_INTERVAL = 5
 
 ROOT_URLCONF = 'backend.urls'
 
@@ -124,13 +149,144 @@ WSGI_APPLICATION = 'backend.wsgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
+#
+# Picked with DJANGO_DB_PROFILE:
+#   sqlite        (default) WAL journal, synchronous=NORMAL, busy timeout, writers take the
+#                 lock up front (BEGIN IMMEDIATE) and connections persist between requests
+#   sqlite-basic  Django's stock SQLite settings, kept for comparison
+#   postgres      persistent, health-checked connections, or a psycopg pool when
+#                 POSTGRES_POOL_MAX_SIZE is set (needs psycopg[pool])
+# `manage.py bench_db_writes --profiles ...` measures what each one buys.
+
+DB_PROFILE = os.environ.get('DJANGO_DB_PROFILE', 'sqlite')
+SQLITE_PATH = os.environ.get('SQLITE_PATH', BASE_DIR / 'db.sqlite3')
+
+DATABASE_PROFILES = {
+    'sqlite': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': SQLITE_PATH,
+        'CONN_MAX_AGE': None,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'init_command': (
+                'PRAGMA journal_mode=WAL;'
+                'PRAGMA synchronous=NORMAL;'
+                'PRAGMA temp_store=MEMORY;'
+                'PRAGMA cache_size=-20000;'
+            ),
+            'transaction_mode': 'IMMEDIATE',
+            # the busy timeout, in seconds; a PRAGMA busy_timeout in init_command would override it
+            'timeout': 20,
+        },
+    },
+    'sqlite-basic': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': SQLITE_PATH,
+    },
+    'postgres': {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.environ.get('POSTGRES_DB', 'todos'),
+        'USER': os.environ.get('POSTGRES_USER', 'todos'),
+        'PASSWORD': os.environ.get('POSTGRES_PASSWORD', ''),
+        'HOST': os.environ.get('POSTGRES_HOST', 'localhost'),
+        'PORT': os.environ.get('POSTGRES_PORT', '5432'),
+        'CONN_MAX_AGE': int(os.environ.get('POSTGRES_CONN_MAX_AGE', 60)),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {},
+    },
+}
+
+if os.environ.get('POSTGRES_POOL_MAX_SIZE'):
+    # the pool replaces persistent connections, Django refuses to combine both
+    DATABASE_PROFILES['postgres']['CONN_MAX_AGE'] = 0
+    DATABASE_PROFILES['postgres']['OPTIONS']['pool'] = {
+        'min_size': int(os.environ.get('POSTGRES_POOL_MIN_SIZE', 2)),
+        'max_size': int(os.environ['POSTGRES_POOL_MAX_SIZE']),
+        'timeout': 10,
+    }
+
+if DB_PROFILE not in DATABASE_PROFILES:
+    raise ImproperlyConfigured(
+        f'Unknown DJANGO_DB_PROFILE {DB_PROFILE!r}; expected one of: {", ".join(DATABASE_PROFILES)}'
+    )
 
 DATABASES = {
+    'default': DATABASE_PROFILES[DB_PROFILE],
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # rendered todo list pages, see api.cache.TodoListCache; any backend can be plugged in
+    'todos': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'todo-lists',
+        'TIMEOUT': 300,
+        'OPTIONS': {
+            # users kept; culling one entry at a time makes locmem a strict LRU
+            'MAX_ENTRIES': 10_000,
+            'CULL_FREQUENCY': 10_000,
+        },
+    },
+    # login/register rate counters of api.throttling; point it at a shared backend
+    # (Redis, Memcached) so the limits hold across worker processes
+    'throttle': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'throttle',
+        'OPTIONS': {
+            'MAX_ENTRIES': 100_000,
+        },
+    },
+}
+
+TODO_LIST_CACHE_ALIAS = 'todos'
+TODO_LIST_CACHE_PAGES_PER_USER = 16
+
+# api.events change feed (async/todos/events/): events kept per user for
+# Last-Event-ID replay, and how far one stream may fall behind before it is reset
+TODO_EVENTS_HISTORY_SIZE = 1000
+TODO_EVENTS_QUEUE_SIZE = 1000
+
+# Delta sync (todos/sync/): how long tombstones of deleted todos are kept before
+# `manage.py purge_todo_tombstones` deletes them; clients that have not synced for
+# longer get a full resync
+TODO_TOMBSTONE_RETENTION = timedelta(days=int(os.environ.get('TODO_TOMBSTONE_RETENTION_DAYS', 30)))
+
+
+# Password hashing
+# https://docs.djangoproject.com/en/5.0/topics/auth/passwords/
+#
+# PASSWORD_HASHER picks the hasher for new and re-encoded passwords: pbkdf2 (Django's
+# default), scrypt or argon2 (needs argon2-cffi), the last two with the parameters
+# below. The others stay listed so existing hashes keep verifying.
+
+PASSWORD_HASHER = os.environ.get('PASSWORD_HASHER', 'pbkdf2')
+
+_PASSWORD_HASHERS = {
+    'pbkdf2': 'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'scrypt': 'api.hashers.TunedScryptPasswordHasher',
+    'argon2': 'api.hashers.TunedArgon2PasswordHasher',
 }
+if PASSWORD_HASHER not in _PASSWORD_HASHERS:
+    raise ImproperlyConfigured(
+        f'Unknown PASSWORD_HASHER {PASSWORD_HASHER!r}; expected one of: {", ".join(_PASSWORD_HASHERS)}'
+    )
+PASSWORD_HASHERS = [_PASSWORD_HASHERS[PASSWORD_HASHER]] + [
+    hasher for name, hasher in _PASSWORD_HASHERS.items() if name != PASSWORD_HASHER
+] + ['django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher']
+
+SCRYPT_WORK_FACTOR = 2**14
+SCRYPT_BLOCK_SIZE = 8
+SCRYPT_PARALLELISM = 1
+
+ARGON2_TIME_COST = 2
+ARGON2_MEMORY_COST = 64 * 1024
+ARGON2_PARALLELISM = 1
 
 
 # Password validation
@@ -1,45 +1,130 @@
-import React, { useState, useEffect, useContext } from 'react';
+import React, { useState, useEffect, useContext, useRef } from 'react';
 import axios from 'axios';
 import AuthContext from '../context/Auth';
 import '../styles/TodoList.css';
 
+const API_URL = 'http://127.0.0.1:8000/api/';
+
+// upsert or remove one todo, so a change applied locally and then echoed by the
+// event stream is not applied twice
+const applyChange = (todos, type, todo) => {
+    if (type === 'deleted') return todos.filter(item => item.id !== todo.id);
+    if (todos.some(item => item.id === todo.id)) {
+        return todos.map(item => item.id === todo.id ? todo : item);
+    }
+    return [...todos, todo];
+};
+
 const TodoList = () => {
     const [todos, setTodos] = useState([]);
     const [newTodo, setNewTodo] = useState('');
     const user = useContext(AuthContext);
 
     const api = axios.create({
-        baseURL: 'http://127.0.0.1:8000/api/',
+        baseURL: API_URL,
         headers: {
             'Content-Type': 'application/json',
             'Authorization': `Bearer ${user.tokens.access}`
         },
     });
 
+    // the stream outlives many token refreshes: read the current auth on every reconnect
+    const auth = useRef(user);
+    auth.current = user;
+
     useEffect(() => {
+        const controller = new AbortController();
+        listenForChanges(controller.signal);
         fetchTodos();
+        return () => controller.abort();
     }, []);
 
+    const listenForChanges = async (signal) => {
+        // server-sent events over fetch (EventSource cannot send the Authorization
+        // header); reconnects resume from the last event id and back off exponentially
+        let lastEventId = null;
+        let delay = 1000;
+        while (!signal.aborted) {
+            try {
+                const token = auth.current.tokens.access;
+                const headers = { Authorization: `Bearer ${token}` };
+                if (lastEventId) headers['Last-Event-ID'] = lastEventId;
+                const response = await fetch(`${API_URL}async/todos/events/`, { headers, signal });
+                // not served over ASGI: retrying will not help
+                if (response.status === 501) return;
+                if (response.status === 401) {
+                    // refresh once if nobody has replaced the rejected token yet
+                    if (auth.current.tokens.access === token) await auth.current.refreshToken();
+                    throw new Error('event stream: 401');
+                }
+                if (!response.ok) throw new Error(`event stream: ${response.status}`);
+                delay = 1000;
+
+                const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+                let buffer = '';
+                let expired = false;
+                for (;;) {
+                    const { value, done } = await reader.read();
+                    if (done) break;
+                    buffer += value;
+                    let end;
+                    while ((end = buffer.indexOf('\n\n')) !== -1) {
+                        const fields = {};
+                        for (const line of buffer.slice(0, end).split('\n')) {
+                            const colon = line.indexOf(': ');
+                            if (colon > 0) fields[line.slice(0, colon)] = line.slice(colon + 2);
+                        }
+                        buffer = buffer.slice(end + 2);
+
+                        if (fields.id) lastEventId = fields.id;
+                        if (fields.event === 'reset') {
+                            fetchTodos();
+                        } else if (fields.event === 'expired') {
+                            // the server closes the stream when the access token runs out
+                            expired = true;
+                        } else if (fields.event) {
+                            const todo = JSON.parse(fields.data);
+                            setTodos(todos => applyChange(todos, fields.event, todo));
+                        }
+                    }
+                }
+                // reconnect right away with the refreshed token, back off on any other close
+                if (expired) continue;
+            } catch (error) {
+                if (signal.aborted) return;
+            }
+            await new Promise(resolve => setTimeout(resolve, delay * (0.5 + Math.random() / 2)));
+            delay = Math.min(delay * 2, 60000);
+        }
+    };
+
     const fetchTodos = async () => {
-        const response = await api.get('todos/');
-        setTodos(response.data);
+        // the list is cursor-paginated: follow `next` until the last page
+        let items = [];
+        let url = 'todos/';
+        while (url) {
+            const response = await api.get(url);
+            items = items.concat(response.data.results);
+            url = response.data.next;
+        }
+        setTodos(items);
     };
 
     const addTodo = async () => {
         if (newTodo.trim() === '') return;
         const response = await api.post('todos/', { title: newTodo, completed: false });
-        setTodos([...todos, response.data]);
+        setTodos(todos => applyChange(todos, 'created', response.data));
         setNewTodo('');
     };
 
     const deleteTodo = async (id) => {
         await api.delete(`todos/${id}/`);
-        setTodos(todos.filter(todo => todo.id !== id));
+        setTodos(todos => applyChange(todos, 'deleted', { id }));
     };
 
     const toggleTodo = async (id, completed) => {
-        await api.patch(`todos/${id}/`, { completed: !completed });
-        setTodos(todos.map(todo => todo.id === id ? { ...todo, completed: !completed } : todo));
+        const response = await api.patch(`todos/${id}/`, { completed: !completed });
+        setTodos(todos => applyChange(todos, 'updated', response.data));
     };
 
     return (
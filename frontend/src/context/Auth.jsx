@@ -94,6 +94,7 @@ export const AuthProvider = ({children}) => {
         login : login, 
         register : register,
         logout : logout,
+        refreshToken : refreshToken,
         tokens : tokens,
         user : user,
 
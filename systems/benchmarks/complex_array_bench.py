@@ -0,0 +1,87 @@
+"""
+ComplexArray против списка Complex: время поэлементных операций.
+
+Запуск из каталога systems:
+
+    python -m benchmarks.complex_array_bench [--size 200000] [--repeat 3]
+
+Части чисел - дроби со случайными числителями и знаменателями до 10**3. Точный
+режим сравнивается со списком Complex, быстрый режим (complex128) - с точным.
+Объекты Complex считаются на --object-size элементах и пересчитываются на один
+элемент. Печатает JSON с наносекундами на элемент и ускорением.
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+from classes.complex_array import ComplexArray
+from classes.rational_array import RationalArray
+
+OPERATIONS = {
+    "add": lambda a, b: a + b,
+    "mul": lambda a, b: a * b,
+    "div": lambda a, b: a / b,
+    "abs2": lambda a, b: a.abs2(),
+}
+
+
+def measure(function, repeat):
+    """
+    Медианное время вызова в секундах.
+
+    :param function: Функция без аргументов.
+    :param repeat: Количество запусков.
+    :return: Время, с.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def random_array(rng, size):
+    return ComplexArray(
+        RationalArray(rng.integers(1, 10**3, size), rng.integers(1, 10**3, size)),
+        RationalArray(rng.integers(-10**3, 10**3, size), rng.integers(1, 10**3, size)),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=200_000, help="Элементов в ComplexArray.")
+    parser.add_argument("--object-size", type=int, default=20_000, help="Элементов в списке Complex.")
+    parser.add_argument("--repeat", type=int, default=3, help="Запусков на замер, берётся медиана.")
+    options = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    a, b = random_array(rng, options.size), random_array(rng, options.size)
+    fast_a, fast_b = a.to_fast(), b.to_fast()
+    objects_a = a[:options.object_size].to_complexes()
+    objects_b = b[:options.object_size].to_complexes()
+
+    report = {"size": options.size, "ns_per_element": {}}
+    for name, operation in OPERATIONS.items():
+        exact = measure(lambda: operation(a, b), options.repeat) / options.size * 1e9
+        fast = measure(lambda: operation(fast_a, fast_b), options.repeat) / options.size * 1e9
+        if name == "abs2":
+            objects_run = lambda: [x.real * x.real + x.imaginary * x.imaginary for x in objects_a]
+        else:
+            objects_run = lambda: [operation(x, y) for x, y in zip(objects_a, objects_b)]
+        objects = measure(objects_run, options.repeat) / options.object_size * 1e9
+        report["ns_per_element"][name] = {
+            "complex_list": round(objects, 1),
+            "exact_array": round(exact, 1),
+            "fast_array": round(fast, 1),
+            "exact_speedup": round(objects / exact, 1),
+        }
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
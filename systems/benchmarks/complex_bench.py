@@ -0,0 +1,167 @@
+"""
+Сравнение Complex с прежней реализацией: время одной операции и циклов из умножений
+и делений.
+
+Запуск из каталога systems:
+
+    python -m benchmarks.complex_bench [--repeat 5] [--size 50000]
+
+Обе реализации работают поверх текущего Rational, так что разница - только в самом
+Complex. Печатает JSON: медиану времени в наносекундах на операцию у LegacyComplex
+(прежний класс: __dict__, проверка типов при каждом создании, временные Rational(0, 1)
+для проверки на ноль) и у текущего Complex, и их отношение.
+"""
+import argparse
+import json
+import random
+import time
+
+from classes.complex import Complex
+from classes.rational import Rational
+
+
+class LegacyComplex:
+    """
+    Прежняя реализация Complex, оставлена только для сравнения.
+    """
+
+    def __init__(self, real, imaginary=None):
+        if isinstance(real, LegacyComplex):
+            self._real = real.real
+            self._imaginary = real.imaginary
+        else:
+            self._real = self._convert_to_rational(real)
+            if imaginary is not None:
+                self._imaginary = self._convert_to_rational(imaginary)
+            else:
+                self._imaginary = Rational(0, 1)
+
+    @property
+    def real(self):
+        return self._real
+
+    @property
+    def imaginary(self):
+        return self._imaginary
+
+    def _convert_to_rational(self, value):
+        if isinstance(value, int):
+            return Rational(value, 1)
+        elif isinstance(value, Rational):
+            return value
+        else:
+            raise TypeError(f"Неподдерживаемый тип: {type(value)}")
+
+    def __add__(self, other):
+        if isinstance(other, LegacyComplex):
+            return LegacyComplex(self.real + other.real, self.imaginary + other.imaginary)
+        other_rational = self._convert_to_rational(other)
+        return LegacyComplex(self.real + other_rational, self.imaginary)
+
+    def __mul__(self, other):
+        if isinstance(other, LegacyComplex):
+            return LegacyComplex(
+                self.real * other.real - self.imaginary * other.imaginary,
+                self.real * other.imaginary + self.imaginary * other.real
+            )
+        other_rational = self._convert_to_rational(other)
+        return LegacyComplex(self.real * other_rational, self.imaginary * other_rational)
+
+    def __truediv__(self, other):
+        if isinstance(other, LegacyComplex):
+            if other.real == Rational(0, 1) and other.imaginary == Rational(0, 1):
+                raise ZeroDivisionError("Деление на ноль")
+            denominator = other.real * other.real + other.imaginary * other.imaginary
+            return LegacyComplex(
+                (self.real * other.real + self.imaginary * other.imaginary) / denominator,
+                (self.imaginary * other.real - self.real * other.imaginary) / denominator
+            )
+        other_rational = self._convert_to_rational(other)
+        if other_rational == Rational(0, 1):
+            raise ZeroDivisionError("Деление на ноль")
+        return LegacyComplex(self.real / other_rational, self.imaginary / other_rational)
+
+
+def power(cls, z, exponent):
+    # Прежний класс умеет только повторное умножение
+    if cls is Complex:
+        return z ** exponent
+    result = z
+    for _ in range(exponent - 1):
+        result = result * z
+    return result
+
+
+def multiply_add(cls, z, w, c):
+    if cls is Complex:
+        return z.fma(w, c)
+    return z * w + c
+
+
+OPERATIONS = {
+    "init": lambda cls, a, b, k: cls(k, k),
+    "add": lambda cls, a, b, k: a + b,
+    "mul": lambda cls, a, b, k: a * b,
+    "div": lambda cls, a, b, k: a / b,
+    "mul_int": lambda cls, a, b, k: a * k,
+    "div_int": lambda cls, a, b, k: a / k,
+    "mul_add": lambda cls, a, b, k: multiply_add(cls, a, b, k),
+    "pow_8": lambda cls, a, b, k: power(cls, a, 8),
+}
+
+
+def make_operands(cls, size, seed=0):
+    """
+    Случайные пары комплексных чисел с частями - дробями до 100/100 и целые множители.
+
+    :param cls: Класс комплексных чисел.
+    :param size: Количество пар.
+    :param seed: Зерно генератора, одинаковое для обоих классов.
+    :return: Список троек (a, b, k).
+    """
+    rng = random.Random(seed)
+
+    def number():
+        return cls(Rational(rng.randint(-100, 100), rng.randint(1, 100)), Rational(rng.randint(1, 100), rng.randint(1, 100)))
+
+    return [(number(), number(), rng.randint(1, 1000)) for _ in range(size)]
+
+
+def time_operation(cls, operation, operands, repeat):
+    """
+    Медианное время одной операции в наносекундах.
+
+    :param cls: Класс комплексных чисел.
+    :param operation: Функция операции из OPERATIONS.
+    :param operands: Операнды из make_operands.
+    :param repeat: Количество прогонов по всем операндам.
+    :return: Время на операцию, нс.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        for a, b, k in operands:
+            operation(cls, a, b, k)
+        timings.append((time.perf_counter_ns() - started) / len(operands))
+    timings.sort()
+    return round(timings[len(timings) // 2], 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=50_000, help="Количество пар операндов.")
+    parser.add_argument("--repeat", type=int, default=5, help="Прогонов на операцию, берётся медиана.")
+    options = parser.parse_args()
+
+    report = {"ns_per_op": {}}
+    operands = {cls: make_operands(cls, options.size) for cls in (LegacyComplex, Complex)}
+    for name, operation in OPERATIONS.items():
+        legacy = time_operation(LegacyComplex, operation, operands[LegacyComplex], options.repeat)
+        current = time_operation(Complex, operation, operands[Complex], options.repeat)
+        report["ns_per_op"][name] = {"legacy": legacy, "current": current, "speedup": round(legacy / current, 2)}
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
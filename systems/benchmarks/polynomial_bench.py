@@ -0,0 +1,98 @@
+"""
+Polynomial против вычислений по членам на объектах Rational.
+
+Запуск из каталога systems:
+
+    python -m benchmarks.polynomial_bench [--degrees 10 100 500] [--points 200] [--repeat 3]
+
+Коэффициенты - дроби со случайными числителями и знаменателями до 100. Сравниваются:
+значение в рациональной точке (sum c_i * x**i против схемы Горнера), значения в
+--points точках (цикл по точкам против одного прохода по RationalArray) и
+произведение многочленов (в столбик на Rational против Polynomial). Печатает JSON с
+медианным временем в миллисекундах и ускорением.
+"""
+import argparse
+import json
+import random
+import time
+
+from classes.polynomial import Polynomial
+from classes.rational import Rational
+from classes.rational_array import RationalArray
+
+
+def naive_value(coefficients, point):
+    result = Rational(0)
+    for i, c in enumerate(coefficients):
+        result = result + c * point ** i
+    return result
+
+
+def naive_product(a, b):
+    result = [Rational(0)] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            result[i + j] = result[i + j] + x * y
+    return result
+
+
+def measure(function, repeat):
+    """
+    Медианное время вызова в миллисекундах и результат последнего вызова.
+
+    :param function: Функция без аргументов.
+    :param repeat: Количество запусков.
+    :return: Кортеж (время, результат).
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return round(timings[len(timings) // 2] * 1000, 2), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--degrees", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--points", type=int, default=200, help="Точек в пакетном вычислении.")
+    parser.add_argument("--repeat", type=int, default=3, help="Запусков на замер, берётся медиана.")
+    options = parser.parse_args()
+
+    rng = random.Random(0)
+
+    def fraction():
+        return Rational(rng.randint(-100, 100), rng.randint(1, 100))
+
+    report = {"runs": []}
+    for degree in options.degrees:
+        a = [fraction() for _ in range(degree + 1)]
+        b = [fraction() for _ in range(degree + 1)]
+        p, q = Polynomial(a), Polynomial(b)
+        point = Rational(rng.randint(1, 100), rng.randint(1, 100))
+        points = [Rational(rng.randint(-100, 100), rng.randint(1, 100)) for _ in range(options.points)]
+        array = RationalArray.from_rationals(points)
+
+        cases = {
+            "value": (lambda: naive_value(a, point), lambda: p(point)),
+            "values": (lambda: [naive_value(a, x) for x in points], lambda: p(array).to_rationals()),
+            "product": (lambda: naive_product(a, b), lambda: list((p * q).coefficients)),
+        }
+        for name, (naive, engine) in cases.items():
+            naive_ms, expected = measure(naive, options.repeat)
+            engine_ms, result = measure(engine, options.repeat)
+            assert result == expected
+            report["runs"].append({
+                "case": name,
+                "degree": degree,
+                "naive_ms": naive_ms,
+                "polynomial_ms": engine_ms,
+                "speedup": round(naive_ms / engine_ms, 1),
+            })
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+RationalArray против списка Rational: время поэлементных операций.
+
+Запуск из каталога systems:
+
+    python -m benchmarks.rational_array_bench [--size 1000000] [--repeat 3]
+
+Дроби со случайными числителями и знаменателями до 10**6, так что операции идут в
+int64. Объекты Rational считаются на --object-size элементах и пересчитываются на
+один элемент. Печатает JSON с наносекундами на элемент и ускорением.
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+from classes.rational_array import RationalArray
+
+OPERATIONS = {
+    "add": lambda a, b: a + b,
+    "sub": lambda a, b: a - b,
+    "mul": lambda a, b: a * b,
+    "div": lambda a, b: a / b,
+    "lt": lambda a, b: a < b,
+}
+
+
+def measure(function, repeat):
+    """
+    Медианное время вызова в секундах.
+
+    :param function: Функция без аргументов.
+    :param repeat: Количество запусков.
+    :return: Время, с.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000, help="Элементов в RationalArray.")
+    parser.add_argument("--object-size", type=int, default=100_000, help="Элементов в списке Rational.")
+    parser.add_argument("--repeat", type=int, default=3, help="Запусков на замер, берётся медиана.")
+    options = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    a = RationalArray(rng.integers(-10**6, 10**6, options.size), rng.integers(1, 10**6, options.size))
+    b = RationalArray(rng.integers(1, 10**6, options.size), rng.integers(1, 10**6, options.size))
+    objects_a = a[:options.object_size].to_rationals()
+    objects_b = b[:options.object_size].to_rationals()
+
+    report = {"size": options.size, "ns_per_element": {}}
+    for name, operation in OPERATIONS.items():
+        array = measure(lambda: operation(a, b), options.repeat) / options.size * 1e9
+        objects = measure(
+            lambda: [operation(x, y) for x, y in zip(objects_a, objects_b)], options.repeat
+        ) / options.object_size * 1e9
+        report["ns_per_element"][name] = {
+            "rational_array": round(array, 1),
+            "rational_list": round(objects, 1),
+            "speedup": round(objects / array, 1),
+        }
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Сравнение Rational с прежней реализацией: время одной операции и память на объект.
+
+Запуск из каталога systems:
+
+    python -m benchmarks.rational_bench [--repeat 5] [--size 100000]
+
+Печатает JSON: для каждой операции медиану времени в наносекундах на операцию
+у LegacyRational (прежний класс: __dict__, цикл НОД на Python, временный
+Rational(other, 1) для целого операнда) и у текущего Rational, и их отношение.
+"""
+import argparse
+import json
+import random
+import time
+import tracemalloc
+
+from classes.rational import Rational
+
+
+class LegacyRational:
+    """
+    Прежняя реализация Rational, оставлена только для сравнения.
+    """
+
+    def __init__(self, n, m):
+        if not isinstance(n, int) or not isinstance(m, int):
+            raise TypeError("Числитель и знаменатель должны быть целыми числами (int)")
+        if m == 0:
+            raise ValueError("Знаменатель не может быть равен нулю")
+        self.__numerator = n
+        self.__denominator = m
+        self.__normalize()
+
+    def __normalize(self):
+        def gcd(a, b):
+            while b:
+                a, b = b, a % b
+            return a
+
+        common_divisor = gcd(abs(self.__numerator), abs(self.__denominator))
+        self.__numerator //= common_divisor
+        self.__denominator //= common_divisor
+        if self.__denominator < 0:
+            self.__numerator *= -1
+            self.__denominator *= -1
+
+    @property
+    def numerator(self):
+        return self.__numerator
+
+    @property
+    def denominator(self):
+        return self.__denominator
+
+    def _coerce(self, other):
+        if isinstance(other, int):
+            return LegacyRational(other, 1)
+        if not isinstance(other, LegacyRational):
+            raise TypeError("Операнд должен быть целым числом или Rational")
+        return other
+
+    def __add__(self, other):
+        other = self._coerce(other)
+        return LegacyRational(
+            self.numerator * other.denominator + self.denominator * other.numerator,
+            self.denominator * other.denominator
+        )
+
+    def __sub__(self, other):
+        other = self._coerce(other)
+        return LegacyRational(
+            self.numerator * other.denominator - self.denominator * other.numerator,
+            self.denominator * other.denominator
+        )
+
+    def __mul__(self, other):
+        other = self._coerce(other)
+        return LegacyRational(self.numerator * other.numerator, self.denominator * other.denominator)
+
+    def __truediv__(self, other):
+        other = self._coerce(other)
+        if other.numerator == 0:
+            raise ValueError("Деление на ноль")
+        return LegacyRational(self.numerator * other.denominator, self.denominator * other.numerator)
+
+    def __eq__(self, other):
+        other = self._coerce(other)
+        return self.numerator == other.numerator and self.denominator == other.denominator
+
+
+OPERATIONS = {
+    "init": lambda cls, a, b, k: cls(a.numerator * k, a.denominator * k),
+    "add": lambda cls, a, b, k: a + b,
+    "sub": lambda cls, a, b, k: a - b,
+    "mul": lambda cls, a, b, k: a * b,
+    "div": lambda cls, a, b, k: a / b,
+    "add_int": lambda cls, a, b, k: a + k,
+    "mul_int": lambda cls, a, b, k: a * k,
+    "eq": lambda cls, a, b, k: a == b,
+}
+
+
+def make_operands(cls, size, seed=0):
+    """
+    Случайные пары дробей с числителями и знаменателями до 10**6 и целые множители.
+
+    :param cls: Класс рациональных чисел.
+    :param size: Количество пар.
+    :param seed: Зерно генератора, одинаковое для обоих классов.
+    :return: Список троек (a, b, k).
+    """
+    rng = random.Random(seed)
+
+    def fraction():
+        return cls(rng.randint(-10**6, 10**6), rng.randint(1, 10**6))
+
+    return [(fraction(), fraction(), rng.randint(1, 1000)) for _ in range(size)]
+
+
+def time_operation(cls, operation, operands, repeat):
+    """
+    Медианное время одной операции в наносекундах.
+
+    :param cls: Класс рациональных чисел.
+    :param operation: Функция операции из OPERATIONS.
+    :param operands: Операнды из make_operands.
+    :param repeat: Количество прогонов по всем операндам.
+    :return: Время на операцию, нс.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        for a, b, k in operands:
+            operation(cls, a, b, k)
+        timings.append((time.perf_counter_ns() - started) / len(operands))
+    timings.sort()
+    return round(timings[len(timings) // 2], 1)
+
+
+def instance_memory(cls, size):
+    """
+    Память на один объект в байтах, вместе с __dict__, если он есть.
+
+    :param cls: Класс рациональных чисел.
+    :param size: Количество создаваемых объектов.
+    :return: Байт на объект.
+    """
+    # Числа берутся из заранее созданного списка, чтобы считать только сами объекты
+    numbers = list(range(3, 2 * size + 3, 2))
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [cls(n, 2) for n in numbers]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Вычитаем сам список объектов
+    return round((after - before) / len(instances) - 8, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000, help="Количество пар операндов.")
+    parser.add_argument("--repeat", type=int, default=5, help="Прогонов на операцию, берётся медиана.")
+    options = parser.parse_args()
+
+    report = {"ns_per_op": {}, "bytes_per_instance": {}}
+    operands = {cls: make_operands(cls, options.size) for cls in (LegacyRational, Rational)}
+    for name, operation in OPERATIONS.items():
+        legacy = time_operation(LegacyRational, operation, operands[LegacyRational], options.repeat)
+        current = time_operation(Rational, operation, operands[Rational], options.repeat)
+        report["ns_per_op"][name] = {"legacy": legacy, "current": current, "speedup": round(legacy / current, 2)}
+    for cls in (LegacyRational, Rational):
+        report["bytes_per_instance"][cls.__name__] = instance_memory(cls, options.size)
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
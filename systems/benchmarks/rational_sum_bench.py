@@ -0,0 +1,90 @@
+"""
+Rational.sum и Rational.prod против свёртки слева операторами + и *.
+
+Запуск из каталога systems:
+
+    python -m benchmarks.rational_sum_bench [--sizes 1000 10000 30000] [--repeat 3]
+
+Нагрузки: гармонический ряд 1/1 + 1/2 + ... + 1/n, ряд 1/k², у которого знаменатели
+растут быстрее, суммы денежных сумм с общим знаменателем 100 и произведение
+(k² + 1)/k². Печатает JSON с медианным временем в миллисекундах и ускорением.
+"""
+import argparse
+import functools
+import json
+import operator
+import random
+import time
+
+from classes.rational import Rational
+
+
+def harmonic(size):
+    return [Rational(1, k) for k in range(1, size + 1)]
+
+
+def inverse_squares(size):
+    return [Rational(1, k * k) for k in range(1, size + 1)]
+
+
+def cents(size):
+    rng = random.Random(0)
+    return [Rational(rng.randint(-10**6, 10**6), 100) for _ in range(size)]
+
+
+def near_one(size):
+    return [Rational(k * k + 1, k * k) for k in range(1, size + 1)]
+
+
+WORKLOADS = {
+    "harmonic_sum": (harmonic, operator.add, Rational.sum, Rational(0)),
+    "inverse_squares_sum": (inverse_squares, operator.add, Rational.sum, Rational(0)),
+    "cents_sum": (cents, operator.add, Rational.sum, Rational(0)),
+    "near_one_prod": (near_one, operator.mul, Rational.prod, Rational(1)),
+}
+
+
+def measure(function, repeat):
+    """
+    Медианное время вызова в миллисекундах и результат последнего вызова.
+
+    :param function: Функция без аргументов.
+    :param repeat: Количество запусков.
+    :return: Кортеж (время, результат).
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return round(timings[len(timings) // 2] * 1000, 2), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 30_000])
+    parser.add_argument("--repeat", type=int, default=3, help="Запусков на замер, берётся медиана.")
+    options = parser.parse_args()
+
+    report = {"runs": []}
+    for name, (make, operation, api, start) in WORKLOADS.items():
+        for size in options.sizes:
+            values = make(size)
+            fold_ms, expected = measure(lambda: functools.reduce(operation, values, start), options.repeat)
+            api_ms, result = measure(lambda: api(values), options.repeat)
+            assert result == expected
+            report["runs"].append({
+                "workload": name,
+                "terms": size,
+                "fold_ms": fold_ms,
+                "api_ms": api_ms,
+                "speedup": round(fold_ms / api_ms, 2),
+                "result_bits": result.numerator.bit_length() + result.denominator.bit_length(),
+            })
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,13 @@
 from .complex import Complex
+from .complex_array import ComplexArray
+from .polynomial import Polynomial
 from .rational import Rational
+from .rational_array import RationalArray
 
 __all__ = [
     "Complex",
-    "Rational"
+    "ComplexArray",
+    "Polynomial",
+    "Rational",
+    "RationalArray"
 ]
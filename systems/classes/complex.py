@@ -1,50 +1,63 @@
 import math
+import sys
+
 from .rational import Rational
 
+_HASH_IMAG = sys.hash_info.imag
+
+
 class Complex:
     """
     Класс Complex представляет комплексные числа.
     Все входные данные автоматически преобразуются в Rational для упрощения вычислений.
+
+    Объекты неизменяемы, атрибуты лежат в __slots__. Результаты арифметики собираются
+    из уже готовых Rational без повторных проверок, а целые и Rational операнды
+    участвуют в вычислениях как есть, без промежуточных объектов Complex.
     """
 
-    def __init__(self, real: int | Rational, imaginary: int | Rational | None = None):
+    __slots__ = ("__real", "__imaginary")
+
+    def __init__(self, real: 'int | Rational | Complex', imaginary: int | Rational | None = None):
         """
         Инициализирует комплексное число.
 
-        :param real: Действительная часть комплексного числа (int или Rational).
+        :param real: Действительная часть комплексного числа (int или Rational) или Complex.
         :param imaginary: Мнимая часть комплексного числа (int или Rational, опционально).
         :raises TypeError: Если передан неподдерживаемый тип.
         """
-        # Преобразуем real в Rational
         if isinstance(real, Complex):
-            self._real = real.real
-            self._imaginary = real.imaginary
+            self.__real = real.__real
+            self.__imaginary = real.__imaginary
         else:
-            self._real = self._convert_to_rational(real)
-            # Преобразуем imaginary в Rational
+            self.__real = self._convert_to_rational(real)
             if imaginary is not None:
-                self._imaginary = self._convert_to_rational(imaginary)
+                self.__imaginary = self._convert_to_rational(imaginary)
             else:
-                self._imaginary = Rational(0, 1)
+                self.__imaginary = Rational._from_reduced(0, 1)
 
-    @property
-    def real(self) -> Rational:
+    @classmethod
+    def _from_rationals(cls, real: Rational, imaginary: Rational) -> 'Complex':
         """
-        Возвращает действительную часть комплексного числа.
+        Создаёт Complex из частей, которые уже являются Rational, без проверок.
 
-        :return: Действительная часть (Rational).
+        :param real: Действительная часть.
+        :param imaginary: Мнимая часть.
+        :return: Новое комплексное число.
         """
-        return self._real
+        result = object.__new__(cls)
+        result.__real = real
+        result.__imaginary = imaginary
+        return result
 
-    @real.setter
-    def real(self, value: int | Rational):
+    @property
+    def real(self) -> Rational:
         """
-        Устанавливает действительную часть комплексного числа.
+        Возвращает действительную часть комплексного числа.
 
-        :param value: Новое значение действительной части (int или Rational).
-        :raises TypeError: Если передан неподдерживаемый тип.
+        :return: Действительная часть (Rational).
         """
-        self._real = self._convert_to_rational(value)
+        return self.__real
 
     @property
     def imaginary(self) -> Rational:
@@ -53,19 +66,10 @@ class Complex:
 
         :return: Мнимая часть (Rational).
         """
-        return self._imaginary
-
-    @imaginary.setter
-    def imaginary(self, value: int | Rational):
-        """
-        Устанавливает мнимую часть комплексного числа.
+        return self.__imaginary
 
-        :param value: Новое значение мнимой части (int или Rational).
-        :raises TypeError: Если передан неподдерживаемый тип.
-        """
-        self._imaginary = self._convert_to_rational(value)
-
-    def _convert_to_rational(self, value: int | Rational) -> Rational:
+    @staticmethod
+    def _convert_to_rational(value: int | Rational) -> Rational:
         """
         Преобразует значение в Rational.
 
@@ -74,103 +78,272 @@ class Complex:
         :raises TypeError: Если передан неподдерживаемый тип.
         """
         if isinstance(value, int):
-            return Rational(value, 1)
+            # Целое n - уже несократимая дробь n/1; int() превращает bool в обычное целое
+            return Rational._from_reduced(int(value), 1)
         elif isinstance(value, Rational):
             return value
         else:
             raise TypeError(f"Неподдерживаемый тип: {type(value)}")
 
-    def __add__(self, other: int | Rational) -> 'Complex':
+    def __add__(self, other: 'Complex | int | Rational') -> 'Complex':
         """
         Сложение двух комплексных чисел.
 
         :param other: Другое комплексное число, целое число или Rational.
         :return: Новое комплексное число как результат сложения.
-        :raises TypeError: Если other не поддерживается.
         """
         if isinstance(other, Complex):
-            return Complex(self.real + other.real, self.imaginary + other.imaginary)
-        elif isinstance(other, (int, Rational)):
-            other_rational = self._convert_to_rational(other)
-            return Complex(self.real + other_rational, self.imaginary)
-        else:
-            raise TypeError(f"Неподдерживаемый тип для сложения: {type(other)}")
+            return Complex._from_rationals(self.__real + other.__real, self.__imaginary + other.__imaginary)
+        if isinstance(other, (int, Rational)):
+            return Complex._from_rationals(self.__real + other, self.__imaginary)
+        return NotImplemented
 
-    def __sub__(self, other: int | Rational) -> 'Complex':
+    def __radd__(self, other: int | Rational) -> 'Complex':
+        """
+        Сложение, когда комплексное число стоит справа.
+
+        :param other: Целое число или Rational.
+        :return: Новое комплексное число как результат сложения.
+        """
+        if isinstance(other, (int, Rational)):
+            return Complex._from_rationals(self.__real + other, self.__imaginary)
+        return NotImplemented
+
+    def __sub__(self, other: 'Complex | int | Rational') -> 'Complex':
         """
         Вычитание двух комплексных чисел.
 
         :param other: Другое комплексное число, целое число или Rational.
         :return: Новое комплексное число как результат вычитания.
-        :raises TypeError: Если other не поддерживается.
         """
         if isinstance(other, Complex):
-            return Complex(self.real - other.real, self.imaginary - other.imaginary)
-        elif isinstance(other, (int, Rational)):
-            other_rational = self._convert_to_rational(other)
-            return Complex(self.real - other_rational, self.imaginary)
-        else:
-            raise TypeError(f"Неподдерживаемый тип для вычитания: {type(other)}")
+            return Complex._from_rationals(self.__real - other.__real, self.__imaginary - other.__imaginary)
+        if isinstance(other, (int, Rational)):
+            return Complex._from_rationals(self.__real - other, self.__imaginary)
+        return NotImplemented
+
+    def __rsub__(self, other: int | Rational) -> 'Complex':
+        """
+        Вычитание комплексного числа из целого числа или Rational.
+
+        :param other: Уменьшаемое.
+        :return: Новое комплексное число как результат вычитания.
+        """
+        if isinstance(other, (int, Rational)):
+            return Complex._from_rationals(other - self.__real, -self.__imaginary)
+        return NotImplemented
 
-    def __mul__(self, other: int | Rational) -> 'Complex':
+    def __mul__(self, other: 'Complex | int | Rational') -> 'Complex':
         """
         Умножение двух комплексных чисел.
 
+        Действительный множитель (int, Rational или Complex с нулевой мнимой частью)
+        умножается на каждую часть - два умножения вместо четырёх.
+
         :param other: Другое комплексное число, целое число или Rational.
         :return: Новое комплексное число как результат умножения.
-        :raises TypeError: Если other не поддерживается.
         """
         if isinstance(other, Complex):
-            return Complex(
-                self.real * other.real - self.imaginary * other.imaginary,
-                self.real * other.imaginary + self.imaginary * other.real
-            )
-        elif isinstance(other, (int, Rational)):
-            other_rational = self._convert_to_rational(other)
-            return Complex(self.real * other_rational, self.imaginary * other_rational)
-        else:
-            raise TypeError(f"Неподдерживаемый тип для умножения: {type(other)}")
+            a, b = self.__real, self.__imaginary
+            c, d = other.__real, other.__imaginary
+            if not d:
+                return Complex._from_rationals(a * c, b * c)
+            return Complex._from_rationals(a * c - b * d, a * d + b * c)
+        if isinstance(other, (int, Rational)):
+            return Complex._from_rationals(self.__real * other, self.__imaginary * other)
+        return NotImplemented
+
+    def __rmul__(self, other: int | Rational) -> 'Complex':
+        """
+        Умножение, когда комплексное число стоит справа.
 
-    def __truediv__(self, other: int | Rational) -> 'Complex':
+        :param other: Целое число или Rational.
+        :return: Новое комплексное число как результат умножения.
+        """
+        if isinstance(other, (int, Rational)):
+            return Complex._from_rationals(self.__real * other, self.__imaginary * other)
+        return NotImplemented
+
+    def __truediv__(self, other: 'Complex | int | Rational') -> 'Complex':
         """
         Деление двух комплексных чисел.
 
         :param other: Другое комплексное число, целое число или Rational.
         :return: Новое комплексное число как результат деления.
-        :raises TypeError: Если other не поддерживается.
         :raises ZeroDivisionError: Если other равен нулю.
         """
         if isinstance(other, Complex):
-            if other.real == Rational(0, 1) and other.imaginary == Rational(0, 1):
-                raise ZeroDivisionError("Деление на ноль")
-            denominator = other.real * other.real + other.imaginary * other.imaginary
-            return Complex(
-                (self.real * other.real + self.imaginary * other.imaginary) / denominator,
-                (self.imaginary * other.real - self.real * other.imaginary) / denominator
-            )
-        elif isinstance(other, (int, Rational)):
-            other_rational = self._convert_to_rational(other)
-            if other_rational == Rational(0, 1):
-                raise ZeroDivisionError("Деление на ноль")
-            return Complex(self.real / other_rational, self.imaginary / other_rational)
+            c, d = other.__real, other.__imaginary
+            if not d:
+                other = c
+            else:
+                # Числитель умножается на сопряжённое, знаменатель |other|² делит обе части
+                a, b = self.__real, self.__imaginary
+                denominator = c * c + d * d
+                return Complex._from_rationals((a * c + b * d) / denominator, (b * c - a * d) / denominator)
+        elif not isinstance(other, (int, Rational)):
+            return NotImplemented
+        if not other:
+            raise ZeroDivisionError("Деление на ноль")
+        return Complex._from_rationals(self.__real / other, self.__imaginary / other)
+
+    def __rtruediv__(self, other: int | Rational) -> 'Complex':
+        """
+        Деление целого числа или Rational на комплексное число.
+
+        :param other: Делимое.
+        :return: Новое комплексное число как результат деления.
+        :raises ZeroDivisionError: Если текущее число равно нулю.
+        """
+        if not isinstance(other, (int, Rational)):
+            return NotImplemented
+        c, d = self.__real, self.__imaginary
+        if not c and not d:
+            raise ZeroDivisionError("Деление на ноль")
+        if not d:
+            return Complex._from_rationals(other / c, d)
+        scale = other / (c * c + d * d)
+        return Complex._from_rationals(c * scale, -d * scale)
+
+    def __pow__(self, exponent: int | Rational) -> 'Complex':
+        """
+        Возводит комплексное число в целую степень двоичным возведением: O(log n) умножений.
+
+        Отрицательная степень - положительная степень обратного числа.
+
+        :param exponent: Целый показатель степени (int или Rational со знаменателем 1).
+        :return: Новое комплексное число.
+        :raises ZeroDivisionError: Если ноль возводится в отрицательную степень.
+        """
+        if isinstance(exponent, Rational) and exponent.denominator == 1:
+            exponent = exponent.numerator
+        if not isinstance(exponent, int):
+            return NotImplemented
+        base = self
+        if exponent < 0:
+            base = 1 / self
+            exponent = -exponent
+        result = None
+        while exponent:
+            if exponent & 1:
+                result = base if result is None else result * base
+            exponent >>= 1
+            if exponent:
+                base = base * base
+        if result is None:
+            return Complex._from_rationals(Rational._from_reduced(1, 1), Rational._from_reduced(0, 1))
+        return result
+
+    def fma(self, multiplier: 'Complex | int | Rational', addend: 'Complex | int | Rational') -> 'Complex':
+        """
+        Вычисляет self * multiplier + addend одним шагом, без промежуточного Complex.
+
+        :param multiplier: Множитель: комплексное число, целое число или Rational.
+        :param addend: Слагаемое: комплексное число, целое число или Rational.
+        :return: Новое комплексное число.
+        :raises TypeError: Если multiplier или addend не поддерживаются.
+        """
+        a, b = self.__real, self.__imaginary
+        if isinstance(multiplier, Complex):
+            c, d = multiplier.__real, multiplier.__imaginary
+            real, imaginary = (a * c, b * c) if not d else (a * c - b * d, a * d + b * c)
+        elif isinstance(multiplier, (int, Rational)):
+            real, imaginary = a * multiplier, b * multiplier
         else:
-            raise TypeError(f"Неподдерживаемый тип для деления: {type(other)}")
+            raise TypeError(f"Неподдерживаемый тип для умножения: {type(multiplier)}")
+        if isinstance(addend, Complex):
+            return Complex._from_rationals(real + addend.__real, imaginary + addend.__imaginary)
+        if isinstance(addend, (int, Rational)):
+            return Complex._from_rationals(real + addend, imaginary)
+        raise TypeError(f"Неподдерживаемый тип для сложения: {type(addend)}")
+
+    def conjugate(self) -> 'Complex':
+        """
+        Возвращает комплексно сопряжённое число.
+
+        :return: Новое комплексное число с противоположной мнимой частью.
+        """
+        return Complex._from_rationals(self.__real, -self.__imaginary)
+
+    def abs2(self) -> Rational:
+        """
+        Возвращает квадрат модуля - точно, без извлечения корня.
+
+        :return: real² + imaginary² (Rational).
+        """
+        return self.__real * self.__real + self.__imaginary * self.__imaginary
+
+    def __neg__(self) -> 'Complex':
+        """
+        Возвращает противоположное комплексное число.
+
+        :return: Новое комплексное число.
+        """
+        return Complex._from_rationals(-self.__real, -self.__imaginary)
+
+    def __pos__(self) -> 'Complex':
+        """
+        Унарный плюс, возвращает само число (объект неизменяем).
+
+        :return: Текущее комплексное число.
+        """
+        return self
+
+    def __bool__(self) -> bool:
+        """
+        Проверяет, что число отлично от нуля.
+
+        :return: False только для 0 + 0i.
+        """
+        return bool(self.__real) or bool(self.__imaginary)
 
-    def __eq__(self, other: int | Rational) -> bool:
+    def __eq__(self, other: 'Complex | int | Rational') -> bool:
         """
         Проверка на равенство двух комплексных чисел.
 
         :param other: Другое комплексное число, целое число или Rational.
         :return: True, если числа равны, иначе False.
-        :raises TypeError: Если other не поддерживается.
         """
         if isinstance(other, Complex):
-            return self.real == other.real and self.imaginary == other.imaginary
-        elif isinstance(other, (int, Rational)):
-            other_rational = self._convert_to_rational(other)
-            return self.real == other_rational and self.imaginary == Rational(0, 1)
-        else:
-            raise TypeError(f"Неподдерживаемый тип для сравнения: {type(other)}")
+            return self.__real == other.__real and self.__imaginary == other.__imaginary
+        if isinstance(other, (int, Rational)):
+            return not self.__imaginary and self.__real == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """
+        Возвращает хеш. Части комбинируются, как у встроенного complex, так что у числа
+        с нулевой мнимой частью хеш совпадает с хешем равного Rational и int.
+
+        :return: Хеш числа.
+        """
+        result = hash(self.__real) + _HASH_IMAG * hash(self.__imaginary)
+        return hash(result)
+
+    def __reduce__(self):
+        """
+        Поддержка pickle: объект восстанавливается из действительной и мнимой частей.
+
+        :return: Кортеж (класс, аргументы конструктора).
+        """
+        return type(self), (self.__real, self.__imaginary)
+
+    def __copy__(self) -> 'Complex':
+        """
+        Копия неизменяемого объекта - он сам.
+
+        :return: Текущее комплексное число.
+        """
+        return self
+
+    def __deepcopy__(self, memo) -> 'Complex':
+        """
+        Глубокая копия неизменяемого объекта - он сам.
+
+        :param memo: Словарь уже скопированных объектов.
+        :return: Текущее комплексное число.
+        """
+        return self
 
     def __str__(self) -> str:
         """
@@ -178,7 +351,7 @@ class Complex:
 
         :return: Строковое представление комплексного числа.
         """
-        return f"{self.real} + {self.imaginary}i"
+        return f"{self.__real} + {self.__imaginary}i"
 
     def __repr__(self) -> str:
         """
@@ -186,7 +359,7 @@ class Complex:
 
         :return: Формальное строковое представление комплексного числа.
         """
-        return f"Complex({self.real}, {self.imaginary})"
+        return f"Complex({self.__real}, {self.__imaginary})"
 
     def module(self) -> float:
         """
@@ -194,9 +367,7 @@ class Complex:
 
         :return: Модуль комплексного числа.
         """
-        real_value = self.real.numerator / self.real.denominator  # Преобразуем Rational в float
-        imaginary_value = self.imaginary.numerator / self.imaginary.denominator  # Преобразуем Rational в float
-        return math.sqrt(real_value ** 2 + imaginary_value ** 2)
+        return math.hypot(float(self.__real), float(self.__imaginary))
 
     def arg(self) -> float:
         """
@@ -204,9 +375,7 @@ class Complex:
 
         :return: Аргумент комплексного числа.
         """
-        real_value = self.real.numerator / self.real.denominator  # Преобразуем Rational в float
-        imaginary_value = self.imaginary.numerator / self.imaginary.denominator  # Преобразуем Rational в float
-        return math.atan2(imaginary_value, real_value)
+        return math.atan2(float(self.__imaginary), float(self.__real))
 
     def polar_form(self) -> tuple[float, float]:
         """
@@ -0,0 +1,451 @@
+import numpy as np
+
+from .complex import Complex
+from .rational import Rational
+from .rational_array import RationalArray
+
+
+def _exact(values: np.ndarray) -> RationalArray:
+    """
+    Точно переводит массив float64 в RationalArray: каждое конечное float - двоичная дробь.
+
+    :param values: Массив float64.
+    :return: RationalArray с теми же значениями.
+    :raises ValueError: Если среди значений есть бесконечность или NaN.
+    """
+    if not np.all(np.isfinite(values)):
+        raise ValueError("Бесконечность и NaN не имеют точного рационального значения")
+    mantissa, exponent = np.frexp(values)
+    # values = numerators / 2**shift, числители - целые до 2**53
+    numerators = (mantissa * 2.0 ** 53).astype(np.int64)
+    shift = 53 - exponent.astype(np.int64)
+    if len(values) == 0 or (shift.min() >= 0 and shift.max() <= 62):
+        return RationalArray(numerators, np.left_shift(np.int64(1), shift))
+    pairs = [value.as_integer_ratio() for value in values.tolist()]
+    return RationalArray([n for n, _ in pairs], [m for _, m in pairs])
+
+
+class ComplexArray:
+    """
+    Класс ComplexArray - одномерный массив комплексных чисел с двумя режимами хранения.
+
+    Точный режим хранит действительные и мнимые части двумя RationalArray, и
+    арифметика в нём точная, как у Complex. Быстрый режим хранит массив NumPy
+    complex128 и считает приближённо на скорости NumPy. Режимы переключаются только
+    явно, через to_fast() и to_exact(), и операции между массивами разных режимов не
+    допускаются, чтобы точность не терялась незаметно.
+    """
+
+    __slots__ = ("__real", "__imaginary", "__values")
+
+    # Как в RationalArray: NumPy-операнд слева возвращает NotImplemented, и Python
+    # вызывает отражённый оператор ComplexArray.
+    __array_ufunc__ = None
+
+    def __init__(self, real: RationalArray, imaginary: RationalArray | None = None):
+        """
+        Инициализирует массив в точном режиме из действительных и мнимых частей.
+
+        :param real: Действительные части (RationalArray или последовательность целых).
+        :param imaginary: Мнимые части той же длины; по умолчанию нули.
+        :raises ValueError: Если длины частей различаются.
+        """
+        real = real if isinstance(real, RationalArray) else RationalArray(real)
+        if imaginary is None:
+            imaginary = RationalArray(np.zeros(len(real), dtype=np.int64))
+        elif not isinstance(imaginary, RationalArray):
+            imaginary = RationalArray(imaginary)
+        if len(real) != len(imaginary):
+            raise ValueError("Действительные и мнимые части должны быть одной длины")
+        self.__real = real
+        self.__imaginary = imaginary
+        self.__values = None
+
+    @classmethod
+    def from_numpy(cls, values) -> 'ComplexArray':
+        """
+        Создаёт массив в быстром режиме из массива NumPy (или последовательности) чисел.
+
+        :param values: Одномерный массив, приводимый к complex128.
+        :return: Новый ComplexArray в быстром режиме.
+        :raises ValueError: Если массив не одномерный.
+        """
+        values = np.array(values, dtype=np.complex128)
+        if values.ndim != 1:
+            raise ValueError("ComplexArray должен быть одномерным")
+        values.flags.writeable = False
+        result = object.__new__(cls)
+        result.__real = result.__imaginary = None
+        result.__values = values
+        return result
+
+    @classmethod
+    def from_complexes(cls, values) -> 'ComplexArray':
+        """
+        Создаёт массив в точном режиме из последовательности Complex, Rational или int.
+
+        :param values: Итерируемый объект из комплексных чисел.
+        :return: Новый ComplexArray в точном режиме.
+        :raises TypeError: Если значение не приводится к Complex.
+        """
+        values = [value if isinstance(value, Complex) else Complex(value) for value in values]
+        return cls(
+            RationalArray.from_rationals(value.real for value in values),
+            RationalArray.from_rationals(value.imaginary for value in values)
+        )
+
+    @property
+    def is_exact(self) -> bool:
+        """
+        Возвращает True для точного режима и False для быстрого.
+
+        :return: Режим массива.
+        """
+        return self.__values is None
+
+    @property
+    def real(self) -> 'RationalArray | np.ndarray':
+        """
+        Возвращает действительные части: RationalArray в точном режиме, float64 в быстром.
+
+        :return: Массив действительных частей.
+        """
+        return self.__real if self.is_exact else self.__values.real
+
+    @property
+    def imaginary(self) -> 'RationalArray | np.ndarray':
+        """
+        Возвращает мнимые части: RationalArray в точном режиме, float64 в быстром.
+
+        :return: Массив мнимых частей.
+        """
+        return self.__imaginary if self.is_exact else self.__values.imag
+
+    def to_fast(self) -> 'ComplexArray':
+        """
+        Переводит массив в быстрый режим (complex128), с округлением до ближайших float.
+
+        :return: ComplexArray в быстром режиме.
+        """
+        if not self.is_exact:
+            return self
+        return ComplexArray.from_numpy(self.to_numpy())
+
+    def to_exact(self) -> 'ComplexArray':
+        """
+        Переводит массив в точный режим. Каждое конечное float - двоичная дробь, поэтому
+        перевод не теряет точности.
+
+        :return: ComplexArray в точном режиме.
+        :raises ValueError: Если среди значений есть бесконечность или NaN.
+        """
+        if self.is_exact:
+            return self
+        return ComplexArray(_exact(self.__values.real), _exact(self.__values.imag))
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        Возвращает значения массивом NumPy complex128.
+
+        :return: Массив complex128.
+        """
+        if not self.is_exact:
+            return self.__values
+        values = np.empty(len(self), dtype=np.complex128)
+        values.real = self.__real.to_float()
+        values.imag = self.__imaginary.to_float()
+        return values
+
+    def to_complexes(self) -> list[Complex]:
+        """
+        Возвращает элементы списком Complex (быстрый массив сначала переводится в точный).
+
+        :return: Список Complex.
+        """
+        exact = self.to_exact()
+        return [
+            Complex._from_rationals(real, imaginary)
+            for real, imaginary in zip(exact.__real.to_rationals(), exact.__imaginary.to_rationals())
+        ]
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество элементов.
+
+        :return: Длина массива.
+        """
+        return len(self.__real) if self.is_exact else len(self.__values)
+
+    def __iter__(self):
+        """
+        Перебирает элементы: Complex в точном режиме, complex в быстром.
+
+        :return: Итератор по элементам.
+        """
+        return iter(self.to_complexes() if self.is_exact else self.__values.tolist())
+
+    def __getitem__(self, index) -> 'Complex | complex | ComplexArray':
+        """
+        Возвращает элемент по целому индексу или ComplexArray по срезу или маске.
+
+        :param index: Индекс, срез, массив индексов или булева маска.
+        :return: Complex (точный режим), complex (быстрый режим) или ComplexArray.
+        """
+        if not self.is_exact:
+            value = self.__values[index]
+            return complex(value) if np.ndim(value) == 0 else ComplexArray.from_numpy(value)
+        real, imaginary = self.__real[index], self.__imaginary[index]
+        if isinstance(real, Rational):
+            return Complex._from_rationals(real, imaginary)
+        return ComplexArray(real, imaginary)
+
+    def _operand(self, other):
+        """
+        Приводит другой операнд к представлению режима текущего массива.
+
+        :param other: ComplexArray того же режима или скаляр.
+        :return: Пара (действительные, мнимые части) в точном режиме, complex128 или
+            complex в быстром, None для неподдерживаемых операндов.
+        :raises TypeError: Если other - ComplexArray другого режима.
+        """
+        if isinstance(other, ComplexArray):
+            if other.is_exact != self.is_exact:
+                raise TypeError("Режимы массивов различаются: приведите их явно через to_fast() или to_exact()")
+            return (other.__real, other.__imaginary) if self.is_exact else other.__values
+        if isinstance(other, np.integer):
+            other = int(other)
+        if self.is_exact:
+            if isinstance(other, Complex):
+                return other.real, other.imaginary
+            if isinstance(other, (int, Rational)):
+                return other, 0
+            return None
+        if isinstance(other, Complex):
+            return complex(float(other.real), float(other.imaginary))
+        if isinstance(other, (int, float, complex, Rational, np.number)):
+            return complex(other)
+        return None
+
+    def __add__(self, other) -> 'ComplexArray':
+        """
+        Поэлементное сложение с массивом того же режима или числом.
+
+        :param other: ComplexArray, Complex, Rational, int (в быстром режиме также float и complex).
+        :return: Новый ComplexArray.
+        """
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        if not self.is_exact:
+            return ComplexArray.from_numpy(self.__values + operand)
+        return ComplexArray(self.__real + operand[0], self.__imaginary + operand[1])
+
+    def __radd__(self, other) -> 'ComplexArray':
+        """
+        Поэлементное сложение числа слева с массивом.
+
+        :param other: Число.
+        :return: Новый ComplexArray.
+        """
+        return self.__add__(other)
+
+    def __sub__(self, other) -> 'ComplexArray':
+        """
+        Поэлементное вычитание массива того же режима или числа.
+
+        :param other: ComplexArray, Complex, Rational, int (в быстром режиме также float и complex).
+        :return: Новый ComplexArray.
+        """
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        if not self.is_exact:
+            return ComplexArray.from_numpy(self.__values - operand)
+        return ComplexArray(self.__real - operand[0], self.__imaginary - operand[1])
+
+    def __rsub__(self, other) -> 'ComplexArray':
+        """
+        Поэлементное вычитание массива из числа слева.
+
+        :param other: Число.
+        :return: Новый ComplexArray.
+        """
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        return (-self).__add__(other)
+
+    def __mul__(self, other) -> 'ComplexArray':
+        """
+        Поэлементное умножение на массив того же режима или число.
+
+        :param other: ComplexArray, Complex, Rational, int (в быстром режиме также float и complex).
+        :return: Новый ComplexArray.
+        """
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        if not self.is_exact:
+            return ComplexArray.from_numpy(self.__values * operand)
+        a, b = self.__real, self.__imaginary
+        c, d = operand
+        if not isinstance(d, RationalArray) and d == 0:
+            # Действительный множитель: два умножения вместо четырёх
+            return ComplexArray(a * c, b * c)
+        return ComplexArray(a * c - b * d, a * d + b * c)
+
+    def __rmul__(self, other) -> 'ComplexArray':
+        """
+        Поэлементное умножение числа слева на массив.
+
+        :param other: Число.
+        :return: Новый ComplexArray.
+        """
+        return self.__mul__(other)
+
+    def __truediv__(self, other) -> 'ComplexArray':
+        """
+        Поэлементное деление на массив того же режима или число.
+
+        :param other: ComplexArray, Complex, Rational, int (в быстром режиме также float и complex).
+        :return: Новый ComplexArray.
+        :raises ZeroDivisionError: Если среди делителей есть ноль.
+        """
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        if not self.is_exact:
+            if np.any(np.asarray(operand) == 0):
+                raise ZeroDivisionError("Деление на ноль")
+            return ComplexArray.from_numpy(self.__values / operand)
+        a, b = self.__real, self.__imaginary
+        c, d = operand
+        if not isinstance(d, RationalArray) and d == 0:
+            if c == 0:
+                raise ZeroDivisionError("Деление на ноль")
+            return ComplexArray(a / c, b / c)
+        denominator = c * c + d * d
+        if np.any(denominator == 0):
+            raise ZeroDivisionError("Деление на ноль")
+        return ComplexArray((a * c + b * d) / denominator, (b * c - a * d) / denominator)
+
+    def __rtruediv__(self, other) -> 'ComplexArray':
+        """
+        Поэлементное деление числа слева на элементы массива.
+
+        :param other: Число.
+        :return: Новый ComplexArray.
+        :raises ZeroDivisionError: Если среди элементов массива есть ноль.
+        """
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        if not self.is_exact:
+            return ComplexArray.from_numpy(np.full(len(self), operand)).__truediv__(self)
+        real, imaginary = operand
+        ones = RationalArray(np.ones(len(self), dtype=np.int64))
+        return ComplexArray(ones * real, ones * imaginary).__truediv__(self)
+
+    def __neg__(self) -> 'ComplexArray':
+        """
+        Возвращает массив с противоположными знаками.
+
+        :return: Новый ComplexArray.
+        """
+        if not self.is_exact:
+            return ComplexArray.from_numpy(-self.__values)
+        return ComplexArray(-self.__real, -self.__imaginary)
+
+    def __eq__(self, other) -> np.ndarray:
+        """
+        Поэлементное равенство с массивом того же режима или числом.
+
+        :param other: ComplexArray или число.
+        :return: Булев массив.
+        """
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        if not self.is_exact:
+            return self.__values == operand
+        return (self.__real == operand[0]) & (self.__imaginary == operand[1])
+
+    def __ne__(self, other) -> np.ndarray:
+        """
+        Поэлементное неравенство.
+
+        :param other: ComplexArray или число.
+        :return: Булев массив.
+        """
+        result = self.__eq__(other)
+        return result if result is NotImplemented else ~result
+
+    __hash__ = None
+
+    def conjugate(self) -> 'ComplexArray':
+        """
+        Возвращает массив сопряжённых чисел.
+
+        :return: Новый ComplexArray.
+        """
+        if not self.is_exact:
+            return ComplexArray.from_numpy(np.conj(self.__values))
+        return ComplexArray(self.__real, -self.__imaginary)
+
+    def abs2(self) -> 'RationalArray | np.ndarray':
+        """
+        Возвращает квадраты модулей: точно (RationalArray) в точном режиме, float64 в быстром.
+
+        :return: Массив квадратов модулей.
+        """
+        if not self.is_exact:
+            return self.__values.real ** 2 + self.__values.imag ** 2
+        return self.__real * self.__real + self.__imaginary * self.__imaginary
+
+    def module(self) -> np.ndarray:
+        """
+        Возвращает модули элементов.
+
+        :return: Массив float64.
+        """
+        if not self.is_exact:
+            return np.abs(self.__values)
+        return np.hypot(self.__real.to_float(), self.__imaginary.to_float())
+
+    def arg(self) -> np.ndarray:
+        """
+        Возвращает аргументы элементов (в радианах).
+
+        :return: Массив float64.
+        """
+        if not self.is_exact:
+            return np.angle(self.__values)
+        return np.arctan2(self.__imaginary.to_float(), self.__real.to_float())
+
+    def polar_form(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Возвращает полярную форму элементов (модули и аргументы).
+
+        :return: Кортеж массивов (модули, аргументы).
+        """
+        return self.module(), self.arg()
+
+    def sum(self) -> 'Complex | complex':
+        """
+        Сумма элементов: точная (Complex) в точном режиме, complex в быстром.
+
+        :return: Сумма.
+        """
+        if not self.is_exact:
+            return complex(self.__values.sum())
+        return Complex(self.__real.sum(), self.__imaginary.sum())
+
+    def __repr__(self) -> str:
+        """
+        Возвращает формальное строковое представление массива.
+
+        :return: Формальное строковое представление массива.
+        """
+        if not self.is_exact:
+            return f"ComplexArray.from_numpy({self.__values.tolist()})"
+        return f"ComplexArray({self.__real!r}, {self.__imaginary!r})"
@@ -0,0 +1,554 @@
+import math
+from itertools import zip_longest
+
+import numpy as np
+
+from .complex import Complex
+from .complex_array import ComplexArray
+from .rational import Rational
+from .rational_array import RationalArray
+
+# Начиная с такой длины множителей умножение идёт по Карацубе, короче - в столбик
+_KARATSUBA_THRESHOLD = 32
+
+
+def _schoolbook(a: list[int], b: list[int]) -> list[int]:
+    """
+    Умножает многочлены с целыми коэффициентами в столбик.
+
+    :param a: Коэффициенты первого многочлена, от младшего к старшему.
+    :param b: Коэффициенты второго многочлена.
+    :return: Коэффициенты произведения.
+    """
+    result = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                result[i + j] += x * y
+    return result
+
+
+def _karatsuba(a: list[int], b: list[int]) -> list[int]:
+    """
+    Умножает многочлены с целыми коэффициентами по Карацубе: три произведения половин
+    вместо четырёх. Сильно различающиеся по длине множители режутся на куски длины
+    короткого.
+
+    :param a: Коэффициенты первого многочлена, от младшего к старшему.
+    :param b: Коэффициенты второго многочлена.
+    :return: Коэффициенты произведения.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return []
+    if len(b) < _KARATSUBA_THRESHOLD:
+        return _schoolbook(a, b)
+    result = [0] * (len(a) + len(b) - 1)
+    m = len(a) // 2
+    if len(b) <= m:
+        for start in range(0, len(a), len(b)):
+            for i, c in enumerate(_karatsuba(a[start:start + len(b)], b), start):
+                result[i] += c
+        return result
+    a0, a1, b0, b1 = a[:m], a[m:], b[:m], b[m:]
+    low = _karatsuba(a0, b0)
+    high = _karatsuba(a1, b1)
+    middle = _karatsuba(
+        [x + y for x, y in zip_longest(a0, a1, fillvalue=0)],
+        [x + y for x, y in zip_longest(b0, b1, fillvalue=0)]
+    )
+    # middle = low + high + перекрёстные члены; складываем всё со сдвигами m и 2m
+    for i, c in enumerate(low):
+        result[i] += c
+        result[i + m] -= c
+    for i, c in enumerate(high):
+        result[i + 2 * m] += c
+        result[i + m] -= c
+    for i, c in enumerate(middle):
+        if c:
+            result[i + m] += c
+    return result
+
+
+def _horner(points, coefficients, int64_only: bool = False):
+    """
+    Вычисляет многочлен схемой Горнера в точке или сразу в массиве точек.
+
+    :param points: Точка или массив точек с операциями * и +.
+    :param coefficients: Коэффициенты от младшего к старшему.
+    :param int64_only: Для RationalArray: прервать вычисление, если промежуточные
+        значения вышли из int64 в dtype=object.
+    :return: Значения многочлена (для пустого списка - points * 0) или None, если
+        вычисление прервано.
+    """
+    if not coefficients:
+        return points * 0
+    if len(coefficients) == 1:
+        return points * 0 + coefficients[0]
+    result = points * coefficients[-1] + coefficients[-2]
+    for c in reversed(coefficients[:-2]):
+        if int64_only and result.dtype == object:
+            return None
+        result = result * points + c
+    return result
+
+
+class Polynomial:
+    """
+    Класс Polynomial представляет многочлены с точными коэффициентами Rational или Complex.
+
+    Коэффициенты хранятся кортежем от младшего к старшему, без старших нулей; целые
+    приводятся к Rational, Complex с нулевой мнимой частью - к его действительной части.
+    Объекты неизменяемы. Умножение и вычисление в рациональной точке идут в целых числах:
+    коэффициенты приводятся к общему знаменателю, действительные и мнимые части
+    обрабатываются отдельно, а дроби сокращаются только в конце.
+    """
+
+    __slots__ = ("__coefficients", "__integers")
+
+    def __init__(self, coefficients):
+        """
+        Инициализирует многочлен c0 + c1*x + c2*x^2 + ...
+
+        :param coefficients: Последовательность коэффициентов (int, Rational или Complex) от младшего к старшему.
+        :raises TypeError: Если передан неподдерживаемый тип коэффициента.
+        """
+        self.__coefficients = self._normalize([self._convert(c) for c in coefficients])
+        self.__integers = None
+
+    @classmethod
+    def _from_coefficients(cls, coefficients: list) -> 'Polynomial':
+        """
+        Создаёт многочлен из списка Rational и Complex без проверки типов.
+
+        :param coefficients: Коэффициенты от младшего к старшему.
+        :return: Новый многочлен.
+        """
+        result = object.__new__(cls)
+        result.__coefficients = cls._normalize(coefficients)
+        result.__integers = None
+        return result
+
+    @staticmethod
+    def _convert(value: 'int | Rational | Complex') -> 'Rational | Complex':
+        """
+        Приводит коэффициент к Rational или Complex.
+
+        :param value: Целое число, Rational или Complex.
+        :return: Коэффициент.
+        :raises TypeError: Если передан неподдерживаемый тип.
+        """
+        if isinstance(value, int):
+            return Rational._from_reduced(int(value), 1)
+        if isinstance(value, (Rational, Complex)):
+            return value
+        raise TypeError(f"Неподдерживаемый тип коэффициента: {type(value)}")
+
+    @staticmethod
+    def _normalize(coefficients: list) -> tuple:
+        """
+        Отбрасывает старшие нули и заменяет Complex с нулевой мнимой частью на Rational.
+
+        :param coefficients: Коэффициенты от младшего к старшему.
+        :return: Кортеж коэффициентов.
+        """
+        end = len(coefficients)
+        while end and not coefficients[end - 1]:
+            end -= 1
+        return tuple(
+            c.real if isinstance(c, Complex) and not c.imaginary else c
+            for c in coefficients[:end]
+        )
+
+    def _integer_form(self) -> tuple[list[int], list[int] | None, int]:
+        """
+        Возвращает коэффициенты, приведённые к общему знаменателю (вычисляется один раз).
+
+        :return: Кортеж (числители действительных частей, числители мнимых частей или None
+            для многочлена с рациональными коэффициентами, общий знаменатель).
+        """
+        if self.__integers is None:
+            real = [c.real if isinstance(c, Complex) else c for c in self.__coefficients]
+            imaginary = None
+            if any(isinstance(c, Complex) for c in self.__coefficients):
+                imaginary = [c.imaginary if isinstance(c, Complex) else Rational._from_reduced(0, 1) for c in self.__coefficients]
+            denominator = math.lcm(*(c.denominator for c in real + (imaginary or [])))
+            real = [c.numerator * (denominator // c.denominator) for c in real]
+            if imaginary is not None:
+                imaginary = [c.numerator * (denominator // c.denominator) for c in imaginary]
+            self.__integers = (real, imaginary, denominator)
+        return self.__integers
+
+    @classmethod
+    def _from_integers(cls, real: list[int], imaginary: list[int] | None, denominator: int) -> 'Polynomial':
+        """
+        Создаёт многочлен из числителей над общим знаменателем.
+
+        :param real: Числители действительных частей.
+        :param imaginary: Числители мнимых частей или None.
+        :param denominator: Общий знаменатель.
+        :return: Новый многочлен.
+        """
+        if imaginary is None:
+            return cls._from_coefficients([Rational(n, denominator) for n in real])
+        return cls._from_coefficients([
+            Complex._from_rationals(Rational(n, denominator), Rational(k, denominator))
+            for n, k in zip(real, imaginary)
+        ])
+
+    @property
+    def coefficients(self) -> tuple:
+        """
+        Возвращает коэффициенты от младшего к старшему.
+
+        :return: Кортеж Rational и Complex; пустой для нулевого многочлена.
+        """
+        return self.__coefficients
+
+    @property
+    def degree(self) -> int:
+        """
+        Возвращает степень многочлена.
+
+        :return: Степень; -1 для нулевого многочлена.
+        """
+        return len(self.__coefficients) - 1
+
+    def _coerce(self, other) -> 'Polynomial | None':
+        """
+        Приводит операнд к многочлену.
+
+        :param other: Polynomial, int, Rational или Complex.
+        :return: Многочлен или None для неподдерживаемых типов.
+        """
+        if isinstance(other, Polynomial):
+            return other
+        if isinstance(other, (int, Rational, Complex)):
+            return Polynomial._from_coefficients([self._convert(other)])
+        return None
+
+    def __call__(self, point):
+        """
+        Вычисляет многочлен схемой Горнера.
+
+        Рациональная точка p/q обрабатывается в целых числах: значение собирается как
+        одна дробь (sum a_i * p^i * q^(n-i)) / (q^n * D) и сокращается один раз.
+        Массивы точек вычисляются поэлементно за один проход по коэффициентам.
+
+        :param point: int, Rational, Complex; RationalArray или ComplexArray (точно);
+            numpy.ndarray (приближённо, во float или complex).
+        :return: Rational или Complex для числа, RationalArray или ComplexArray для массива
+            (ComplexArray, если коэффициенты комплексные), numpy.ndarray для numpy.ndarray.
+        :raises TypeError: Если point неподдерживаемого типа.
+        """
+        if isinstance(point, (int, Rational)):
+            real, imaginary, denominator = self._integer_form()
+            p, q = Rational._as_pair(point)
+            real_value = self._integer_horner(real, p, q, denominator)
+            if imaginary is None:
+                return real_value
+            return Complex._from_rationals(real_value, self._integer_horner(imaginary, p, q, denominator))
+        if isinstance(point, Complex):
+            result = Complex(self.__coefficients[-1]) if self.__coefficients else Complex(0)
+            for c in reversed(self.__coefficients[:-1]):
+                result = result.fma(point, c)
+            return result
+        if isinstance(point, RationalArray):
+            return self._evaluate_rational_array(point)
+        if isinstance(point, ComplexArray):
+            return _horner(point, self.__coefficients)
+        if isinstance(point, np.ndarray):
+            return _horner(point, [
+                complex(float(c.real), float(c.imaginary)) if isinstance(c, Complex) else float(c)
+                for c in self.__coefficients
+            ])
+        raise TypeError(f"Неподдерживаемый тип точки: {type(point)}")
+
+    def _evaluate_rational_array(self, points: RationalArray) -> 'RationalArray | ComplexArray':
+        """
+        Вычисляет многочлен в массиве рациональных точек.
+
+        Пока значения помещаются в int64, Горнер идёт по всему массиву сразу. Когда
+        они выходят за int64 (высокие степени), массив dtype=object медленнее, чем
+        вычисление каждой точки в целых числах, и вычисление переходит на него.
+
+        :param points: Массив точек.
+        :return: RationalArray или ComplexArray для комплексных коэффициентов.
+        """
+        coefficients = self.__coefficients
+        if any(isinstance(c, Complex) for c in coefficients):
+            real = _horner(points, [c.real if isinstance(c, Complex) else c for c in coefficients], int64_only=True)
+            imaginary = None
+            if real is not None:
+                imaginary = _horner(points, [c.imaginary if isinstance(c, Complex) else 0 for c in coefficients], int64_only=True)
+            if imaginary is None:
+                return ComplexArray.from_complexes([self(x) for x in points.to_rationals()])
+            return ComplexArray(real, imaginary)
+        result = _horner(points, coefficients, int64_only=True)
+        if result is None:
+            return RationalArray.from_rationals([self(x) for x in points.to_rationals()])
+        return result
+
+    @staticmethod
+    def _integer_horner(numerators: list[int], p: int, q: int, denominator: int) -> Rational:
+        """
+        Вычисляет sum(numerators[i] * (p/q)^i) / denominator в целых числах.
+
+        :return: Несократимое значение.
+        """
+        if not numerators:
+            return Rational._from_reduced(0, 1)
+        result = numerators[-1]
+        scale = 1
+        if q == 1:
+            for c in reversed(numerators[:-1]):
+                result = result * p + c
+        else:
+            for c in reversed(numerators[:-1]):
+                scale *= q
+                result = result * p + c * scale
+        return Rational(result, scale * denominator)
+
+    def __add__(self, other: 'Polynomial | int | Rational | Complex') -> 'Polynomial':
+        """
+        Сложение многочленов.
+
+        :param other: Многочлен или число.
+        :return: Новый многочлен.
+        """
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        zero = Rational._from_reduced(0, 1)
+        return Polynomial._from_coefficients([
+            a + b for a, b in zip_longest(self.__coefficients, other.__coefficients, fillvalue=zero)
+        ])
+
+    __radd__ = __add__
+
+    def __sub__(self, other: 'Polynomial | int | Rational | Complex') -> 'Polynomial':
+        """
+        Вычитание многочленов.
+
+        :param other: Многочлен или число.
+        :return: Новый многочлен.
+        """
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        zero = Rational._from_reduced(0, 1)
+        return Polynomial._from_coefficients([
+            a - b for a, b in zip_longest(self.__coefficients, other.__coefficients, fillvalue=zero)
+        ])
+
+    def __rsub__(self, other: 'int | Rational | Complex') -> 'Polynomial':
+        """
+        Вычитание многочлена из числа.
+
+        :param other: Уменьшаемое.
+        :return: Новый многочлен.
+        """
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return other - self
+
+    def __neg__(self) -> 'Polynomial':
+        """
+        Возвращает противоположный многочлен.
+
+        :return: Новый многочлен.
+        """
+        return Polynomial._from_coefficients([-c for c in self.__coefficients])
+
+    def __mul__(self, other: 'Polynomial | int | Rational | Complex') -> 'Polynomial':
+        """
+        Умножение многочленов.
+
+        Коэффициенты приводятся к общему знаменателю, и перемножаются целые многочлены:
+        в столбик или по Карацубе для длинных. Комплексные коэффициенты раскладываются
+        на действительную и мнимую части, произведение которых считается тремя
+        умножениями вместо четырёх.
+
+        :param other: Многочлен или число.
+        :return: Новый многочлен.
+        """
+        if isinstance(other, (int, Rational, Complex)):
+            return Polynomial._from_coefficients([c * other for c in self.__coefficients])
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        if not self or not other:
+            return Polynomial._from_coefficients([])
+        a, b, d1 = self._integer_form()
+        c, d, d2 = other._integer_form()
+        if b is None and d is None:
+            return Polynomial._from_integers(_karatsuba(a, c), None, d1 * d2)
+        # (a + bi)(c + di) = ac - bd + ((a + b)(c + d) - ac - bd)i
+        b = b or [0] * len(a)
+        d = d or [0] * len(c)
+        ac = _karatsuba(a, c)
+        bd = _karatsuba(b, d)
+        cross = _karatsuba([x + y for x, y in zip(a, b)], [x + y for x, y in zip(c, d)])
+        return Polynomial._from_integers(
+            [x - y for x, y in zip(ac, bd)],
+            [z - x - y for x, y, z in zip(ac, bd, cross)],
+            d1 * d2
+        )
+
+    __rmul__ = __mul__
+
+    def __divmod__(self, other: 'Polynomial | int | Rational | Complex') -> tuple['Polynomial', 'Polynomial']:
+        """
+        Деление многочленов с остатком: self = quotient * other + remainder, где степень
+        остатка меньше степени other.
+
+        :param other: Многочлен-делитель или число.
+        :return: Кортеж (частное, остаток).
+        :raises ZeroDivisionError: Если other - нулевой многочлен.
+        """
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        divisor = other.__coefficients
+        if not divisor:
+            raise ZeroDivisionError("Деление на нулевой многочлен")
+        remainder = list(self.__coefficients)
+        shift = len(remainder) - len(divisor)
+        if shift < 0:
+            return Polynomial._from_coefficients([]), self
+        # Делим на старший коэффициент один раз, дальше только умножаем
+        inverse = 1 / divisor[-1]
+        quotient = [None] * (shift + 1)
+        for k in range(shift, -1, -1):
+            factor = remainder[k + len(divisor) - 1] * inverse
+            quotient[k] = factor
+            if factor:
+                for j, c in enumerate(divisor[:-1]):
+                    remainder[k + j] = remainder[k + j] - factor * c
+        return Polynomial._from_coefficients(quotient), Polynomial._from_coefficients(remainder[:len(divisor) - 1])
+
+    def __floordiv__(self, other: 'Polynomial | int | Rational | Complex') -> 'Polynomial':
+        """
+        Частное от деления многочленов.
+
+        :param other: Многочлен-делитель или число.
+        :return: Частное.
+        :raises ZeroDivisionError: Если other - нулевой многочлен.
+        """
+        result = self.__divmod__(other)
+        return result if result is NotImplemented else result[0]
+
+    def __mod__(self, other: 'Polynomial | int | Rational | Complex') -> 'Polynomial':
+        """
+        Остаток от деления многочленов.
+
+        :param other: Многочлен-делитель или число.
+        :return: Остаток.
+        :raises ZeroDivisionError: Если other - нулевой многочлен.
+        """
+        result = self.__divmod__(other)
+        return result if result is NotImplemented else result[1]
+
+    def monic(self) -> 'Polynomial':
+        """
+        Возвращает многочлен, делённый на старший коэффициент.
+
+        :return: Новый многочлен со старшим коэффициентом 1; нулевой остаётся нулевым.
+        """
+        if not self.__coefficients:
+            return self
+        inverse = 1 / self.__coefficients[-1]
+        return Polynomial._from_coefficients([c * inverse for c in self.__coefficients])
+
+    def gcd(self, other: 'Polynomial') -> 'Polynomial':
+        """
+        Наибольший общий делитель алгоритмом Евклида.
+
+        Остатки на каждом шаге делаются приведёнными, чтобы коэффициенты не росли
+        из-за старших коэффициентов.
+
+        :param other: Другой многочлен.
+        :return: Приведённый НОД; нулевой многочлен, если оба многочлена нулевые.
+        :raises TypeError: Если other не является многочленом.
+        """
+        if not isinstance(other, Polynomial):
+            raise TypeError(f"Неподдерживаемый тип для НОД: {type(other)}")
+        a, b = self.monic(), other.monic()
+        while b:
+            a, b = b, (a % b).monic()
+        return a
+
+    def derivative(self) -> 'Polynomial':
+        """
+        Возвращает производную многочлена.
+
+        :return: Новый многочлен.
+        """
+        return Polynomial._from_coefficients([c * i for i, c in enumerate(self.__coefficients) if i])
+
+    def __bool__(self) -> bool:
+        """
+        Проверяет, что многочлен ненулевой.
+
+        :return: False только для нулевого многочлена.
+        """
+        return bool(self.__coefficients)
+
+    def __eq__(self, other: 'Polynomial | int | Rational | Complex') -> bool:
+        """
+        Проверка на равенство многочленов.
+
+        :param other: Многочлен или число.
+        :return: True, если коэффициенты совпадают.
+        """
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self.__coefficients == other.__coefficients
+
+    def __hash__(self) -> int:
+        """
+        Возвращает хеш коэффициентов.
+
+        Многочлен степени не выше нуля равен своему числу (__eq__), поэтому и хешируется
+        как оно: константа - как свой коэффициент, нулевой многочлен - как 0.
+
+        :return: Хеш многочлена.
+        """
+        if len(self.__coefficients) <= 1:
+            return hash(self.__coefficients[0]) if self.__coefficients else hash(0)
+        return hash(self.__coefficients)
+
+    def __reduce__(self):
+        """
+        Поддержка pickle: объект восстанавливается из коэффициентов.
+
+        :return: Кортеж (класс, аргументы конструктора).
+        """
+        return type(self), (self.__coefficients,)
+
+    def __str__(self) -> str:
+        """
+        Возвращает строковое представление многочлена, от старшей степени к младшей.
+
+        :return: Строка вида "1/2*x^2 + (1/1 + 2/1i)*x + 3/1".
+        """
+        terms = []
+        for i in range(len(self.__coefficients) - 1, -1, -1):
+            c = self.__coefficients[i]
+            if not c:
+                continue
+            text = f"({c})" if isinstance(c, Complex) else str(c)
+            if i:
+                text += "*x" if i == 1 else f"*x^{i}"
+            terms.append(text)
+        return " + ".join(terms) if terms else "0/1"
+
+    def __repr__(self) -> str:
+        """
+        Возвращает формальное строковое представление многочлена.
+
+        :return: Формальное строковое представление многочлена.
+        """
+        return f"Polynomial([{', '.join(repr(c) for c in self.__coefficients)}])"
@@ -1,15 +1,37 @@
-class Rational:
+import math
+import numbers
+import operator
+import sys
+from math import gcd
+
+_HASH_MODULUS = sys.hash_info.modulus
+_HASH_INF = sys.hash_info.inf
+
+
+class Rational(numbers.Rational):
     """
     Класс Rational представляет рациональные числа в виде дробей n/m.
     Поддерживает только целые числа (int) для числителя и знаменателя.
+
+    Реализует протокол numbers.Rational: работает со встроенными функциями (sum,
+    sorted, round, math.floor), с int, float и fractions.Fraction с обеих сторон
+    операции и может быть ключом словаря - хеш совпадает с хешем равных int и Fraction.
+
+    Объекты неизменяемы и хранят дробь всегда несократимой, со знаменателем больше нуля.
+    Атрибуты лежат в __slots__, без __dict__ на каждый объект. Арифметика сокращает
+    множители до перемножения (приёмы Хенричи и Кнута), поэтому результат уже
+    несократим и повторно не нормализуется, а целые операнды обрабатываются без
+    промежуточных объектов Rational.
     """
 
-    def __init__(self, n: int, m: int):
+    __slots__ = ("__numerator", "__denominator")
+
+    def __init__(self, n: int, m: int = 1):
         """
         Инициализирует объект Rational с числителем n и знаменателем m.
 
         :param n: Числитель рационального числа.
-        :param m: Знаменатель рационального числа.
+        :param m: Знаменатель рационального числа, по умолчанию 1.
         :raises TypeError: Если n или m не являются целыми числами.
         :raises ValueError: Если m равен нулю.
         """
@@ -19,28 +41,26 @@ class Rational:
             raise TypeError("Знаменатель должен быть целым числом (int)")
         if m == 0:
             raise ValueError("Знаменатель не может быть равен нулю")
-        self.__numerator = n
-        self.__denominator = m
-        self.__normalize()
+        # Сокращаем дробь и делаем знаменатель положительным
+        common_divisor = gcd(n, m)
+        if m < 0:
+            common_divisor = -common_divisor
+        self.__numerator = n // common_divisor
+        self.__denominator = m // common_divisor
 
-    def __normalize(self):
+    @classmethod
+    def _from_reduced(cls, n: int, m: int) -> 'Rational':
         """
-        Приводит дробь к нормализованному виду (сокращает дробь и делает знаменатель положительным).
-        """
-        # Находим наибольший общий делитель (НОД)
-        def gcd(a, b):
-            while b:
-                a, b = b, a % b
-            return a
-
-        common_divisor = gcd(abs(self.__numerator), abs(self.__denominator))
-        self.__numerator //= common_divisor
-        self.__denominator //= common_divisor
+        Создаёт Rational из уже несократимой дроби с положительным знаменателем, без проверок.
 
-        # Убедимся, что знаменатель положительный
-        if self.__denominator < 0:
-            self.__numerator *= -1
-            self.__denominator *= -1
+        :param n: Числитель.
+        :param m: Знаменатель, больше нуля и взаимно простой с n.
+        :return: Новое рациональное число.
+        """
+        result = object.__new__(cls)
+        result.__numerator = n
+        result.__denominator = m
+        return result
 
     @property
     def numerator(self) -> int:
@@ -51,19 +71,6 @@ class Rational:
         """
         return self.__numerator
 
-    @numerator.setter
-    def numerator(self, value: int):
-        """
-        Устанавливает числитель рационального числа.
-
-        :param value: Новое значение числителя (должно быть целым числом).
-        :raises TypeError: Если значение не является целым числом.
-        """
-        if not isinstance(value, int):
-            raise TypeError("Числитель должен быть целым числом (int)")
-        self.__numerator = value
-        self.__normalize()
-
     @property
     def denominator(self) -> int:
         """
@@ -73,21 +80,169 @@ class Rational:
         """
         return self.__denominator
 
-    @denominator.setter
-    def denominator(self, value: int):
+    @staticmethod
+    def _as_pair(value) -> tuple[int, int]:
         """
-        Устанавливает знаменатель рационального числа.
+        Возвращает числитель и знаменатель слагаемого или множителя sum и prod.
 
-        :param value: Новое значение знаменателя (должно быть целым числом).
-        :raises TypeError: Если значение не является целым числом.
-        :raises ValueError: Если значение равно нулю.
+        :param value: Целое число, Rational или другое рациональное число (fractions.Fraction).
+        :return: Кортеж (числитель, знаменатель).
+        :raises TypeError: Если value не является рациональным числом.
         """
-        if not isinstance(value, int):
-            raise TypeError("Знаменатель должен быть целым числом (int)")
-        if value == 0:
-            raise ValueError("Знаменатель не может быть равен нулю")
-        self.__denominator = value
-        self.__normalize()
+        if isinstance(value, int):
+            return value, 1
+        if isinstance(value, numbers.Rational):
+            return value.numerator, value.denominator
+        raise TypeError("Операнд должен быть целым числом или Rational")
+
+    @staticmethod
+    def _reduce_pairwise(values: list, operation) -> 'Rational':
+        """
+        Сворачивает непустой список попарно, деревом: соседние элементы объединяются,
+        пока не останется один. Операнды на каждом уровне сопоставимы по размеру, и
+        длинные числа появляются только на последних уровнях, а не на каждом шаге,
+        как при свёртке слева.
+
+        :param values: Список Rational.
+        :param operation: Функция операции из модуля operator.
+        :return: Результат свёртки.
+        """
+        while len(values) > 1:
+            merged = [operation(values[i], values[i + 1]) for i in range(0, len(values) - 1, 2)]
+            if len(values) % 2:
+                merged.append(values[-1])
+            values = merged
+        return values[0]
+
+    @staticmethod
+    def sum(values) -> 'Rational':
+        """
+        Точная сумма последовательности рациональных чисел.
+
+        Слагаемые с одинаковым знаменателем складываются как целые, одним числителем.
+        Получившиеся дроби суммируются попарно, деревом, через НОК знаменателей.
+        Так промежуточные числа растут медленнее, чем при r1 + r2 + ... слева направо,
+        а сокращение выполняется на каждом уровне, а не на каждом слагаемом.
+
+        :param values: Итерируемый объект из int, Rational или других рациональных чисел.
+        :return: Сумма, Rational(0, 1) для пустой последовательности.
+        :raises TypeError: Если среди слагаемых есть не рациональное число.
+        """
+        # Знаменатель, встреченный один раз, остаётся своим слагаемым (оно уже несократимо),
+        # повторные накапливают сумму числителей
+        singles, numerators = {}, {}
+        for value in values:
+            if not isinstance(value, Rational):
+                value = Rational(*Rational._as_pair(value))
+            m = value.__denominator
+            if m in numerators:
+                numerators[m] += value.__numerator
+            elif m in singles:
+                numerators[m] = singles.pop(m).__numerator + value.__numerator
+            else:
+                singles[m] = value
+        terms = list(singles.values())
+        for m, n in numerators.items():
+            g = gcd(n, m)
+            terms.append(Rational._from_reduced(n // g, m // g))
+        if not terms:
+            return Rational._from_reduced(0, 1)
+        return Rational._reduce_pairwise(terms, operator.add)
+
+    @staticmethod
+    def prod(values) -> 'Rational':
+        """
+        Точное произведение последовательности рациональных чисел.
+
+        Множители перемножаются попарно, деревом; каждое умножение заранее сокращает
+        перекрёстные множители, так что промежуточные дроби несократимы.
+
+        :param values: Итерируемый объект из int, Rational или других рациональных чисел.
+        :return: Произведение, Rational(1, 1) для пустой последовательности.
+        :raises TypeError: Если среди множителей есть не рациональное число.
+        """
+        factors = []
+        for value in values:
+            if not isinstance(value, Rational):
+                value = Rational(*Rational._as_pair(value))
+            factors.append(value)
+        if not factors:
+            return Rational._from_reduced(1, 1)
+        return Rational._reduce_pairwise(factors, operator.mul)
+
+    def _coerce(self, other) -> 'Rational | float | complex | None':
+        """
+        Приводит операнд другого типа к виду, с которым работает арифметика Rational.
+
+        :param other: Операнд, не являющийся int или Rational.
+        :return: Rational для прочих рациональных чисел (например, fractions.Fraction),
+            float или complex как есть, None для неподдерживаемых типов.
+        """
+        if isinstance(other, int):
+            return Rational._from_reduced(other, 1)
+        if isinstance(other, numbers.Rational):
+            return Rational(other.numerator, other.denominator)
+        if isinstance(other, (float, complex)):
+            return other
+        return None
+
+    def _mixed(self, other, operation, reflected: bool = False):
+        """
+        Выполняет операцию с операндом другого типа, как fractions.Fraction: с прочими
+        рациональными числами результат точный, с float и complex - приближённый.
+
+        :param other: Операнд.
+        :param operation: Функция операции из модуля operator.
+        :param reflected: True для отражённой операции (other слева).
+        :return: Результат операции или NotImplemented.
+        """
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        value = self
+        if isinstance(other, float):
+            value = float(self)
+        elif isinstance(other, complex):
+            value = complex(float(self))
+        return operation(other, value) if reflected else operation(value, other)
+
+    @staticmethod
+    def _add(na: int, da: int, nb: int, db: int) -> 'Rational':
+        """
+        Складывает несократимые дроби na/da и nb/db.
+
+        Если знаменатели взаимно просты, сумма уже несократима. Иначе общий делитель
+        знаменателей g сокращается заранее, и проверить остаётся только НОД
+        числителя с g (Кнут, 4.5.1).
+
+        :return: Несократимая сумма.
+        """
+        g = gcd(da, db)
+        if g == 1:
+            return Rational._from_reduced(na * db + da * nb, da * db)
+        s = db // g
+        t = na * s + nb * (da // g)
+        g2 = gcd(t, g)
+        if g2 == 1:
+            return Rational._from_reduced(t, da * s)
+        return Rational._from_reduced(t // g2, (da // g) * (db // g2))
+
+    @staticmethod
+    def _divide(na: int, da: int, nb: int, db: int) -> 'Rational':
+        """
+        Делит несократимую дробь na/da на несократимую дробь nb/db.
+
+        :return: Несократимое частное.
+        :raises ValueError: Если nb равен нулю.
+        """
+        if nb == 0:
+            raise ValueError("Деление на ноль")
+        g1 = gcd(na, nb)
+        g2 = gcd(db, da)
+        n, m = (na // g1) * (db // g2), (da // g2) * (nb // g1)
+        if m < 0:
+            n, m = -n, -m
+        return Rational._from_reduced(n, m)
 
     def __add__(self, other: 'Rational | int') -> 'Rational':
         """
@@ -95,16 +250,24 @@ class Rational:
 
         :param other: Другое рациональное число или целое число.
         :return: Новое рациональное число как результат сложения.
-        :raises TypeError: Если other не является целым числом или Rational.
         """
         if isinstance(other, int):
-            other = Rational(other, 1)
-        elif not isinstance(other, Rational):
-            raise TypeError("Операнд должен быть целым числом или Rational")
-        return Rational(
-            self.numerator * other.denominator + self.denominator * other.numerator,
-            self.denominator * other.denominator
-        )
+            # (a + k·b)/b несократима, раз несократима a/b
+            return Rational._from_reduced(self.__numerator + other * self.__denominator, self.__denominator)
+        if isinstance(other, Rational):
+            return self._add(self.__numerator, self.__denominator, other.__numerator, other.__denominator)
+        return self._mixed(other, operator.add)
+
+    def __radd__(self, other: int) -> 'Rational':
+        """
+        Складывает число слева с текущим рациональным числом (например, 3 + r или sum()).
+
+        :param other: Целое число или другое число.
+        :return: Результат сложения.
+        """
+        if isinstance(other, int):
+            return Rational._from_reduced(self.__numerator + other * self.__denominator, self.__denominator)
+        return self._mixed(other, operator.add, reflected=True)
 
     def __sub__(self, other: 'Rational | int') -> 'Rational':
         """
@@ -112,33 +275,57 @@ class Rational:
 
         :param other: Другое рациональное число или целое число.
         :return: Новое рациональное число как результат вычитания.
-        :raises TypeError: Если other не является целым числом или Rational.
         """
         if isinstance(other, int):
-            other = Rational(other, 1)
-        elif not isinstance(other, Rational):
-            raise TypeError("Операнд должен быть целым числом или Rational")
-        return Rational(
-            self.numerator * other.denominator - self.denominator * other.numerator,
-            self.denominator * other.denominator
-        )
+            return Rational._from_reduced(self.__numerator - other * self.__denominator, self.__denominator)
+        if isinstance(other, Rational):
+            return self._add(self.__numerator, self.__denominator, -other.__numerator, other.__denominator)
+        return self._mixed(other, operator.sub)
+
+    def __rsub__(self, other: int) -> 'Rational':
+        """
+        Вычитает текущее рациональное число из числа слева.
+
+        :param other: Целое число или другое число.
+        :return: Результат вычитания.
+        """
+        if isinstance(other, int):
+            return Rational._from_reduced(other * self.__denominator - self.__numerator, self.__denominator)
+        return self._mixed(other, operator.sub, reflected=True)
 
     def __mul__(self, other: 'Rational | int') -> 'Rational':
         """
         Умножает текущее рациональное число на другое рациональное число или целое число.
 
+        Перекрёстные множители сокращаются до умножения, поэтому произведение
+        несократимо и числа в нём не больше, чем нужно.
+
         :param other: Другое рациональное число или целое число.
         :return: Новое рациональное число как результат умножения.
-        :raises TypeError: Если other не является целым числом или Rational.
+        """
+        na, da = self.__numerator, self.__denominator
+        if isinstance(other, int):
+            if other == 0:
+                return Rational._from_reduced(0, 1)
+            g = gcd(other, da)
+            return Rational._from_reduced(na * (other // g), da // g)
+        if isinstance(other, Rational):
+            nb, db = other.__numerator, other.__denominator
+            g1 = gcd(na, db)
+            g2 = gcd(nb, da)
+            return Rational._from_reduced((na // g1) * (nb // g2), (da // g2) * (db // g1))
+        return self._mixed(other, operator.mul)
+
+    def __rmul__(self, other: int) -> 'Rational':
+        """
+        Умножает число слева на текущее рациональное число.
+
+        :param other: Целое число или другое число.
+        :return: Результат умножения.
         """
         if isinstance(other, int):
-            other = Rational(other, 1)
-        elif not isinstance(other, Rational):
-            raise TypeError("Операнд должен быть целым числом или Rational")
-        return Rational(
-            self.numerator * other.numerator,
-            self.denominator * other.denominator
-        )
+            return self.__mul__(other)
+        return self._mixed(other, operator.mul, reflected=True)
 
     def __truediv__(self, other: 'Rational | int') -> 'Rational':
         """
@@ -146,43 +333,353 @@ class Rational:
 
         :param other: Другое рациональное число или целое число.
         :return: Новое рациональное число как результат деления.
-        :raises TypeError: Если other не является целым числом или Rational.
         :raises ValueError: Если other равен нулю.
         """
         if isinstance(other, int):
-            other = Rational(other, 1)
-        elif not isinstance(other, Rational):
-            raise TypeError("Операнд должен быть целым числом или Rational")
-        if other.numerator == 0:
+            return self._divide(self.__numerator, self.__denominator, other, 1)
+        if isinstance(other, Rational):
+            return self._divide(self.__numerator, self.__denominator, other.__numerator, other.__denominator)
+        return self._mixed(other, operator.truediv)
+
+    def __rtruediv__(self, other: int) -> 'Rational':
+        """
+        Делит число слева на текущее рациональное число.
+
+        :param other: Целое число или другое число.
+        :return: Результат деления.
+        :raises ValueError: Если текущее число равно нулю.
+        """
+        if isinstance(other, int):
+            return self._divide(other, 1, self.__numerator, self.__denominator)
+        return self._mixed(other, operator.truediv, reflected=True)
+
+    def __floordiv__(self, other: 'Rational | int') -> int:
+        """
+        Целочисленное деление с округлением вниз.
+
+        :param other: Другое рациональное число или целое число.
+        :return: Целое частное.
+        :raises ValueError: Если other равен нулю.
+        """
+        if isinstance(other, (int, Rational)):
+            return self.__divmod__(other)[0]
+        return self._mixed(other, operator.floordiv)
+
+    def __rfloordiv__(self, other: int) -> int:
+        """
+        Целочисленное деление числа слева на текущее рациональное число.
+
+        :param other: Целое число или другое число.
+        :return: Целое частное.
+        :raises ValueError: Если текущее число равно нулю.
+        """
+        return self._mixed(other, operator.floordiv, reflected=True)
+
+    def __mod__(self, other: 'Rational | int') -> 'Rational':
+        """
+        Остаток от деления, со знаком делителя, как у int.
+
+        :param other: Другое рациональное число или целое число.
+        :return: Остаток.
+        :raises ValueError: Если other равен нулю.
+        """
+        if isinstance(other, (int, Rational)):
+            return self.__divmod__(other)[1]
+        return self._mixed(other, operator.mod)
+
+    def __rmod__(self, other: int) -> 'Rational':
+        """
+        Остаток от деления числа слева на текущее рациональное число.
+
+        :param other: Целое число или другое число.
+        :return: Остаток.
+        :raises ValueError: Если текущее число равно нулю.
+        """
+        return self._mixed(other, operator.mod, reflected=True)
+
+    def __divmod__(self, other: 'Rational | int') -> tuple[int, 'Rational']:
+        """
+        Частное и остаток за одно деление.
+
+        :param other: Другое рациональное число или целое число.
+        :return: Кортеж (целое частное, остаток).
+        :raises ValueError: Если other равен нулю.
+        """
+        if isinstance(other, int):
+            nb, db = other, 1
+        elif isinstance(other, Rational):
+            nb, db = other.__numerator, other.__denominator
+        else:
+            return self._mixed(other, divmod)
+        if nb == 0:
             raise ValueError("Деление на ноль")
-        return Rational(
-            self.numerator * other.denominator,
-            self.denominator * other.numerator
-        )
+        da = self.__denominator
+        quotient, remainder = divmod(self.__numerator * db, da * nb)
+        return quotient, Rational(remainder, da * db)
+
+    def __rdivmod__(self, other: int) -> tuple[int, 'Rational']:
+        """
+        Частное и остаток от деления числа слева на текущее рациональное число.
+
+        :param other: Целое число или другое число.
+        :return: Кортеж (целое частное, остаток).
+        :raises ValueError: Если текущее число равно нулю.
+        """
+        return self._mixed(other, divmod, reflected=True)
+
+    def __pow__(self, exponent: 'int | Rational') -> 'Rational | float':
+        """
+        Возводит текущее рациональное число в степень.
+
+        Целая степень (в том числе отрицательная) даёт точный Rational: степени взаимно
+        простых чисел взаимно просты, так что сокращать нечего. Дробная степень
+        вычисляется приближённо, во float.
+
+        :param exponent: Показатель степени.
+        :return: Rational для целого показателя, иначе float или complex.
+        :raises ValueError: Если ноль возводится в отрицательную степень.
+        """
+        if isinstance(exponent, Rational) and exponent.__denominator == 1:
+            exponent = exponent.__numerator
+        if isinstance(exponent, int):
+            n, m = self.__numerator, self.__denominator
+            if exponent >= 0:
+                return Rational._from_reduced(n ** exponent, m ** exponent)
+            if n == 0:
+                raise ValueError("Деление на ноль")
+            n, m = m ** -exponent, n ** -exponent
+            return Rational._from_reduced(-n, -m) if m < 0 else Rational._from_reduced(n, m)
+        if isinstance(exponent, numbers.Rational):
+            return float(self) ** float(exponent)
+        return self._mixed(exponent, operator.pow)
+
+    def __rpow__(self, base: int) -> 'Rational | float':
+        """
+        Возводит число слева в степень текущего рационального числа.
+
+        :param base: Основание степени.
+        :return: Rational для рационального основания и целого показателя, иначе float или complex.
+        """
+        if self.__denominator == 1 and isinstance(base, numbers.Rational):
+            return Rational(base.numerator, base.denominator) ** self.__numerator
+        if isinstance(base, numbers.Rational):
+            return float(base) ** float(self)
+        return self._mixed(base, operator.pow, reflected=True)
+
+    def __pos__(self) -> 'Rational':
+        """
+        Унарный плюс, возвращает само число (объект неизменяем).
+
+        :return: Текущее рациональное число.
+        """
+        return self
+
+    def __neg__(self) -> 'Rational':
+        """
+        Возвращает число с противоположным знаком.
+
+        :return: Новое рациональное число.
+        """
+        return Rational._from_reduced(-self.__numerator, self.__denominator)
+
+    def __abs__(self) -> 'Rational':
+        """
+        Возвращает модуль рационального числа.
+
+        :return: Новое рациональное число.
+        """
+        return self if self.__numerator >= 0 else self.__neg__()
+
+    def __trunc__(self) -> int:
+        """
+        Отбрасывает дробную часть (округление к нулю).
+
+        :return: Целое число.
+        """
+        n, m = self.__numerator, self.__denominator
+        return n // m if n >= 0 else -(-n // m)
+
+    __int__ = __trunc__
+
+    def __floor__(self) -> int:
+        """
+        Округление вниз (math.floor).
+
+        :return: Целое число.
+        """
+        return self.__numerator // self.__denominator
+
+    def __ceil__(self) -> int:
+        """
+        Округление вверх (math.ceil).
+
+        :return: Целое число.
+        """
+        return -(-self.__numerator // self.__denominator)
+
+    def __round__(self, ndigits: int | None = None) -> 'int | Rational':
+        """
+        Округление до ближайшего, половины - к чётному, как у fractions.Fraction.
+
+        :param ndigits: Количество знаков после запятой; None - до целого.
+        :return: int при ndigits=None, иначе Rational.
+        """
+        if ndigits is None:
+            floor, remainder = divmod(self.__numerator, self.__denominator)
+            if remainder * 2 < self.__denominator:
+                return floor
+            if remainder * 2 > self.__denominator:
+                return floor + 1
+            return floor if floor % 2 == 0 else floor + 1
+        shift = 10 ** abs(ndigits)
+        if ndigits > 0:
+            return Rational(round(self * shift), shift)
+        return Rational(round(self / shift) * shift, 1)
+
+    def __float__(self) -> float:
+        """
+        Преобразует рациональное число во float (с правильным округлением и для больших чисел).
+
+        :return: Ближайшее число float.
+        """
+        return self.__numerator / self.__denominator
+
+    def __bool__(self) -> bool:
+        """
+        Проверяет, что число не равно нулю.
+
+        :return: False для нуля, иначе True.
+        """
+        return self.__numerator != 0
+
+    def _compare(self, other, operation):
+        """
+        Сравнивает текущее число с другим без приведения к float.
+
+        :param other: Рациональное число, float или другое число.
+        :param operation: Функция сравнения из модуля operator.
+        :return: Результат сравнения или NotImplemented.
+        """
+        if isinstance(other, int):
+            return operation(self.__numerator, other * self.__denominator)
+        if isinstance(other, Rational):
+            return operation(self.__numerator * other.__denominator, other.__numerator * self.__denominator)
+        if isinstance(other, numbers.Rational):
+            return operation(self.__numerator * other.denominator, other.numerator * self.__denominator)
+        if isinstance(other, float):
+            if math.isinf(other) or math.isnan(other):
+                return operation(0.0, other)
+            return self._compare(Rational(*other.as_integer_ratio()), operation)
+        return NotImplemented
+
+    def __lt__(self, other: 'Rational | int | float') -> bool:
+        """
+        Проверяет, меньше ли текущее число другого.
+
+        :param other: Рациональное число, целое число или float.
+        :return: Результат сравнения.
+        """
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other: 'Rational | int | float') -> bool:
+        """
+        Проверяет, меньше ли текущее число другого или равно ему.
+
+        :param other: Рациональное число, целое число или float.
+        :return: Результат сравнения.
+        """
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other: 'Rational | int | float') -> bool:
+        """
+        Проверяет, больше ли текущее число другого.
+
+        :param other: Рациональное число, целое число или float.
+        :return: Результат сравнения.
+        """
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other: 'Rational | int | float') -> bool:
+        """
+        Проверяет, больше ли текущее число другого или равно ему.
+
+        :param other: Рациональное число, целое число или float.
+        :return: Результат сравнения.
+        """
+        return self._compare(other, operator.ge)
 
     def __eq__(self, other: 'Rational | int') -> bool:
         """
-        Проверяет, равно ли текущее рациональное число другому рациональному числу или целому числу.
+        Проверяет, равно ли текущее рациональное число другому числу.
 
-        :param other: Другое рациональное число или целое число.
-        :return: True, если равны, иначе False.
-        :raises TypeError: Если other не является целым числом или Rational.
+        :param other: Рациональное, целое, вещественное или комплексное число.
+        :return: True, если равны, иначе False; NotImplemented для прочих типов.
         """
+        # Обе дроби несократимы, поэтому равны только при равных числителях и знаменателях
         if isinstance(other, int):
-            other = Rational(other, 1)
-        elif not isinstance(other, Rational):
-            raise TypeError("Операнд должен быть целым числом или Rational")
-        return (self.numerator == other.numerator) and (self.denominator == other.denominator)
+            return self.__denominator == 1 and self.__numerator == other
+        if isinstance(other, Rational):
+            return self.__numerator == other.__numerator and self.__denominator == other.__denominator
+        if isinstance(other, numbers.Rational):
+            return self.__numerator == other.numerator and self.__denominator == other.denominator
+        if isinstance(other, complex) and other.imag == 0:
+            other = other.real
+        if isinstance(other, float):
+            return math.isfinite(other) and self == Rational(*other.as_integer_ratio())
+        return NotImplemented
 
     def __ne__(self, other: 'Rational | int') -> bool:
         """
-        Проверяет, не равно ли текущее рациональное число другому рациональному числу или целому числу.
+        Проверяет, не равно ли текущее рациональное число другому числу.
 
-        :param other: Другое рациональное число или целое число.
-        :return: True, если не равны, иначе False.
-        :raises TypeError: Если other не является целым числом или Rational.
+        :param other: Рациональное, целое, вещественное или комплексное число.
+        :return: True, если не равны, иначе False; NotImplemented для прочих типов.
+        """
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self) -> int:
+        """
+        Возвращает хеш, совпадающий с хешем равных int, float и fractions.Fraction.
+
+        :return: Хеш числа.
+        """
+        # Схема хеширования чисел Python: n * m^-1 по модулю простого sys.hash_info.modulus
+        try:
+            inverse = pow(self.__denominator, -1, _HASH_MODULUS)
+        except ValueError:
+            # Знаменатель кратен модулю: обратного нет, как у fractions.Fraction
+            result = _HASH_INF
+        else:
+            result = hash(hash(abs(self.__numerator)) * inverse)
+        if self.__numerator < 0:
+            result = -result
+        return -2 if result == -1 else result
+
+    def __reduce__(self):
+        """
+        Поддержка pickle: объект восстанавливается из числителя и знаменателя.
+
+        :return: Кортеж (класс, аргументы конструктора).
+        """
+        return type(self), (self.__numerator, self.__denominator)
+
+    def __copy__(self) -> 'Rational':
+        """
+        Копия неизменяемого объекта - он сам.
+
+        :return: Текущее рациональное число.
+        """
+        return self
+
+    def __deepcopy__(self, memo) -> 'Rational':
+        """
+        Глубокая копия неизменяемого объекта - он сам.
+
+        :param memo: Словарь уже скопированных объектов.
+        :return: Текущее рациональное число.
         """
-        return not self.__eq__(other)
+        return self
 
     def __str__(self) -> str:
         """
@@ -190,7 +687,7 @@ class Rational:
 
         :return: Строковое представление рационального числа.
         """
-        return f"{self.numerator}/{self.denominator}"
+        return f"{self.__numerator}/{self.__denominator}"
 
     def __repr__(self) -> str:
         """
@@ -198,4 +695,4 @@ class Rational:
 
         :return: Формальное строковое представление рационального числа.
         """
-        return f"Rational({self.numerator}, {self.denominator})"
+        return f"Rational({self.__numerator}, {self.__denominator})"
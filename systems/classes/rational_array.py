@@ -0,0 +1,611 @@
+import numpy as np
+
+from .rational import Rational
+
+# Арифметика идёт в int64, пока результаты в нём помещаются. Перед операцией её
+# результат оценивается во float64: оценка не больше 2**62 гарантирует, что точное
+# значение меньше 2**63 и при умножении не произойдёт молчаливого переполнения.
+# Иначе операция выполняется над массивами dtype=object из int Python, а результат,
+# если поместился, возвращается в int64.
+_SAFE = float(2 ** 62)
+_INT64_MIN = np.iinfo(np.int64).min
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+def _as_storage(values) -> np.ndarray:
+    """
+    Приводит целые значения к одномерному массиву int64, а не помещающиеся - к dtype=object.
+
+    :param values: Массив или последовательность целых чисел.
+    :return: Массив int64 или object.
+    :raises TypeError: Если значения не целые.
+    """
+    array = np.asarray(values)
+    if array.size == 0:
+        return np.zeros(array.shape, dtype=np.int64)
+    if not isinstance(values, np.ndarray) and array.dtype.kind in "fu":
+        # Для int Python за пределами int64 NumPy выводит float64 ([-1, 2**63]) или
+        # uint64: такие последовательности проверяются поэлементно, как dtype=object
+        array = np.array(values, dtype=object)
+    if array.dtype == object:
+        if not all(isinstance(value, (int, np.integer)) for value in array.flat):
+            raise TypeError("Числитель и знаменатель должны быть целыми числами (int)")
+        return _compact(np.array([int(value) for value in array.flat], dtype=object).reshape(array.shape))
+    if array.dtype.kind == "b":
+        return array.astype(np.int64)
+    if array.dtype.kind == "u":
+        if array.max() > _INT64_MAX:
+            return array.astype(object)
+        return array.astype(np.int64)
+    if array.dtype.kind != "i":
+        raise TypeError("Числитель и знаменатель должны быть целыми числами (int)")
+    array = array.astype(np.int64, copy=False)
+    # -2**63 не имеет противоположного в int64
+    if array.min() == _INT64_MIN:
+        return array.astype(object)
+    return array
+
+
+def _compact(array: np.ndarray) -> np.ndarray:
+    """
+    Возвращает массив dtype=object в int64, если все значения в нём помещаются.
+
+    :param array: Массив int64 или object.
+    :return: Массив int64 или исходный массив object.
+    """
+    if array.dtype != object or array.size == 0:
+        return array
+    if -_INT64_MAX <= min(array.flat) and max(array.flat) <= _INT64_MAX:
+        return array.astype(np.int64)
+    return array
+
+
+def _fits(*estimates: np.ndarray) -> bool:
+    """
+    Проверяет, что оценки модулей результатов во float64 не выходят за безопасный порог.
+
+    :param estimates: Массивы оценок.
+    :return: True, если операцию можно выполнить в int64.
+    """
+    return all(not np.any(estimate >= _SAFE) for estimate in estimates)
+
+
+def _magnitude(array: np.ndarray) -> np.ndarray:
+    """
+    Модули значений int64 во float64, для оценки результатов.
+
+    :param array: Массив int64.
+    :return: Массив float64.
+    """
+    return np.abs(array.astype(np.float64))
+
+
+def _add(a, b, c, d, checked: bool):
+    """
+    Складывает массивы несократимых дробей a/b и c/d (приём Кнута, как в Rational).
+
+    :param checked: True для int64, тогда при риске переполнения возвращается None.
+    :return: Кортеж (числители, знаменатели) несократимой суммы или None.
+    """
+    g = np.gcd(b, d)
+    s = d // g
+    t = b // g
+    if checked and not _fits(_magnitude(a) * s + _magnitude(c) * t, b.astype(np.float64) * s):
+        return None
+    n = a * s + c * t
+    m = b * s
+    g2 = np.gcd(n, g)
+    return n // g2, m // g2
+
+
+def _sub(a, b, c, d, checked: bool):
+    """
+    Вычитает массив несократимых дробей c/d из a/b.
+
+    :param checked: True для int64, тогда при риске переполнения возвращается None.
+    :return: Кортеж (числители, знаменатели) несократимой разности или None.
+    """
+    return _add(a, b, -c, d, checked)
+
+
+def _mul(a, b, c, d, checked: bool):
+    """
+    Перемножает массивы несократимых дробей a/b и c/d, сокращая перекрёстные множители заранее.
+
+    :param checked: True для int64, тогда при риске переполнения возвращается None.
+    :return: Кортеж (числители, знаменатели) несократимого произведения или None.
+    """
+    g1 = np.gcd(a, d)
+    g2 = np.gcd(c, b)
+    a, d = a // g1, d // g1
+    c, b = c // g2, b // g2
+    if checked and not _fits(_magnitude(a) * _magnitude(c), b.astype(np.float64) * d):
+        return None
+    return a * c, b * d
+
+
+def _div(a, b, c, d, checked: bool):
+    """
+    Делит массив несократимых дробей a/b на c/d, где все c не равны нулю.
+
+    :param checked: True для int64, тогда при риске переполнения возвращается None.
+    :return: Кортеж (числители, знаменатели) несократимого частного или None.
+    """
+    negative = c < 0
+    c = np.where(negative, -c, c)
+    d = np.where(negative, -d, d)
+    return _mul(a, b, d, c, checked)
+
+
+def _cross(a, b, c, d, checked: bool):
+    """
+    Перекрёстные произведения a·d и c·b для сравнения дробей a/b и c/d.
+
+    :param checked: True для int64, тогда при риске переполнения возвращается None.
+    :return: Кортеж (a·d, c·b) или None.
+    """
+    if checked and not _fits(_magnitude(a) * d, _magnitude(c) * b):
+        return None
+    return a * d, c * b
+
+
+class RationalArray:
+    """
+    Класс RationalArray - одномерный массив рациональных чисел, хранящийся как два
+    непрерывных массива NumPy: числители и знаменатели.
+
+    Дроби всегда несократимы, знаменатели больше нуля, массивы неизменяемы. Операции
+    (+, -, *, /, сравнения, sum, prod) выполняются над массивами целиком, без
+    объектов Rational на каждый элемент. Пока значения помещаются в int64, работа
+    идёт на скорости NumPy. Если результат может переполнить int64, операция
+    обнаруживает это заранее и выполняется над dtype=object (точные int Python).
+    Результат возвращается в int64, как только снова помещается.
+    """
+
+    __slots__ = ("__numerators", "__denominators")
+
+    # NumPy-операнд слева (np.int64(2) + array, ndarray < array) иначе превратил бы
+    # массив в ndarray из Rational; так NumPy возвращает NotImplemented и Python
+    # вызывает отражённый оператор RationalArray.
+    __array_ufunc__ = None
+
+    def __init__(self, numerators, denominators=None):
+        """
+        Инициализирует массив из целых числителей и знаменателей и сокращает дроби.
+
+        :param numerators: Одномерная последовательность или массив целых числителей.
+        :param denominators: Знаменатели той же длины; по умолчанию все равны 1.
+        :raises TypeError: Если значения не целые.
+        :raises ValueError: Если массивы не одномерные, разной длины или есть нулевой знаменатель.
+        """
+        n = _as_storage(numerators)
+        d = np.ones(n.shape, dtype=np.int64) if denominators is None else _as_storage(denominators)
+        if n.ndim != 1 or d.ndim != 1:
+            raise ValueError("RationalArray должен быть одномерным")
+        if n.shape != d.shape:
+            raise ValueError("Числители и знаменатели должны быть одной длины")
+        if np.any(d == 0):
+            raise ValueError("Знаменатель не может быть равен нулю")
+        if n.dtype != d.dtype:
+            n, d = n.astype(object), d.astype(object)
+        g = np.gcd(n, d)
+        g = np.where(d < 0, -g, g)
+        self.__set(n // g, d // g)
+
+    def __set(self, n: np.ndarray, d: np.ndarray):
+        """
+        Сохраняет несократимые числители и знаменатели, закрывая массивы от записи.
+
+        :param n: Числители.
+        :param d: Знаменатели.
+        """
+        n, d = _compact(n), _compact(d)
+        if n.dtype != d.dtype:
+            n, d = n.astype(object), d.astype(object)
+        n.flags.writeable = False
+        d.flags.writeable = False
+        self.__numerators = n
+        self.__denominators = d
+
+    @classmethod
+    def _from_reduced(cls, n: np.ndarray, d: np.ndarray) -> 'RationalArray':
+        """
+        Создаёт массив из уже несократимых дробей с положительными знаменателями, без проверок.
+
+        :param n: Числители.
+        :param d: Знаменатели.
+        :return: Новый RationalArray.
+        """
+        result = object.__new__(cls)
+        result.__set(np.asarray(n), np.asarray(d))
+        return result
+
+    @classmethod
+    def from_rationals(cls, values) -> 'RationalArray':
+        """
+        Создаёт массив из последовательности Rational, int или других рациональных чисел.
+
+        :param values: Итерируемый объект из рациональных чисел.
+        :return: Новый RationalArray.
+        :raises TypeError: Если среди значений есть не рациональное число.
+        """
+        pairs = [Rational._as_pair(value) for value in values]
+        if not pairs:
+            return cls([])
+        numerators, denominators = zip(*pairs)
+        return cls(list(numerators), list(denominators))
+
+    def to_rationals(self) -> list[Rational]:
+        """
+        Возвращает элементы массива списком Rational.
+
+        :return: Список Rational.
+        """
+        return [
+            Rational._from_reduced(n, d)
+            for n, d in zip(self.__numerators.tolist(), self.__denominators.tolist())
+        ]
+
+    def to_float(self) -> np.ndarray:
+        """
+        Возвращает приближённые значения массивом float64.
+
+        :return: Массив float64.
+        """
+        if self.__numerators.dtype == object:
+            # Деление int Python правильно округляет и для очень больших чисел
+            return (self.__numerators / self.__denominators).astype(np.float64)
+        return self.__numerators / self.__denominators
+
+    @property
+    def numerators(self) -> np.ndarray:
+        """
+        Возвращает числители (массив только для чтения).
+
+        :return: Массив int64 или object.
+        """
+        return self.__numerators
+
+    @property
+    def denominators(self) -> np.ndarray:
+        """
+        Возвращает знаменатели (массив только для чтения).
+
+        :return: Массив int64 или object.
+        """
+        return self.__denominators
+
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        Возвращает тип хранения: int64 или object для чисел, не помещающихся в int64.
+
+        :return: dtype массивов.
+        """
+        return self.__numerators.dtype
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество элементов.
+
+        :return: Длина массива.
+        """
+        return len(self.__numerators)
+
+    def __iter__(self):
+        """
+        Перебирает элементы как Rational.
+
+        :return: Итератор по Rational.
+        """
+        return iter(self.to_rationals())
+
+    def __getitem__(self, index) -> 'Rational | RationalArray':
+        """
+        Возвращает элемент (Rational) по целому индексу или RationalArray по срезу или маске.
+
+        :param index: Индекс, срез, массив индексов или булева маска.
+        :return: Rational или RationalArray.
+        """
+        n, d = self.__numerators[index], self.__denominators[index]
+        if np.ndim(n) == 0:
+            return Rational._from_reduced(int(n), int(d))
+        return RationalArray._from_reduced(n, d)
+
+    def _operand(self, other):
+        """
+        Возвращает числители и знаменатели другого операнда; скаляр транслируется на весь массив.
+
+        :param other: RationalArray, Rational, int или другое рациональное число.
+        :return: Кортеж массивов (числители, знаменатели) или None для неподдерживаемых типов.
+        """
+        if isinstance(other, RationalArray):
+            return other.__numerators, other.__denominators
+        if isinstance(other, np.integer):
+            other = int(other)
+        try:
+            n, d = Rational._as_pair(other)
+        except TypeError:
+            return None
+        return _as_storage(n), _as_storage(d)
+
+    def _apply(self, kernel, a, b, c, d):
+        """
+        Выполняет операцию в int64, а при риске переполнения - над dtype=object.
+
+        :param kernel: Функция операции (_add, _mul, _div, _cross).
+        :return: Результат функции операции.
+        """
+        if a.dtype == object or c.dtype == object:
+            return kernel(a.astype(object), b.astype(object), c.astype(object), d.astype(object), checked=False)
+        result = kernel(a, b, c, d, checked=True)
+        if result is None:
+            return kernel(a.astype(object), b.astype(object), c.astype(object), d.astype(object), checked=False)
+        return result
+
+    def _binary(self, other, kernel, reflected: bool = False):
+        """
+        Выполняет арифметическую операцию с другим массивом или скаляром.
+
+        :param other: Другой операнд.
+        :param kernel: Функция операции.
+        :param reflected: True, если other стоит слева.
+        :return: Новый RationalArray или NotImplemented.
+        """
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        left, right = (self.__numerators, self.__denominators), operand
+        if reflected:
+            left, right = right, left
+        if kernel is _div and np.any(right[0] == 0):
+            raise ValueError("Деление на ноль")
+        n, d = self._apply(kernel, *left, *right)
+        return RationalArray._from_reduced(n, d)
+
+    def __add__(self, other) -> 'RationalArray':
+        """
+        Поэлементное сложение с массивом или числом.
+
+        :param other: RationalArray, Rational или int.
+        :return: Новый RationalArray.
+        """
+        return self._binary(other, _add)
+
+    def __radd__(self, other) -> 'RationalArray':
+        """
+        Поэлементное сложение числа слева с массивом.
+
+        :param other: Rational или int.
+        :return: Новый RationalArray.
+        """
+        return self._binary(other, _add, reflected=True)
+
+    def __sub__(self, other) -> 'RationalArray':
+        """
+        Поэлементное вычитание массива или числа.
+
+        :param other: RationalArray, Rational или int.
+        :return: Новый RationalArray.
+        """
+        return self._binary(other, _sub)
+
+    def __rsub__(self, other) -> 'RationalArray':
+        """
+        Поэлементное вычитание массива из числа слева.
+
+        :param other: Rational или int.
+        :return: Новый RationalArray.
+        """
+        return self._binary(other, _sub, reflected=True)
+
+    def __mul__(self, other) -> 'RationalArray':
+        """
+        Поэлементное умножение на массив или число.
+
+        :param other: RationalArray, Rational или int.
+        :return: Новый RationalArray.
+        """
+        return self._binary(other, _mul)
+
+    def __rmul__(self, other) -> 'RationalArray':
+        """
+        Поэлементное умножение числа слева на массив.
+
+        :param other: Rational или int.
+        :return: Новый RationalArray.
+        """
+        return self._binary(other, _mul, reflected=True)
+
+    def __truediv__(self, other) -> 'RationalArray':
+        """
+        Поэлементное деление на массив или число.
+
+        :param other: RationalArray, Rational или int.
+        :return: Новый RationalArray.
+        :raises ValueError: Если среди делителей есть ноль.
+        """
+        return self._binary(other, _div)
+
+    def __rtruediv__(self, other) -> 'RationalArray':
+        """
+        Поэлементное деление числа слева на элементы массива.
+
+        :param other: Rational или int.
+        :return: Новый RationalArray.
+        :raises ValueError: Если среди элементов массива есть ноль.
+        """
+        return self._binary(other, _div, reflected=True)
+
+    def __neg__(self) -> 'RationalArray':
+        """
+        Возвращает массив с противоположными знаками.
+
+        :return: Новый RationalArray.
+        """
+        return RationalArray._from_reduced(-self.__numerators, self.__denominators)
+
+    def __pos__(self) -> 'RationalArray':
+        """
+        Унарный плюс, возвращает сам массив (он неизменяем).
+
+        :return: Текущий RationalArray.
+        """
+        return self
+
+    def __abs__(self) -> 'RationalArray':
+        """
+        Возвращает массив модулей.
+
+        :return: Новый RationalArray.
+        """
+        return RationalArray._from_reduced(np.abs(self.__numerators), self.__denominators)
+
+    def _compare(self, other, operation):
+        """
+        Поэлементное сравнение через перекрёстные произведения, без перевода во float.
+
+        :param other: Другой операнд.
+        :param operation: Функция сравнения NumPy (np.less и т. п.).
+        :return: Булев массив или NotImplemented.
+        """
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        left, right = self._apply(_cross, self.__numerators, self.__denominators, *operand)
+        return np.asarray(operation(left, right), dtype=bool)
+
+    def __lt__(self, other) -> np.ndarray:
+        """
+        Поэлементно проверяет, меньше ли элементы другого операнда.
+
+        :param other: RationalArray, Rational или int.
+        :return: Булев массив.
+        """
+        return self._compare(other, np.less)
+
+    def __le__(self, other) -> np.ndarray:
+        """
+        Поэлементно проверяет, меньше ли элементы другого операнда или равны ему.
+
+        :param other: RationalArray, Rational или int.
+        :return: Булев массив.
+        """
+        return self._compare(other, np.less_equal)
+
+    def __gt__(self, other) -> np.ndarray:
+        """
+        Поэлементно проверяет, больше ли элементы другого операнда.
+
+        :param other: RationalArray, Rational или int.
+        :return: Булев массив.
+        """
+        return self._compare(other, np.greater)
+
+    def __ge__(self, other) -> np.ndarray:
+        """
+        Поэлементно проверяет, больше ли элементы другого операнда или равны ему.
+
+        :param other: RationalArray, Rational или int.
+        :return: Булев массив.
+        """
+        return self._compare(other, np.greater_equal)
+
+    def __eq__(self, other) -> np.ndarray:
+        """
+        Поэлементное равенство: дроби несократимы, поэтому сравниваются числители и знаменатели.
+
+        :param other: RationalArray, Rational или int.
+        :return: Булев массив.
+        """
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        return np.asarray((self.__numerators == operand[0]) & (self.__denominators == operand[1]), dtype=bool)
+
+    def __ne__(self, other) -> np.ndarray:
+        """
+        Поэлементное неравенство.
+
+        :param other: RationalArray, Rational или int.
+        :return: Булев массив.
+        """
+        result = self.__eq__(other)
+        return result if result is NotImplemented else ~result
+
+    __hash__ = None
+
+    @staticmethod
+    def _reduce_pairwise(n: np.ndarray, d: np.ndarray, kernel) -> Rational:
+        """
+        Сворачивает дроби деревом, как Rational.sum: на каждом уровне соседние пары
+        объединяются одной векторной операцией, пока не останется одна дробь.
+
+        :param n: Непустой массив числителей.
+        :param d: Массив знаменателей.
+        :param kernel: Функция операции (_add или _mul).
+        :return: Результат свёртки.
+        """
+        while len(n) > 1:
+            half = len(n) // 2 * 2
+            checked = n.dtype != object
+            result = kernel(n[0:half:2], d[0:half:2], n[1:half:2], d[1:half:2], checked=checked)
+            if result is None:
+                n, d = n.astype(object), d.astype(object)
+                continue
+            merged_n, merged_d = result
+            if half < len(n):
+                merged_n = np.concatenate([merged_n, n[half:]])
+                merged_d = np.concatenate([merged_d, d[half:]])
+            n, d = merged_n, merged_d
+        return Rational._from_reduced(int(n[0]), int(d[0]))
+
+    def sum(self) -> Rational:
+        """
+        Точная сумма элементов.
+
+        Числители с одинаковым знаменателем складываются одной операцией NumPy,
+        получившиеся дроби суммируются деревом через НОК знаменателей.
+
+        :return: Сумма, Rational(0, 1) для пустого массива.
+        """
+        n, d = self.__numerators, self.__denominators
+        if len(n) == 0:
+            return Rational._from_reduced(0, 1)
+        order = np.argsort(d, kind="stable")
+        n, d = n[order], d[order]
+        starts = np.flatnonzero(np.concatenate([[True], d[1:] != d[:-1]]))
+        if n.dtype != object and _magnitude(n).sum() >= _SAFE:
+            n = n.astype(object)
+        n, d = np.add.reduceat(n, starts), d[starts]
+        g = np.gcd(n, d)
+        return self._reduce_pairwise(n // g, d // g, _add)
+
+    def prod(self) -> Rational:
+        """
+        Точное произведение элементов, деревом с сокращением перекрёстных множителей.
+
+        :return: Произведение, Rational(1, 1) для пустого массива.
+        """
+        n, d = self.__numerators, self.__denominators
+        if len(n) == 0:
+            return Rational._from_reduced(1, 1)
+        if np.any(n == 0):
+            return Rational._from_reduced(0, 1)
+        return self._reduce_pairwise(n, d, _mul)
+
+    def __str__(self) -> str:
+        """
+        Возвращает строковое представление массива.
+
+        :return: Строковое представление массива.
+        """
+        return "[" + ", ".join(str(value) for value in self.to_rationals()) + "]"
+
+    def __repr__(self) -> str:
+        """
+        Возвращает формальное строковое представление массива.
+
+        :return: Формальное строковое представление массива.
+        """
+        return f"RationalArray({self.__numerators.tolist()}, {self.__denominators.tolist()})"
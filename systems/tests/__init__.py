@@ -1,7 +1,13 @@
+from .complex_array_tests import TestComplexArray
 from .complex_tests import TestComplex
-from .reational_tests import TestRational
+from .polynomial_tests import TestPolynomial
+from .rational_array_tests import TestRationalArray
+from .rational_tests import TestRational
 
 __all__ = [
     "TestComplex",
-    "TestRational"
+    "TestComplexArray",
+    "TestPolynomial",
+    "TestRational",
+    "TestRationalArray"
 ]
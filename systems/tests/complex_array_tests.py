@@ -0,0 +1,107 @@
+import math
+import unittest
+
+import numpy as np
+
+from classes.complex import Complex
+from classes.complex_array import ComplexArray
+from classes.rational import Rational
+from classes.rational_array import RationalArray
+
+
+class TestComplexArray(unittest.TestCase):
+    def setUp(self):
+        # Точный массив из (1/2 + 1i), (-3 + 2/3i), (0 + -1i)
+        self.values = [Complex(Rational(1, 2), 1), Complex(-3, Rational(2, 3)), Complex(0, -1)]
+        self.exact = ComplexArray.from_complexes(self.values)
+
+    def test_initialization(self):
+        # Точный режим из частей или из Complex, быстрый - из массива NumPy
+        array = ComplexArray(RationalArray([1, 2], [2, 1]), RationalArray([3, 4]))
+        self.assertTrue(array.is_exact)
+        self.assertEqual(array[0], Complex(Rational(1, 2), 3))
+        self.assertEqual(ComplexArray([1, 2])[1], Complex(2, 0))
+        self.assertEqual(self.exact.to_complexes(), self.values)
+        self.assertEqual(list(self.exact), self.values)
+        self.assertEqual(len(self.exact), 3)
+
+        fast = ComplexArray.from_numpy([1 + 2j, 3])
+        self.assertFalse(fast.is_exact)
+        self.assertEqual(fast[1], 3 + 0j)
+        self.assertEqual(fast.real.tolist(), [1.0, 3.0])
+
+        with self.assertRaises(ValueError):
+            ComplexArray([1, 2], [1])
+        with self.assertRaises(ValueError):
+            ComplexArray.from_numpy([[1j]])
+
+    def test_exact_arithmetic(self):
+        # Результаты совпадают с поэлементной арифметикой Complex
+        other = [Complex(2, -1), Complex(Rational(1, 3), 1), Complex(5, Rational(1, 2))]
+        array = ComplexArray.from_complexes(other)
+        for operation in (lambda a, b: a + b, lambda a, b: a - b, lambda a, b: a * b, lambda a, b: a / b):
+            self.assertEqual(
+                operation(self.exact, array).to_complexes(),
+                [operation(a, b) for a, b in zip(self.values, other)]
+            )
+
+        # Скаляры с обеих сторон
+        self.assertEqual((self.exact * Complex(0, 1)).to_complexes(), [value * Complex(0, 1) for value in self.values])
+        self.assertEqual((self.exact / 2).to_complexes(), [value / 2 for value in self.values])
+        self.assertEqual((1 + self.exact)[1], Complex(-2, Rational(2, 3)))
+        self.assertEqual((1 - self.exact)[0], Complex(Rational(1, 2), -1))
+        self.assertEqual((2 * self.exact)[1], Complex(-6, Rational(4, 3)))
+        self.assertEqual((1 / self.exact)[2], Complex(0, 1))
+        self.assertEqual((np.int64(2) * self.exact).to_complexes(), (2 * self.exact).to_complexes())
+        self.assertEqual((-self.exact)[0], Complex(Rational(-1, 2), -1))
+        self.assertEqual(self.exact.conjugate()[1], Complex(-3, Rational(-2, 3)))
+        self.assertEqual(self.exact.abs2().to_rationals(), [Rational(5, 4), Rational(85, 9), Rational(1, 1)])
+        self.assertEqual(self.exact.sum(), Complex(Rational(-5, 2), Rational(2, 3)))
+        self.assertEqual((self.exact == Complex(0, -1)).tolist(), [False, False, True])
+
+        # Деление на ноль
+        with self.assertRaises(ZeroDivisionError):
+            self.exact / ComplexArray([1, 0, 2])
+        with self.assertRaises(ZeroDivisionError):
+            self.exact / 0
+
+    def test_fast_arithmetic(self):
+        # Быстрый режим совпадает с complex128
+        values = np.array([0.5 + 1j, -3 + 2 / 3 * 1j, -1j])
+        fast = ComplexArray.from_numpy(values)
+        np.testing.assert_allclose((fast * fast).to_numpy(), values * values)
+        np.testing.assert_allclose((fast / (2 + 1j)).to_numpy(), values / (2 + 1j))
+        np.testing.assert_allclose((1.5 - fast).to_numpy(), 1.5 - values)
+        np.testing.assert_allclose((np.complex128(1j) * fast).to_numpy(), 1j * values)
+        np.testing.assert_allclose((fast * Complex(1, 2)).to_numpy(), values * (1 + 2j))
+        np.testing.assert_allclose(fast.abs2(), np.abs(values) ** 2)
+        self.assertAlmostEqual(fast.sum(), values.sum())
+        with self.assertRaises(ZeroDivisionError):
+            fast / ComplexArray.from_numpy([1, 0, 1])
+
+    def test_modes_are_converted_explicitly(self):
+        # Операции между режимами запрещены, перевод в точный режим не теряет точности
+        fast = self.exact.to_fast()
+        with self.assertRaises(TypeError):
+            self.exact + fast
+        with self.assertRaises(TypeError):
+            self.exact * 0.5
+        np.testing.assert_allclose(fast.to_numpy(), [0.5 + 1j, -3 + 2 / 3 * 1j, -1j])
+        self.assertIs(self.exact.to_exact(), self.exact)
+        self.assertIs(fast.to_fast(), fast)
+
+        exact = ComplexArray.from_numpy([0.1 + 0.25j, 1e-300, 3e300]).to_exact()
+        self.assertEqual(exact[0].real, Rational(*(0.1).as_integer_ratio()))
+        self.assertEqual(exact[0].imaginary, Rational(1, 4))
+        self.assertEqual(exact.to_fast().to_numpy().tolist(), [0.1 + 0.25j, 1e-300, 3e300])
+        with self.assertRaises(ValueError):
+            ComplexArray.from_numpy([float("inf")]).to_exact()
+
+    def test_polar_form(self):
+        # Модули, аргументы и полярная форма - массивы, как у Complex для каждого элемента
+        for array in (self.exact, self.exact.to_fast()):
+            module, arg = array.polar_form()
+            np.testing.assert_allclose(module, [value.module() for value in self.values])
+            np.testing.assert_allclose(arg, [value.arg() for value in self.values])
+            np.testing.assert_allclose(array.module(), module)
+            self.assertAlmostEqual(arg[2], -math.pi / 2)
@@ -1,5 +1,7 @@
-import unittest
+import copy
 import math
+import pickle
+import unittest
 from classes.complex import Complex
 from classes.rational import Rational
 
@@ -147,3 +149,68 @@ class TestComplex(unittest.TestCase):
 
         with self.assertRaises(ZeroDivisionError):
             c1 / 0
+
+    def test_immutability(self):
+        # Части нельзя переписать, новых атрибутов не добавить
+        c1 = Complex(1, 2)
+        with self.assertRaises(AttributeError):
+            c1.real = 5
+        with self.assertRaises(AttributeError):
+            c1.extra = 1
+        self.assertIs(copy.copy(c1), c1)
+        self.assertIs(copy.deepcopy(c1), c1)
+        self.assertEqual(pickle.loads(pickle.dumps(c1)), c1)
+        self.assertEqual(Complex(c1), c1)
+
+    def test_reflected_operations(self):
+        # Целые числа и Rational слева от комплексного числа
+        c1 = Complex(1, 2)
+        self.assertEqual(3 + c1, Complex(4, 2))
+        self.assertEqual(3 - c1, Complex(2, -2))
+        self.assertEqual(Rational(1, 2) * c1, Complex(Rational(1, 2), 1))
+        self.assertEqual(5 / c1, Complex(1, -2))
+        self.assertEqual(Rational(1, 2) / Complex(2, 0), Complex(Rational(1, 4), 0))
+        with self.assertRaises(ZeroDivisionError):
+            1 / Complex(0, 0)
+
+        # Неподдерживаемые типы
+        with self.assertRaises(TypeError):
+            c1 + 1.5
+        with self.assertRaises(TypeError):
+            "1" * c1
+        self.assertNotEqual(c1, "1 + 2i")
+
+    def test_unary_and_helpers(self):
+        # Противоположное, сопряжённое, квадрат модуля и fma
+        c1 = Complex(Rational(1, 2), -3)
+        self.assertEqual(-c1, Complex(Rational(-1, 2), 3))
+        self.assertIs(+c1, c1)
+        self.assertEqual(c1.conjugate(), Complex(Rational(1, 2), 3))
+        self.assertEqual(c1.abs2(), Rational(37, 4))
+        self.assertEqual(c1.fma(Complex(3, 4), Complex(1, 1)), c1 * Complex(3, 4) + Complex(1, 1))
+        self.assertEqual(c1.fma(2, Rational(1, 3)), c1 * 2 + Rational(1, 3))
+        with self.assertRaises(TypeError):
+            c1.fma(2, 0.5)
+        self.assertFalse(Complex(0, 0))
+        self.assertTrue(Complex(0, 1))
+
+    def test_power(self):
+        # Целые степени, в том числе отрицательные и нулевая
+        c1 = Complex(1, 1)
+        self.assertEqual(c1 ** 2, Complex(0, 2))
+        self.assertEqual(c1 ** 8, Complex(16, 0))
+        self.assertEqual(c1 ** 0, Complex(1, 0))
+        self.assertEqual(c1 ** -2, Complex(0, Rational(-1, 2)))
+        self.assertEqual(c1 ** Rational(3, 1), c1 * c1 * c1)
+        self.assertEqual(Complex(0, 0) ** 0, Complex(1, 0))
+        with self.assertRaises(ZeroDivisionError):
+            Complex(0, 0) ** -1
+        with self.assertRaises(TypeError):
+            c1 ** Rational(1, 2)
+
+    def test_hash(self):
+        # Равные числа имеют равный хеш, в том числе с int и Rational
+        self.assertEqual(hash(Complex(3, 0)), hash(3))
+        self.assertEqual(hash(Complex(Rational(1, 2), 0)), hash(Rational(1, 2)))
+        self.assertEqual(hash(Complex(Rational(2, 4), 1)), hash(Complex(Rational(1, 2), 1)))
+        self.assertEqual(len({Complex(1, 2), Complex(Rational(2, 2), 2), Complex(2, 1)}), 2)
@@ -0,0 +1,143 @@
+import pickle
+import random
+import unittest
+
+import numpy as np
+
+from classes.complex import Complex
+from classes.complex_array import ComplexArray
+from classes.polynomial import Polynomial, _karatsuba, _schoolbook
+from classes.rational import Rational
+from classes.rational_array import RationalArray
+
+
+def naive(polynomial, point):
+    # Вычисление по членам, для сравнения со схемой Горнера
+    result = Rational(0)
+    power = Rational(1)
+    for c in polynomial.coefficients:
+        result = c * power + result
+        power = power * point
+    return result
+
+
+class TestPolynomial(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(0)
+
+        def fraction():
+            return Rational(rng.randint(-9, 9), rng.randint(1, 9))
+
+        self.real = Polynomial([fraction() for _ in range(50)])
+        self.other = Polynomial([fraction() for _ in range(40)])
+        self.complex = Polynomial([Complex(fraction(), fraction()) for _ in range(45)])
+
+    def test_initialization(self):
+        # Старшие нули отбрасываются, целые становятся Rational
+        p = Polynomial([1, Rational(1, 2), 0, Complex(0, 0)])
+        self.assertEqual(p.coefficients, (Rational(1, 1), Rational(1, 2)))
+        self.assertEqual(p.degree, 1)
+        self.assertEqual(Polynomial([]).degree, -1)
+        self.assertFalse(Polynomial([0, 0]))
+        self.assertEqual(Polynomial([Complex(2, 0)]).coefficients, (Rational(2, 1),))
+        self.assertEqual(str(Polynomial([Rational(1, 2), Complex(1, 2), 3])), "3/1*x^2 + (1/1 + 2/1i)*x + 1/2")
+        self.assertEqual(repr(Polynomial([1, 2])), "Polynomial([Rational(1, 1), Rational(2, 1)])")
+        self.assertEqual(pickle.loads(pickle.dumps(self.complex)), self.complex)
+        self.assertEqual(hash(Polynomial([1, Complex(2, 0)])), hash(Polynomial([1, 2])))
+
+        # Константы равны своим числам и должны находиться по ним в dict и set
+        for number in (5, Rational(1, 2), Complex(1, 2), 0):
+            self.assertEqual(Polynomial([number]), number)
+            self.assertEqual(hash(Polynomial([number])), hash(number))
+        self.assertEqual({5: "five"}.get(Polynomial([5])), "five")
+        self.assertIn(Polynomial([]), {0})
+        with self.assertRaises(TypeError):
+            Polynomial([0.5])
+
+    def test_evaluation(self):
+        # Горнер совпадает с вычислением по членам
+        for point in (Rational(3, 7), Rational(-5, 2), 4, 0):
+            self.assertEqual(self.real(point), naive(self.real, point))
+        point = Complex(Rational(1, 3), 2)
+        self.assertEqual(self.complex(point), naive(self.complex, point))
+        self.assertEqual(self.complex(Rational(1, 2)), naive(self.complex, Rational(1, 2)))
+        self.assertEqual(Polynomial([])(Rational(1, 2)), Rational(0))
+        self.assertEqual(Polynomial([])(Complex(1, 1)), Complex(0, 0))
+        with self.assertRaises(TypeError):
+            self.real("x")
+
+    def test_batched_evaluation(self):
+        # Массивы точек вычисляются поэлементно и точно
+        points = RationalArray([1, -2, 3], [2, 3, 4])
+        self.assertEqual(self.real(points).to_rationals(), [self.real(x) for x in points.to_rationals()])
+        self.assertEqual(self.complex(points).to_complexes(), [self.complex(x) for x in points.to_rationals()])
+        self.assertEqual(Polynomial([5])(points).to_rationals(), [Rational(5)] * 3)
+
+        # Низкая степень считается целиком в int64, высокая - по точкам в целых числах
+        p = Polynomial([1, Rational(1, 2), Rational(-1, 3)])
+        self.assertEqual(p(points).dtype, np.int64)
+        self.assertEqual(p(points).to_rationals(), [p(x) for x in points.to_rationals()])
+
+        points = ComplexArray.from_complexes([Complex(1, 2), Complex(Rational(1, 2), -1)])
+        self.assertEqual(self.complex(points).to_complexes(), [self.complex(x) for x in points.to_complexes()])
+
+        # numpy.ndarray и быстрый ComplexArray - приближённо
+        p = Polynomial([1, Rational(1, 2), Rational(-1, 3)])
+        np.testing.assert_allclose(p(np.array([0.5, 2.0])), [float(p(Rational(1, 2))), float(p(2))])
+        np.testing.assert_allclose(p(points.to_fast()).to_numpy(), p(points).to_fast().to_numpy())
+
+    def test_addition_and_multiplication(self):
+        # Сумма и произведение проверяются значениями в нескольких точках
+        points = [Rational(1, 2), Rational(-5, 3), 7, Complex(Rational(1, 3), 2)]
+        for a, b in ((self.real, self.other), (self.real, self.complex), (self.complex, self.complex)):
+            for point in points:
+                self.assertEqual((a + b)(point), a(point) + b(point))
+                self.assertEqual((a - b)(point), a(point) - b(point))
+                self.assertEqual((a * b)(point), a(point) * b(point))
+            self.assertEqual((a * b).degree, a.degree + b.degree)
+
+        # Числа с обеих сторон
+        p = Polynomial([1, 2])
+        self.assertEqual(p + 1, Polynomial([2, 2]))
+        self.assertEqual(1 - p, Polynomial([0, -2]))
+        self.assertEqual(Rational(1, 2) * p, Polynomial([Rational(1, 2), 1]))
+        self.assertEqual(p * Complex(0, 1), Polynomial([Complex(0, 1), Complex(0, 2)]))
+        self.assertEqual(-p, Polynomial([-1, -2]))
+        self.assertEqual(p * Polynomial([]), Polynomial([]))
+        self.assertEqual(p - p, Polynomial([]))
+
+    def test_karatsuba(self):
+        # Умножение по Карацубе совпадает с умножением в столбик при любых длинах
+        rng = random.Random(1)
+        for la, lb in ((1, 1), (40, 40), (100, 33), (33, 100), (200, 7), (129, 90)):
+            a = [rng.randint(-99, 99) for _ in range(la)]
+            b = [rng.randint(-99, 99) for _ in range(lb)]
+            self.assertEqual(_karatsuba(a, b), _schoolbook(a, b))
+
+    def test_division(self):
+        # Деление с остатком: a = q * b + r, степень r меньше степени b
+        for a, b in ((self.real, self.other), (self.complex, self.real), (self.other, self.real)):
+            q, r = divmod(a, b)
+            self.assertEqual(q * b + r, a)
+            self.assertLess(r.degree, b.degree)
+            self.assertEqual(a // b, q)
+            self.assertEqual(a % b, r)
+        self.assertEqual(divmod(Polynomial([-1, 0, 1]), Polynomial([1, 1])), (Polynomial([-1, 1]), Polynomial([])))
+        self.assertEqual(self.real // 2, self.real * Rational(1, 2))
+        with self.assertRaises(ZeroDivisionError):
+            divmod(self.real, Polynomial([]))
+
+    def test_gcd_and_derivative(self):
+        # НОД приведённый и содержит общий множитель
+        common = Polynomial([Rational(1, 2), 1]) * Polynomial([-3, 0, 1])
+        a, b = self.real * common, self.other * common * common
+        self.assertEqual(a.gcd(b), (self.real.gcd(self.other * common) * common).monic())
+        self.assertEqual(Polynomial([-1, 0, 1]).gcd(Polynomial([1, 1])), Polynomial([1, 1]))
+        self.assertEqual(Polynomial([2, 4]).gcd(Polynomial([])), Polynomial([Rational(1, 2), 1]))
+        self.assertEqual(Polynomial([]).gcd(Polynomial([])), Polynomial([]))
+        with self.assertRaises(TypeError):
+            self.real.gcd(2)
+
+        # Производная
+        self.assertEqual(Polynomial([5, Rational(1, 2), 3, Complex(0, 1)]).derivative(), Polynomial([Rational(1, 2), 6, Complex(0, 3)]))
+        self.assertEqual(Polynomial([5]).derivative(), Polynomial([]))
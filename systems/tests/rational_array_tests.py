@@ -0,0 +1,145 @@
+import unittest
+from fractions import Fraction
+
+import numpy as np
+
+from classes.rational import Rational
+from classes.rational_array import RationalArray
+
+
+class TestRationalArray(unittest.TestCase):
+    def assertFractions(self, array, expected):
+        # Сравнение с fractions.Fraction по числителям и знаменателям
+        self.assertEqual(
+            [(value.numerator, value.denominator) for value in array.to_rationals()],
+            [(value.numerator, value.denominator) for value in expected]
+        )
+
+    def test_initialization(self):
+        # Дроби сокращаются, знаменатель положительный
+        array = RationalArray([6, -3, 0, 5], [8, -4, 7, 1])
+        self.assertEqual(array.numerators.tolist(), [3, 3, 0, 5])
+        self.assertEqual(array.denominators.tolist(), [4, 4, 1, 1])
+        self.assertEqual(array.dtype, np.int64)
+        self.assertEqual(len(RationalArray([1, 2, 3])), 3)
+
+        # Нулевой знаменатель, нецелые значения и неодномерные массивы
+        with self.assertRaises(ValueError):
+            RationalArray([1, 2], [1, 0])
+        with self.assertRaises(TypeError):
+            RationalArray([1.5])
+        with self.assertRaises(ValueError):
+            RationalArray([[1, 2]])
+        with self.assertRaises(ValueError):
+            RationalArray([1, 2], [1])
+
+    def test_conversion(self):
+        # Преобразование в список Rational и обратно
+        values = [Rational(1, 2), Rational(-2, 3), 4, Fraction(5, 6)]
+        array = RationalArray.from_rationals(values)
+        self.assertEqual(array.to_rationals(), [Rational(1, 2), Rational(-2, 3), Rational(4, 1), Rational(5, 6)])
+        self.assertEqual(list(array), array.to_rationals())
+        self.assertEqual(array[1], Rational(-2, 3))
+        self.assertIsInstance(array[1].numerator, int)
+        self.assertEqual(array[1:3].to_rationals(), [Rational(-2, 3), Rational(4, 1)])
+        np.testing.assert_allclose(array.to_float(), [0.5, -2 / 3, 4.0, 5 / 6])
+        self.assertEqual(len(RationalArray.from_rationals([])), 0)
+        self.assertEqual(str(RationalArray([1, 2], [2, 1])), "[1/2, 2/1]")
+        self.assertEqual(repr(RationalArray([1, 2], [2, 1])), "RationalArray([1, 2], [2, 1])")
+
+    def test_immutability(self):
+        # Массивы числителей и знаменателей закрыты от записи
+        array = RationalArray([1, 2], [3, 5])
+        with self.assertRaises(ValueError):
+            array.numerators[0] = 7
+        with self.assertRaises(AttributeError):
+            array.extra = 1
+
+    def test_arithmetic(self):
+        # Поэлементные операции совпадают с fractions.Fraction
+        a = [Fraction(1, 2), Fraction(-3, 4), Fraction(5, 6), Fraction(0, 1)]
+        b = [Fraction(1, 3), Fraction(3, 8), Fraction(-5, 12), Fraction(7, 2)]
+        x, y = RationalArray.from_rationals(a), RationalArray.from_rationals(b)
+        self.assertFractions(x + y, [p + q for p, q in zip(a, b)])
+        self.assertFractions(x - y, [p - q for p, q in zip(a, b)])
+        self.assertFractions(x * y, [p * q for p, q in zip(a, b)])
+        self.assertFractions(x / y, [p / q for p, q in zip(a, b)])
+        self.assertFractions(-x, [-p for p in a])
+        self.assertFractions(abs(x), [abs(p) for p in a])
+
+        # Скаляры с обеих сторон
+        self.assertFractions(x + 1, [p + 1 for p in a])
+        self.assertFractions(x * Rational(2, 3), [p * Fraction(2, 3) for p in a])
+        self.assertFractions(1 - x, [1 - p for p in a])
+        self.assertFractions(Fraction(1, 2) / y, [Fraction(1, 2) / q for q in b])
+        self.assertFractions(x * np.int64(3), [p * 3 for p in a])
+        self.assertFractions(np.int64(2) + x, [2 + p for p in a])
+        self.assertFractions(np.int64(2) * x, [2 * p for p in a])
+        np.testing.assert_array_equal(np.int64(0) < x, [p > 0 for p in a])
+
+        # Деление на ноль и неподдерживаемые типы
+        with self.assertRaises(ValueError):
+            y / x
+        with self.assertRaises(ValueError):
+            x / 0
+        with self.assertRaises(TypeError):
+            x + 0.5
+
+    def test_comparison(self):
+        # Сравнения поэлементные и точные
+        x = RationalArray([1, 1, 2], [3, 2, 3])
+        y = RationalArray([2, 1, 1], [6, 3, 2])
+        self.assertEqual((x == y).tolist(), [True, False, False])
+        self.assertEqual((x != y).tolist(), [False, True, True])
+        self.assertEqual((x < y).tolist(), [False, False, False])
+        self.assertEqual((x > y).tolist(), [False, True, True])
+        self.assertEqual((x <= Rational(1, 2)).tolist(), [True, True, False])
+        self.assertEqual((x >= 1).tolist(), [False, False, False])
+
+    def test_overflow_fallback(self):
+        # Результаты, не помещающиеся в int64, считаются точно через dtype=object
+        big = 2 ** 40 + 1
+        x = RationalArray([big, 1], [big + 2, 3])
+        y = RationalArray([big + 4, 1], [big + 6, 5])
+        expected = [Fraction(big, big + 2) * Fraction(big + 4, big + 6), Fraction(1, 15)]
+        product = x * y
+        self.assertEqual(product.dtype, object)
+        self.assertFractions(product, expected)
+        self.assertFractions(x + y, [Fraction(big, big + 2) + Fraction(big + 4, big + 6), Fraction(8, 15)])
+        self.assertEqual((x < y).tolist(), [True, False])
+
+        # Результат, который снова помещается, возвращается в int64
+        self.assertEqual((product / y).dtype, np.int64)
+        self.assertFractions(product / y, [Fraction(big, big + 2), Fraction(1, 3)])
+
+        # Значения больше int64 на входе
+        huge = RationalArray([2 ** 70, 1], [3, 2 ** 64])
+        self.assertEqual(huge.dtype, object)
+        self.assertEqual(huge[0], Rational(2 ** 70, 3))
+        self.assertFractions(huge * 3, [Fraction(2 ** 70), Fraction(3, 2 ** 64)])
+
+        # Разные знаки: NumPy вывел бы для такого списка float64
+        mixed = RationalArray([-1, 2 ** 63])
+        self.assertEqual(mixed.dtype, object)
+        self.assertFractions(mixed, [Fraction(-1), Fraction(2 ** 63)])
+        self.assertFractions(RationalArray.from_rationals([Rational(-1), Rational(2 ** 63, 3)]),
+                             [Fraction(-1), Fraction(2 ** 63, 3)])
+        with self.assertRaises(TypeError):
+            RationalArray([1, 0.5])
+
+    def test_sum_and_prod(self):
+        # Суммы и произведения точные, в том числе когда промежуточные значения выходят за int64
+        values = [Fraction(1, k) for k in range(1, 300)]
+        array = RationalArray.from_rationals(values)
+        self.assertEqual(array.sum(), sum(values))
+        self.assertEqual(RationalArray([1, 2, 3], [4, 4, 4]).sum(), Rational(3, 2))
+        self.assertEqual(RationalArray([2 ** 62, 2 ** 62], [1, 1]).sum(), 2 ** 63)
+
+        expected = Fraction(1)
+        for value in values:
+            expected *= value + 1
+        self.assertEqual((array + 1).prod(), expected)
+        self.assertEqual(RationalArray([1, 0, 3]).prod(), 0)
+
+        self.assertEqual(RationalArray([]).sum(), 0)
+        self.assertEqual(RationalArray([]).prod(), 1)
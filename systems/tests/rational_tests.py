@@ -1,3 +1,4 @@
+import math
 import unittest
 from classes.rational import Rational
 
@@ -187,3 +188,161 @@ class TestRational(unittest.TestCase):
         r1 = Rational(2, 4 * 10**18)
         self.assertEqual(r1.numerator, 1)
         self.assertEqual(r1.denominator, 2 * 10**18)
+
+    def test_immutability(self):
+        # Числитель и знаменатель доступны только для чтения, __dict__ нет
+        r1 = Rational(1, 2)
+        with self.assertRaises(AttributeError):
+            r1.numerator = 3
+        with self.assertRaises(AttributeError):
+            r1.denominator = 3
+        with self.assertRaises(AttributeError):
+            r1.extra = 1
+        self.assertFalse(hasattr(r1, "__dict__"))
+
+    def test_results_are_reduced(self):
+        # Результаты сравниваются с fractions.Fraction, включая отрицательные и нулевые операнды
+        from fractions import Fraction
+        values = [(0, 1), (1, 2), (-3, 4), (5, 6), (7, -12), (10, 4), (-9, 15)]
+        for a, b in values:
+            for c, d in values:
+                x, y = Rational(a, b), Rational(c, d)
+                fx, fy = Fraction(a, b), Fraction(c, d)
+                expected = [fx + fy, fx - fy, fx * fy] + ([fx / fy] if c else [])
+                results = [x + y, x - y, x * y] + ([x / y] if c else [])
+                for result, fraction in zip(results, expected):
+                    self.assertEqual((result.numerator, result.denominator),
+                                     (fraction.numerator, fraction.denominator))
+                for k in (-4, 0, 3):
+                    self.assertEqual(((x * k).numerator, (x * k).denominator),
+                                     ((fx * k).numerator, (fx * k).denominator))
+                    self.assertEqual(((x + k).numerator, (x + k).denominator),
+                                     ((fx + k).numerator, (fx + k).denominator))
+                    if k:
+                        self.assertEqual(((x / k).numerator, (x / k).denominator),
+                                         ((fx / k).numerator, (fx / k).denominator))
+
+    def test_hash_matches_int_and_fraction(self):
+        # Равные числа должны иметь равные хеши, чтобы быть одним ключом словаря
+        import sys
+        from fractions import Fraction
+        self.assertEqual(hash(Rational(4, 2)), hash(2))
+        self.assertEqual(hash(Rational(-1, 1)), hash(-1))
+        self.assertEqual(hash(Rational(1, 2)), hash(0.5))
+        modulus = sys.hash_info.modulus
+        for n, m in [(1, 3), (-7, 12), (10**30, 3**40), (1, modulus), (-5, 2 * modulus)]:
+            self.assertEqual(hash(Rational(n, m)), hash(Fraction(n, m)))
+        self.assertEqual(len({Rational(1, 2), Rational(2, 4), Fraction(1, 2), 0.5}), 1)
+        self.assertEqual({Rational(3, 1): "три"}[3], "три")
+
+    def test_reflected_operators(self):
+        # Целое число слева от Rational
+        r = Rational(3, 4)
+        self.assertEqual(3 + r, Rational(15, 4))
+        self.assertEqual(1 - r, Rational(1, 4))
+        self.assertEqual(2 * r, Rational(3, 2))
+        self.assertEqual(3 / r, 4)
+        with self.assertRaises(ValueError):
+            1 / Rational(0, 1)
+        self.assertEqual(sum([Rational(1, 2), Rational(1, 3), Rational(1, 6)]), 1)
+
+    def test_mixed_types(self):
+        # С Fraction результат точный, с float и complex - как у Fraction
+        from fractions import Fraction
+        r = Rational(1, 2)
+        self.assertEqual(r + Fraction(1, 3), Rational(5, 6))
+        self.assertIsInstance(Fraction(1, 3) + r, Rational)
+        self.assertEqual(r + 0.25, 0.75)
+        self.assertIsInstance(r * 1.0, float)
+        self.assertEqual(r + 1j, 0.5 + 1j)
+        self.assertEqual(r, 0.5)
+        self.assertNotEqual(Rational(1, 3), 1 / 3)
+        self.assertNotEqual(r, "1/2")
+        self.assertNotIn(r, [None, "x"])
+        with self.assertRaises(TypeError):
+            r + "1"
+
+    def test_ordering(self):
+        # Сравнения точные, без перевода в float
+        values = [Rational(1, 2), Rational(-1, 3), 2, Rational(7, 3), 0.4]
+        self.assertEqual(sorted(values), [Rational(-1, 3), 0.4, Rational(1, 2), 2, Rational(7, 3)])
+        self.assertTrue(Rational(1, 3) < Rational(1, 2) <= Rational(2, 4))
+        self.assertTrue(Rational(10**20 + 1, 10**20) > 1)
+        # float 1/3 чуть меньше точной 1/3
+        self.assertTrue(Rational(1, 3) > 1 / 3)
+        self.assertTrue(Rational(-10**9) > float("-inf"))
+        self.assertEqual(max(Rational(5, 2), 2), Rational(5, 2))
+
+    def test_unary_and_rounding(self):
+        # Унарные операции, округления и преобразования
+        r = Rational(-7, 2)
+        self.assertEqual(-r, Rational(7, 2))
+        self.assertEqual(abs(r), Rational(7, 2))
+        self.assertIs(+r, r)
+        self.assertEqual((math.floor(r), math.ceil(r), math.trunc(r), int(r)), (-4, -3, -3, -3))
+        self.assertEqual((round(Rational(5, 2)), round(Rational(7, 2)), round(r)), (2, 4, -4))
+        self.assertEqual(round(Rational(12345, 1000), 2), Rational(1234, 100))
+        self.assertEqual(round(Rational(12345, 1), -2), 12300)
+        self.assertEqual(float(Rational(1, 3)), 1 / 3)
+        self.assertEqual(float(Rational(10**400, 10**399)), 10.0)
+        self.assertFalse(Rational(0, 5))
+        self.assertTrue(Rational(1, 5))
+
+    def test_power_and_floor_division(self):
+        # Целые степени точные, дробные - во float
+        self.assertEqual(Rational(2, 3) ** 3, Rational(8, 27))
+        self.assertEqual(Rational(-2, 3) ** -3, Rational(-27, 8))
+        self.assertEqual(Rational(4, 9) ** Rational(2, 1), Rational(16, 81))
+        self.assertAlmostEqual(Rational(1, 4) ** Rational(1, 2), 0.5)
+        self.assertEqual(2 ** Rational(3, 1), 8)
+        with self.assertRaises(ValueError):
+            Rational(0, 1) ** -1
+        self.assertEqual(Rational(7, 2) // Rational(2, 3), 5)
+        self.assertEqual(Rational(7, 2) % Rational(2, 3), Rational(1, 6))
+        self.assertEqual(divmod(Rational(-7, 2), 2), (-2, Rational(1, 2)))
+        self.assertEqual(5 // Rational(3, 2), 3)
+        self.assertEqual(5 % Rational(3, 2), Rational(1, 2))
+        with self.assertRaises(ValueError):
+            Rational(1, 2) // 0
+
+    def test_numbers_protocol(self):
+        # Rational - полноценный numbers.Rational, копируется и сериализуется
+        import copy
+        import numbers
+        import pickle
+        r = Rational(3, 4)
+        self.assertIsInstance(r, numbers.Rational)
+        self.assertEqual(Rational(5), Rational(5, 1))
+        self.assertEqual((r.real, r.imag, r.conjugate()), (r, 0, r))
+        self.assertEqual(complex(r), 0.75 + 0j)
+        self.assertEqual(pickle.loads(pickle.dumps(r)), r)
+        self.assertIs(copy.copy(r), r)
+
+    def test_sum_and_prod(self):
+        # Rational.sum и Rational.prod совпадают со свёрткой слева и с fractions.Fraction
+        from fractions import Fraction
+        harmonic = [Rational(1, k) for k in range(1, 200)]
+        expected = sum(Fraction(1, k) for k in range(1, 200))
+        result = Rational.sum(harmonic)
+        self.assertEqual((result.numerator, result.denominator), (expected.numerator, expected.denominator))
+
+        # Общие знаменатели, сокращение после накопления числителей, смешанные типы
+        self.assertEqual(Rational.sum([Rational(1, 4), Rational(1, 4), Rational(1, 2), 1, Fraction(1, 3)]), Rational(7, 3))
+        self.assertEqual(Rational.sum([Rational(1, 6), Rational(-1, 6)]), 0)
+        self.assertEqual(Rational.sum(Rational(k, 10) for k in range(10)), Rational(9, 2))
+
+        factors = [Rational(k * k + 1, k * k) for k in range(1, 50)]
+        expected = 1
+        for k in range(1, 50):
+            expected *= Fraction(k * k + 1, k * k)
+        result = Rational.prod(factors)
+        self.assertEqual((result.numerator, result.denominator), (expected.numerator, expected.denominator))
+        self.assertEqual(Rational.prod([2, Rational(1, 2), Fraction(3, 4), Rational(-4, 3)]), -1)
+
+        # Пустые последовательности и неподдерживаемые типы
+        self.assertEqual(Rational.sum([]), 0)
+        self.assertEqual(Rational.prod(iter([])), 1)
+        with self.assertRaises(TypeError):
+            Rational.sum([Rational(1, 2), 0.5])
+        with self.assertRaises(TypeError):
+            Rational.prod(["2"])